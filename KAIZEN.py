@@ -1,8 +1,17 @@
 import src.SCC.scc_read
 import src.SCC.scc_check
 import src.SCC.scc_tables
+import src.SCC.scc_analyze
+import src.SCC.scc_ingest
+import src.SCC.scc_cache
+import src.SCC.scc_checks
+import src.SCC.scc_probe
 from src.utils import file_operations
+from src.utils import progress_json
+from src.utils import progress_sections
+from src.utils import progress_store
 import argparse
+import functools
 import os
 import json
 import shutil
@@ -10,33 +19,25 @@ import sys
 import subprocess
 import re
 import docx
-from datetime import datetime
 from src.Tenable import api_client
 from src.Tenable import report_operations
 
-def read_json(filename): #needed for opening progress.json
-    with open(filename, 'r') as file:
-        return json.load(file)
+def read_json(filename): #needed for opening progress.json, served from the shared progress store
+    return progress_store.get_store(filename).data
 
 def write_not_gathered_file(output_filename='Not_gathered.txt'): # obsolete/deprecated
-    progress_data = read_json('progress.json')
-    all_bper_dict = progress_data.get('BPERs', {})
-    all_doc_dict = progress_data.get('Documents', {})
-    all_attestation_dict = progress_data.get('Attestations', {})
+    store = progress_store.get_store('progress.json')
     
     not_gathered_info = {}
 
-    for data_dict in [all_attestation_dict, all_bper_dict, all_doc_dict]:
-        for key, entries in data_dict.items():
-            for value in entries:
-                # Check for 'Gathered' being blank or 'TLA' being True in all_bper_dict
-                if value.get('Gathered') == '' or (value.get('TLA') == True and data_dict is all_bper_dict):
-                    scc_name = value['SCC']
-                    if scc_name not in not_gathered_info:
-                        not_gathered_info[scc_name] = []
-                    detail = value.get('Attestation num', '') or value.get('BPER name', '') or value.get('Doc name', '')
-                    if detail:
-                        not_gathered_info[scc_name].append(detail)
+    # Gathered blank, plus every TLA BPER
+    for section, key, value in store.blank_gathered_or_tla():
+        scc_name = value['SCC']
+        if scc_name not in not_gathered_info:
+            not_gathered_info[scc_name] = []
+        detail = value.get('Attestation num', '') or value.get('BPER name', '') or value.get('Doc name', '')
+        if detail:
+            not_gathered_info[scc_name].append(detail)
 
     # Write to the output file
     with open(output_filename, 'w') as output_file:
@@ -46,11 +47,15 @@ def write_not_gathered_file(output_filename='Not_gathered.txt'): # obsolete/depr
                 output_file.write(f"\t{detail}\n")
             output_file.write("\n")
 
-def update_dict(all_dict, new_entries): # check the dictionary to make sure any value being added is unique
+def update_dict(all_dict, new_entries): # check the dictionary to make sure any value being added is unique, one entry per (item, SCC)
     for key, value in new_entries.items():
-        if key not in all_dict:
-            all_dict[key] = []
-        all_dict[key].append(value)
+        entries = all_dict.setdefault(key, [])
+        for entry in entries: # one entry per SCC under an item, so this is a short list
+            if entry.get('SCC') == value.get('SCC'):
+                entry.update(value) # same SCC read again (another version of it), merged like ProgressStore.upsert_entry
+                break
+        else:
+            entries.append(value)
 
 def replace_text_in_docx(doc_path, replacements): #supports filling in some of the templates
     doc = docx.Document(doc_path)
@@ -71,12 +76,12 @@ def create_directories(project_dir):
     progress_file_path = os.path.join(project_dir, 'progress.json')
 
     try:
-        with open(progress_file_path, 'r') as file:
-            progress_data = json.load(file)
-            scc_dict = progress_data.get('SCC', {})
-            attestation_dict = progress_data.get('Attestations', {})
-            project_settings = progress_data.get('Program Settings', {})
-            project_directory = project_settings.get('Project Directory', project_dir)
+        store = progress_store.get_store(progress_file_path)
+        scc_dict = store.sccs
+        by_scc = store.by_scc # attestations grouped by SCC
+        checks = store.checks
+        project_settings = store.settings
+        project_directory = project_settings.get('Project Directory', project_dir)
     except (IOError, json.JSONDecodeError) as e:
         print(f"Failed to read or parse the progress.json file: {e}")
         return
@@ -100,7 +105,7 @@ def create_directories(project_dir):
                 standard_subdirs = ["Exceptions and Deviations", "Supporting Documents"]
                 
                 # Check if there are attestations for this SCC
-                has_attestations = any(att_info.get('SCC') == scc_name for att_list in attestation_dict.values() for att_info in (att_list if isinstance(att_list, list) else [att_list]))
+                has_attestations = by_scc.has_entries('Attestations', scc_name)
                 
                 if has_attestations:
                     standard_subdirs.append("Attestations")
@@ -114,11 +119,10 @@ def create_directories(project_dir):
                     print(f"Created standard subdirectory: {subdir_path}")
 
                 # Create evidence-specific subdirectories
-                evidence_methods = details.get('Evidence Methods', [])
+                evidence_methods = checks.methods_for(sanitized_scc_name)
                 manual_subdirs = set()
 
                 for method in evidence_methods:
-                    method = method.lower()
                     if "automated" in method:
                         automated_path = os.path.join(main_dir_path, "Automated")
                         os.makedirs(automated_path, exist_ok=True)
@@ -160,35 +164,27 @@ def create_directories(project_dir):
 
     # Save the updated progress data to progress.json
     try:
-        with open(progress_file_path, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        store.changed(progress_store.SCC)
         print("Updated progress.json with directory build status")
     except IOError as e:
         print(f"Failed to write updated progress data: {e}")
 
     print("Directory creation process completed.")
 
-def build_templates(method_dict, project_dir, template_dir):
+def build_templates(checks, project_dir, template_dir): # checks is a scc_checks.ChecksTable; each SCC's evidence methods come from its method index
     print("Building templates...")
-    
-    # Group STIG IDs by SCC
-    scc_groups = {}
-    for stig_id, details in method_dict.items():
-        scc_name = details['SCC']
-        sanitized_scc_name = re.sub(r'_\d{2}$', '', scc_name).strip()
-        if sanitized_scc_name not in scc_groups:
-            scc_groups[sanitized_scc_name] = []
-        scc_groups[sanitized_scc_name].append((stig_id, details))
 
-    for sanitized_scc_name, stig_items in scc_groups.items():
+    for scc_name in checks.sccs():
+        sanitized_scc_name = re.sub(r'_\d{2}$', '', scc_name).strip()
         print(f"Processing templates for SCC: {sanitized_scc_name}")
         main_dir_path = os.path.join(project_dir, sanitized_scc_name)
         
         # Check for different types of checks
-        has_manual_document = any(details['Evidence method'].lower() == 'manual-document' for _, details in stig_items)
-        has_automated = any('automated' in details['Evidence method'].lower() for _, details in stig_items)
-        has_manual = any('manual' in details['Evidence method'].lower() for _, details in stig_items)
-        manual_screenshot_stig_ids = [stig_id for stig_id, details in stig_items if details['Evidence method'].lower() == 'manual-screenshot']
+        evidence_methods = checks.methods_for(scc_name)
+        has_manual_document = 'manual-document' in evidence_methods
+        has_automated = any('automated' in method for method in evidence_methods)
+        has_manual = any('manual' in method for method in evidence_methods)
+        manual_screenshot_stig_ids = checks.stig_ids_for(scc_name, 'manual-screenshot')
 
         # Teamname-Document_Evidence
         if has_manual_document:
@@ -246,19 +242,9 @@ def build_templates(method_dict, project_dir, template_dir):
 
     print("Template building completed.")
 
-def convert_datetime_to_string(obj): # converts datetime values to string because it pitches a fit if not done
-    if isinstance(obj, dict):
-        return {key: convert_datetime_to_string(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_datetime_to_string(item) for item in obj]
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
-    return obj
-
-def save_master_dicts(data, filename): # save the dictionaries after converting the values to string
-    converted_data = convert_datetime_to_string(data)
+def save_master_dicts(data, filename): # save the dictionaries, datetimes and records are written by the encoder (no converted copy)
     with open(filename, 'w') as file:
-        json.dump(converted_data, file, indent=4)
+        progress_json.dump(data, file)
 
 # TODO remove below function and replace with a copy_sccs_to_folders
 def move_sccs_to_folders(project_dir, file_extensions): # moves the scc's into their respetive directories ****NOT USED IN GUI, NEEDS TO COPY INSTEAD****
@@ -280,54 +266,49 @@ def move_sccs_to_folders(project_dir, file_extensions): # moves the scc's into t
             else:
                 print(f"Destination folder not found for {file}, expected at {dest_folder_path}")
 
-def build_progress_json(directory_path, project_dir):
+def build_progress_json(directory_path, project_dir, workers=None, engine='streaming'):
     #Master dictionaries
     all_bper_dict = {}
     all_doc_dict = {}
     all_attestation_dict = {}
     scc_data_dict = {}
-    checks_data_dict = {}
-
-    #Loop for all excel files in directory
-    for file in os.listdir(directory_path):
-        if file.endswith('.xlsx') or file.endswith('.xls'):
-            file_path = os.path.join(directory_path, file)
-
-            #This creates the dictionaries using src.SCC.scc_read (bper, docs, atts, controls)
-            bper_dict, doc_dict, attestation_dict, method_dict = src.SCC.scc_read.process_excel_file(file_path)
-
-            #This creates the scc_info dictionary (first page check, etc)
-            scc_info = src.SCC.scc_check.process_scc_file(file_path)
-
-            #stores in master dict
-            update_dict(all_bper_dict, bper_dict)
-            update_dict(all_attestation_dict, attestation_dict)
-            update_dict(all_doc_dict, doc_dict)
-
-            # Update scc_data_dict and checks_data_dict
-            scc_data_dict[file_path] = scc_info
-            for stig_id, details in method_dict.items():
-                # Extract SCC name from the file path and remove extension and trailing "_**"
-                scc_name = os.path.splitext(os.path.basename(file_path))[0]
-                scc_name = re.sub(r'_\d{2}$', '', scc_name).strip()
-                checks_data_dict[stig_id] = {
-                    'SCC': scc_name,
-                    'Evidence method': details['Evidence Method']
-                }
-           # print(f"Added {len(method_dict)} checks for SCC: {scc_name}")
-            scc_methods = set()
-            for check_info in checks_data_dict.values():
-                if check_info['SCC'] == scc_name:
-                    scc_methods.add(check_info['Evidence method'].lower())
-            scc_info['Evidence Methods'] = list(scc_methods)
-            
+    checks = src.SCC.scc_checks.ChecksTable() #(SCC, STIG ID) -> check, with each SCC's evidence methods indexed as they're added
+
+    #Parse all excel files in directory (workers > 1 fans them out to a process pool); results come back in directory order
+    #Each result has the dictionaries (bper, docs, atts, controls) and the scc_info dictionary (first page check, etc) from one workbook load
+    #SCCs that haven't changed since the last build come out of the project's parse cache instead of being reparsed
+    scc_files = src.SCC.scc_ingest.list_scc_files(directory_path)
+    cache = src.SCC.scc_cache.SCCParseCache.for_project(project_dir)
+    analyses = src.SCC.scc_ingest.ingest_scc_files(scc_files, workers, functools.partial(src.SCC.scc_analyze.analyze_scc_file, engine=engine), cache) #engine 'xml' reads the sheet XML directly
+    cache.evict_missing(scc_files)
+    cache.save()
+    for file_path, analysis, error in analyses:
+        if error:
+            print(f"Error processing {file_path}: {error}")
+            continue
+        bper_dict, doc_dict, attestation_dict, method_dict, scc_info = analysis
+        scc_name = src.SCC.scc_read.get_scc_name(file_path) #SCC name from the file path, no extension or trailing "_**"
+
+        #stores in master dict
+        update_dict(all_bper_dict, bper_dict)
+        update_dict(all_attestation_dict, attestation_dict)
+        update_dict(all_doc_dict, doc_dict)
+
+        # Update scc_data_dict and the checks table
+        scc_info['Parse stamp'] = src.SCC.scc_probe.parse_stamp(src.SCC.scc_probe.probe_scc_file(file_path)) #so Pull Info can skip this file until it changes
+        scc_data_dict[file_path] = scc_info
+        for stig_id, details in method_dict.items():
+            checks.insert(scc_name, stig_id, details['Evidence Method'])
+       # print(f"Added {len(method_dict)} checks for SCC: {scc_name}")
+        scc_info['Evidence Methods'] = checks.methods_for(scc_name) #straight from the method index, no rescan of the checks
+        
     # Save progress to progress.json
     progress_data = {
         'BPERs': all_bper_dict,
         'Attestations': all_attestation_dict,
         'Documents': all_doc_dict,
         'SCC': scc_data_dict,
-        'Checks': checks_data_dict,
+        'Checks': checks.checks,
         'Program Settings': {
             'Project Directory': project_dir,
             'Directories Built': False,
@@ -338,9 +319,10 @@ def build_progress_json(directory_path, project_dir):
             'Checklists generated':''
         }
     }
-    with open(os.path.join(project_dir, 'progress.json'), 'w') as file:
-        json.dump(convert_datetime_to_string(progress_data), file, indent=4)
-    #print(f"Total checks in progress.json: {len(checks_data_dict)}")
+    store = progress_store.get_store(os.path.join(project_dir, 'progress.json'))
+    store.replace(progress_data)
+    store.flush()
+    #print(f"Total checks in progress.json: {len(checks)}")
 
 def update_bper_dict(master_directory):
     progress_data = read_json('progress.json')
@@ -360,8 +342,7 @@ def update_bper_dict(master_directory):
                 print(f"File not found for BPER: {key}")
 
     progress_data['BPERs'] = bper_dict
-    with open('progress.json', 'w') as file:
-        json.dump(convert_datetime_to_string(progress_data), file, indent=4)
+    progress_store.get_store('progress.json').changed('BPERs')
 
 def update_attestation_dict(master_directory):
     progress_data = read_json('progress.json')
@@ -380,8 +361,7 @@ def update_attestation_dict(master_directory):
                 print(f"File not found for Attestation: {key}")
 
     progress_data['Attestations'] = attestation_dict
-    with open('progress.json', 'w') as file:
-        json.dump(convert_datetime_to_string(progress_data), file, indent=4)
+    progress_store.get_store('progress.json').changed('Attestations')
 
 def update_doc_dict(master_directory):
     progress_data = read_json('progress.json')
@@ -400,8 +380,7 @@ def update_doc_dict(master_directory):
                 print(f"File not found for Document: {key}")
 
     progress_data['Documents'] = doc_dict
-    with open('progress.json', 'w') as file:
-        json.dump(convert_datetime_to_string(progress_data), file, indent=4)
+    progress_store.get_store('progress.json').changed('Documents')
 
 def gather_and_process_reports(project_dir):
     client = api_client()
@@ -471,9 +450,8 @@ def main():
     # Load progress from progress.json if --progress flag is set
     if args.progress:
         progress_file = 'progress.json'
-        if os.path.exists(progress_file):
-            with open(progress_file, 'r') as file:
-                progress_data = json.load(file)
+        if progress_sections.project_exists(progress_file): # progress.json or progress.d
+            progress_data = read_json(progress_file)
         else:
             print(f"Progress file {progress_file} not found. Starting from scratch.")
             progress_data = {
@@ -516,10 +494,8 @@ def main():
                 print(f"Skipping already processed file: {file_path}")
                 continue
 
-            #This creates the dictionaries using src.SCC.scc_read (bper, docs, atts, controls)
-            bper_dict, doc_dict, attestation_dict, method_dict = src.SCC.scc_read.process_excel_file(file_path)
-            #This creates the scc_info dictionary (first page check, etc)
-            scc_info = src.SCC.scc_check.process_scc_file(file_path)
+            #This creates the dictionaries (bper, docs, atts, controls) and the scc_info dictionary (first page check, etc) from one workbook load
+            bper_dict, doc_dict, attestation_dict, method_dict, scc_info = src.SCC.scc_analyze.analyze_scc_file(file_path)
 
             #This creates the directories for each SCC
             build_templates(master_directory)
@@ -540,16 +516,11 @@ def main():
             update_dict(progress_data['Attestations'], attestation_dict)
             update_dict(progress_data['Documents'], doc_dict)
 
-            # Update scc_data_dict and checks_data_dict
+            # Update scc_data_dict and the checks table
             progress_data['SCC'][file_path] = scc_info
+            checks = src.SCC.scc_checks.ChecksTable.for_progress(progress_data)
             for stig_id, details in method_dict.items():
-                # Extract SCC name from the file path and remove extension and trailing "_**"
-                scc_name = os.path.splitext(os.path.basename(file_path))[0]
-                scc_name = re.sub(r'_\d{2}$', '', scc_name).strip()
-                progress_data['Checks'][stig_id] = {
-                    'SCC': scc_name,
-                    'Evidence method': details['Method']
-                }
+                checks.insert(scc_name_without_extension, stig_id, details['Evidence Method'])
 
     #move text and SCC's into their folders
     file_extensions = ['.xlsx', '.txt']
@@ -564,8 +535,9 @@ def main():
     write_not_gathered_file()
 
     # Save progress to progress.json
-    with open('progress.json', 'w') as file:
-        json.dump(convert_datetime_to_string(progress_data), file, indent=4)
+    store = progress_store.get_store('progress.json')
+    store.replace(progress_data)
+    store.flush()
 
 
 if __name__ == "__main__":
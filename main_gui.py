@@ -14,6 +14,7 @@ import glob
 import json
 import re
 import subprocess
+import functools
 from datetime import datetime
 from openpyxl import Workbook
 from difflib import SequenceMatcher
@@ -23,9 +24,12 @@ from src.utils import json_to_excel
 from src.utils import doc_validation
 from src.utils import file_operations
 from src.utils import update_info 
+from src.utils import progress_store
+from src.utils import progress_sections
 import src.SCC.scc_check
 import src.SCC.scc_read
 import src.SCC.scc_tables
+import src.SCC.scc_ingest
 from src.Archer.fetch_attestations import fetch_attestations, HttpNegotiateAuth
 import src.ServiceNow.fetch_Documents
 import src.ServiceNow.fetch_BPERs
@@ -42,8 +46,17 @@ progress_file = None
 scc_dir = None
 project_dir = None
 template_dir = None
+scc_workers = None # worker processes for SCC parsing, None = one per CPU
+scc_read_engine = "streaming" # "xml" reads the SCC sheet XML directly (falls back to openpyxl for unusual files)
 
 ### GUI Functions ###
+def get_progress_store(): # shared progress.json for the selected project, saves are batched through Tk's after() so quick edits are one write
+    store = progress_store.get_store(progress_file)
+    store.scheduler = root.after
+    return store
+def on_close(): # write any pending progress.json edits (and fold in the journal) before the window goes away
+    progress_store.flush_all()
+    root.destroy()
 ## Welcome Screen ##
 def select_directory(prompt): # pop up for selecting dirs
     directory = filedialog.askdirectory(title=prompt)
@@ -214,7 +227,10 @@ def start_new_project(): # Welcome - Button - Start New Project
                 "Templates Built": False,
                 "Gather and Sort Date": "",
                 "Pull Info Date": "",
-                "Checklists generated": ""
+                "Checklists generated": "",
+                "SCC Workers": scc_workers,
+                "SCC Read Engine": scc_read_engine,
+                "Compact Progress File": False # True writes progress.json without indentation (smaller, quicker saves)
             },
             "SCC": {},
             "BPERs": {},
@@ -239,39 +255,37 @@ def start_new_project(): # Welcome - Button - Start New Project
             # Wait for user to copy files
             messagebox.showinfo("SCC Processing", "Click OK once you've copied the SCC files.")
 
-        # Process SCC files
-        for scc_file in os.listdir(scc_dir):
-            if scc_file.endswith('.xlsx') or scc_file.endswith('.xls'):
-                file_path = os.path.join(scc_dir, scc_file)
-                try:
-                    # Run scc_check on the file
-                    scc_info = src.SCC.scc_check.process_scc_file(file_path)
-                    
-                    # Update the progress data with SCC information
-                    initial_progress_data["SCC"][file_path] = scc_info
-                except Exception as e:
-                    # If an error occurs, add the file name with blank values
-                    print(f"Error processing {scc_file}: {str(e)}")
-                    initial_progress_data["SCC"][file_path] = {
-                        "SCC": os.path.splitext(scc_file)[0],  # Use filename without extension as SCC name
-                        "Version": "",
-                        "SCM Name": "",
-                        "Last Review Date": "",
-                        "SCC Guidance source presence": False,
-                        "SCC Policy and Procedure presence": False,
-                        "Exception column presence": False,
-                        "Deviation column presence": False,
-                        "TLA column presence": False,
-                        "Compliance method column presence": False,
-                        "WPS config sup doc presence": False,
-                        "Reviewed within 180 days": False,
-                        "SCC System Scope Presence": False,
-                        "Evidence Methods": []
-                    }
+        # Process SCC files - scc_check runs across worker processes, results come back in directory order
+        for file_path, scc_info, error in src.SCC.scc_ingest.ingest_scc_files(src.SCC.scc_ingest.list_scc_files(scc_dir), scc_workers, functools.partial(src.SCC.scc_check.process_scc_file, engine=scc_read_engine)):
+            scc_file = os.path.basename(file_path)
+            if not error:
+                # Update the progress data with SCC information
+                initial_progress_data["SCC"][file_path] = scc_info
+            else:
+                # If an error occurs, add the file name with blank values
+                print(f"Error processing {scc_file}: {error}")
+                initial_progress_data["SCC"][file_path] = {
+                    "SCC": os.path.splitext(scc_file)[0],  # Use filename without extension as SCC name
+                    "Version": "",
+                    "SCM Name": "",
+                    "Last Review Date": "",
+                    "SCC Guidance source presence": False,
+                    "SCC Policy and Procedure presence": False,
+                    "Exception column presence": False,
+                    "Deviation column presence": False,
+                    "TLA column presence": False,
+                    "Compliance method column presence": False,
+                    "WPS config sup doc presence": False,
+                    "Reviewed within 180 days": False,
+                    "SCC System Scope Presence": False,
+                    "Evidence Methods": []
+                }
 
         # Write the populated progress data to progress.json
-        with open(progress_file, 'w') as file:
-            json.dump(initial_progress_data, file, indent=4)
+        store = get_progress_store()
+        store.replace(initial_progress_data)
+        store.use_sections() # new projects keep their progress data in progress.d, one file per section
+        store.flush()
 
         # Update GUI and go to second screen
         update_directory_labels()
@@ -311,8 +325,9 @@ def fetch_scc_documents(project_dir, scc_dir, selected_sccs=None): # Welcome - S
 
 def update_existing_project(): # Welcome - Button - Update Existing - Actions on update existing button click
     global progress_file, project_dir
-    progress_file = filedialog.askopenfilename(title="Select the progress.json file", filetypes=[("JSON Files", "*.json")])
+    progress_file = filedialog.askopenfilename(title="Select the progress.json file (or a file in progress.d)", filetypes=[("JSON Files", "*.json")])
     if progress_file:
+        progress_file = progress_sections.progress_file_for(progress_file) # sectioned projects are keyed on the progress.json beside progress.d
         project_dir = os.path.dirname(progress_file) 
         load_project_settings() 
         update_directory_labels() 
@@ -321,65 +336,55 @@ def update_existing_project(): # Welcome - Button - Update Existing - Actions on
         error_label.config(text="Please select a valid progress.json file.")
 def load_project_settings(): # Welcome - Button - Update Existing - Load the progress file
     if progress_file:
-        with open(progress_file, 'r') as file: # get below info from progress.json
-            progress_data = json.load(file)
-            program_settings = progress_data.get('Program Settings', {})
-            global scc_dir, bpers_dir, attestation_dir, supporting_docs_dir, template_dir
-            scc_dir = program_settings.get('SCC Directory', '')
-            bpers_dir = program_settings.get('BPERs Directory', '')
-            attestation_dir = program_settings.get('Attestation Directory', '')
-            supporting_docs_dir = program_settings.get('Supporting Documents Directory', '')
-            template_dir = program_settings.get('Template Directory', '')
-            update_directory_labels() 
-            update_status_labels(program_settings) 
+        store = get_progress_store() # only the sections shown here are read (progress.d)
+        program_settings = store.settings
+        global scc_dir, bpers_dir, attestation_dir, supporting_docs_dir, template_dir
+        scc_dir = program_settings.get('SCC Directory', '')
+        bpers_dir = program_settings.get('BPERs Directory', '')
+        attestation_dir = program_settings.get('Attestation Directory', '')
+        supporting_docs_dir = program_settings.get('Supporting Documents Directory', '')
+        template_dir = program_settings.get('Template Directory', '')
+        update_directory_labels() 
+        update_status_labels(program_settings) 
             
-            # Update SCC list
-            scc_list = list(progress_data.get('SCC', {}).keys())
-            scc_listbox.delete(0, tk.END) # clear current list
-            for scc_path in scc_list:
-                scc_data = progress_data.get('SCC', {}).get(scc_path, {})
-                scc_name = scc_data.get('SCC')
-                if scc_name:
-                    scc_listbox.insert(tk.END, scc_name) # add SCC names to listbox
+        # Update SCC list
+        scc_list = list(store.sccs.keys())
+        scc_listbox.delete(0, tk.END) # clear current list
+        for scc_path in scc_list:
+            scc_data = store.sccs.get(scc_path, {})
+            scc_name = scc_data.get('SCC')
+            if scc_name:
+                scc_listbox.insert(tk.END, scc_name) # add SCC names to listbox
             
-            # Update "Items Not Gathered" lists
-            not_gathered_attestations = []
-            not_gathered_bpers = []
-            not_gathered_documents = []
-            for item_type, item_dict in [('Attestations', progress_data.get('Attestations', {})),
-                                        ('BPERs', progress_data.get('BPERs', {})),
-                                        ('Documents', progress_data.get('Documents', {}))]:
-                for item_id, item_data_list in item_dict.items():
-                    for item_data in item_data_list:
-                        if not item_data.get('Gathered', True) and not item_data.get('false_positive', False):
-                            item_name = item_data.get('BPER name') or item_data.get('Attestation num') or item_data.get('Doc name')
-                            scc = item_data.get('SCC')
-                            if item_type == 'Attestations':
-                                not_gathered_attestations.append(f"{item_name} - {scc}")
-                            elif item_type == 'BPERs':
-                                not_gathered_bpers.append(f"{item_name} - {scc}")
-                            else:
-                                not_gathered_documents.append(f"{item_name} - {scc}")
+        # Update "Items Not Gathered" lists
+        not_gathered_attestations, not_gathered_bpers, not_gathered_documents = not_gathered_lists(store)
             
-            not_gathered_attestations_listbox.delete(0, tk.END) # clear current list
-            for item in not_gathered_attestations:
-                not_gathered_attestations_listbox.insert(tk.END, item) # add items to listbox
+        not_gathered_attestations_listbox.delete(0, tk.END) # clear current list
+        for item in not_gathered_attestations:
+            not_gathered_attestations_listbox.insert(tk.END, item) # add items to listbox
             
-            not_gathered_bpers_listbox.delete(0, tk.END) # clear current list
-            for item in not_gathered_bpers:
-                not_gathered_bpers_listbox.insert(tk.END, item) # add items to listbox
+        not_gathered_bpers_listbox.delete(0, tk.END) # clear current list
+        for item in not_gathered_bpers:
+            not_gathered_bpers_listbox.insert(tk.END, item) # add items to listbox
             
-            not_gathered_documents_listbox.delete(0, tk.END) # clear current list
-            for item in not_gathered_documents:
-                not_gathered_documents_listbox.insert(tk.END, item) # add items to listbox
+        not_gathered_documents_listbox.delete(0, tk.END) # clear current list
+        for item in not_gathered_documents:
+            not_gathered_documents_listbox.insert(tk.END, item) # add items to listbox
             
-            # Update date labels
-            last_info_pull_date = program_settings.get('Pull Info Date', 'N/A')
-            last_doc_pull_date = program_settings.get('Gather and Sort Date', 'N/A')
-            last_checklist_generated_date = program_settings.get('Checklists generated', 'N/A')
-            last_info_pull_label.config(text=f"Last Info Pull: {last_info_pull_date}")
-            last_doc_pull_label.config(text=f"Last Doc Pull: {last_doc_pull_date}")
-            last_checklist_generated_label.config(text=f"Last Checklist Generated: {last_checklist_generated_date}")
+        # Update date labels
+        last_info_pull_date = program_settings.get('Pull Info Date', 'N/A')
+        last_doc_pull_date = program_settings.get('Gather and Sort Date', 'N/A')
+        last_checklist_generated_date = program_settings.get('Checklists generated', 'N/A')
+        last_info_pull_label.config(text=f"Last Info Pull: {last_info_pull_date}")
+        last_doc_pull_label.config(text=f"Last Doc Pull: {last_doc_pull_date}")
+        last_checklist_generated_label.config(text=f"Last Checklist Generated: {last_checklist_generated_date}")
+
+def not_gathered_lists(store): # Welcome/Dashboard - Support - "item - SCC" lines for the Items Not Gathered lists (attestations, BPERs, documents)
+    lists = {'Attestations': [], 'BPERs': [], 'Documents': []}
+    for item_type, item_id, item_data in store.not_gathered(lists.keys()):
+        item_name = item_data.get('BPER name') or item_data.get('Attestation num') or item_data.get('Doc name')
+        lists[item_type].append(f"{item_name} - {item_data.get('SCC')}")
+    return lists['Attestations'], lists['BPERs'], lists['Documents']
 
 ## Options Screen ##
 def show_options(): # Options - Screen - show the second screen (options/main screen)
@@ -395,50 +400,23 @@ def pull_information(): # Options - Button - Pull Information - Parses SCC's and
             'attestation': attestation_dir,
             'doc': supporting_docs_dir
         }
-        update_info.update_progress_info(progress_file, base_directories, scc_dir)
-        
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        update_info.update_progress_info(progress_file, base_directories, scc_dir) # merges one entry per (item, SCC), stamps the Pull Info Date and saves
         
-        program_settings = progress_data.get('Program Settings', {})
-        program_settings['Pull Info Date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        progress_data['Program Settings'] = program_settings
-        progress_data = remove_duplicates_from_progress(progress_data) # remove duplicates
-
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        program_settings = get_progress_store().settings
         
         update_status_labels(program_settings)
         print("Pull information completed successfully.")
     else:
         error_label.config(text="Please select a valid progress.json file.")
 
-def remove_duplicates_from_progress(progress_data): # exactly what it sounds like, was having this problem bc multiple pull infos would double and triple up doc names 
-    for category in ['BPERs', 'Documents', 'Attestations']:
-        for key, entries in progress_data[category].items():
-            seen_sccs = set()
-            unique_entries = []
-            for entry in entries:
-                scc = entry['SCC']
-                if scc not in seen_sccs:
-                    seen_sccs.add(scc)
-                    unique_entries.append(entry)
-            progress_data[category][key] = unique_entries
-    return progress_data
-
 def build_dirs(): # Options - Button - Build - Builds out the TDL directories
     if progress_file and project_dir:
         KAIZEN.create_directories(project_dir)  # create directories
         
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
-        
-        program_settings = progress_data.get('Program Settings', {})
+        program_settings = get_progress_store().settings
         program_settings['Directories Built'] = True
-        progress_data['Program Settings'] = program_settings
         
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        get_progress_store().changed('Program Settings')
         
         build_dirs_status.config(text="Done")  # update status label
         error_label.config(text="Directories built.") # TODO : this is broken, it displays built after an info pull, but before dirs are present. Not sure if the problem is this file or not
@@ -446,28 +424,25 @@ def build_dirs(): # Options - Button - Build - Builds out the TDL directories
         error_label.config(text="Please select a valid progress.json file and project directory.")
 def build_templates(): # Options - Button - Build - Creates the templates
     if progress_file and project_dir and template_dir:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
-            method_dict = progress_data.get('Checks', {})
-            KAIZEN.build_templates(method_dict, project_dir, template_dir) # build templates
+        store = get_progress_store()
+        checks = store.checks # (SCC, STIG ID) keyed checks with each SCC's evidence methods
+        KAIZEN.build_templates(checks, project_dir, template_dir) # build templates
 
-        program_settings = progress_data.get('Program Settings', {})
+        program_settings = store.settings
         program_settings['Templates Built'] = True
-        progress_data['Program Settings'] = program_settings
 
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        get_progress_store().changed('Program Settings')
 
         build_templates_status.config(text="Done") # update status label
     else:
         error_label.config(text="Please select a valid progress.json file, project directory, and template directory.")
 def gather_docs(): # Options - Button - Gather - Starts the doc gathering process
     if progress_file and bpers_dir and attestation_dir and supporting_docs_dir:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
-            bper_dict = progress_data.get('BPERs', {})
-            doc_dict = progress_data.get('Documents', {})
-            attestation_dict = progress_data.get('Attestations', {})
+        store = get_progress_store()
+        progress_data = store.data
+        bper_dict = progress_data.get('BPERs', {})
+        doc_dict = progress_data.get('Documents', {})
+        attestation_dict = progress_data.get('Attestations', {})
 
         # Load document sysids
         config_dir = os.path.join(os.path.dirname(__file__), 'config')
@@ -477,16 +452,16 @@ def gather_docs(): # Options - Button - Gather - Starts the doc gathering proces
         if doc_sysids is None:
             return
 
-        # Identify documents to fetch
+        # Identify documents to fetch, once per document however many SCCs list it
         docs_to_fetch = []
         for doc_name, doc_info_list in doc_dict.items():
-            for doc_info in doc_info_list:
-                if not doc_info.get('Gathered', False) and not doc_info.get('false_positive', False):
-                    matched_name, sysid = match_document_name(doc_name, doc_sysids)
-                    if matched_name:
+            if any(not doc_info.gathered and not doc_info.false_positive for doc_info in doc_info_list): # record attributes
+                matched_name, sysid = match_document_name(doc_name, doc_sysids)
+                if matched_name:
+                    if matched_name not in docs_to_fetch:
                         docs_to_fetch.append(matched_name)
-                    else:
-                        print(f"Warning: No good match found for document {doc_name}")
+                else:
+                    print(f"Warning: No good match found for document {doc_name}")
 
         # Fetch documents
         if docs_to_fetch:
@@ -538,15 +513,14 @@ def gather_docs(): # Options - Button - Gather - Starts the doc gathering proces
         if bper_sysids is None:
             return
 
-        # Identify BPERs to fetch
+        # Identify BPERs to fetch, once per BPER however many SCCs list it
         bpers_to_fetch = []
         for bper_name, bper_info_list in bper_dict.items():
-            for bper_info in bper_info_list:
-                if not bper_info.get('Gathered', False) and not bper_info.get('false_positive', False):
-                    if bper_name in bper_sysids:
-                        bpers_to_fetch.append(bper_name)
-                    else:
-                        print(f"Warning: BPER {bper_name} not found in BPER_sysids.json")
+            if any(not bper_info.gathered and not bper_info.false_positive for bper_info in bper_info_list):
+                if bper_name in bper_sysids:
+                    bpers_to_fetch.append(bper_name)
+                else:
+                    print(f"Warning: BPER {bper_name} not found in BPER_sysids.json")
 
         # Fetch BPERs
         if bpers_to_fetch:
@@ -569,7 +543,7 @@ def gather_docs(): # Options - Button - Gather - Starts the doc gathering proces
         base_directories = {'bper': bpers_dir, 'doc': supporting_docs_dir, 'attestation': attestation_dir}
         
         updated_bper_dict, updated_doc_dict, updated_attestation_dict = file_operations.update_dictionaries_and_copy_files(
-            bper_dict, doc_dict, attestation_dict, base_directories, project_dir
+            bper_dict, doc_dict, attestation_dict, base_directories, project_dir, store.by_scc # which SCCs each item gets copied to
         )
         
         progress_data['BPERs'] = updated_bper_dict
@@ -580,8 +554,7 @@ def gather_docs(): # Options - Button - Gather - Starts the doc gathering proces
         program_settings['Gather and Sort Date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         progress_data['Program Settings'] = program_settings
         
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        store.changed()
         
         gather_docs_status.config(text=program_settings['Gather and Sort Date'])
         messagebox.showinfo("Success", "Documents gathered and sorted successfully!")
@@ -655,23 +628,20 @@ def generate_md_files(): # Options - Button - Generate MD Files - generate markd
     if progress_file and project_dir:
         src.SCC.scc_tables.generate_scc_info_docs(progress_file) 
         
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        store = get_progress_store()
         
-        program_settings = progress_data.get('Program Settings', {})
+        program_settings = store.settings
         program_settings['Checklists generated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        progress_data['Program Settings'] = program_settings
         
         # Store the generated file paths in the respective "SCC" dictionary entry
-        for scc_file, scc_data in progress_data.get('SCC', {}).items():
+        for scc_file, scc_data in store.sccs.items():
             scc_name = scc_data.get('SCC')
             if scc_name:
                 md_file_path = os.path.join(project_dir, f"{scc_name}_info.md")
                 if os.path.exists(md_file_path):
                     scc_data['Info Doc Path'] = md_file_path
         
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        store.changed('Program Settings', 'SCC')
         
         generate_md_status.config(text=program_settings['Checklists generated']) # update status label
     else:
@@ -707,15 +677,16 @@ def output_progress(): # Options - Button - Output Progress - puts progress.json
     if progress_file and project_dir:
         try:
             # Load the JSON data from the progress file
-            with open(progress_file, 'r') as file:
-                data = json.load(file)
+            store = get_progress_store()
+            data = store.data
 
             # Create a new workbook
             wb = Workbook()
 
-            # Create a sheet for each high-level dictionary
+            # Create a sheet for each high-level dictionary (checks are nested per SCC, so they go out as one row per check)
             for key in data:
-                json_to_excel.create_sheet(wb, key, data[key])
+                sheet_data = store.checks.as_entries() if key == 'Checks' else data[key]
+                json_to_excel.create_sheet(wb, key, sheet_data)
 
             # Remove the default sheet created by openpyxl
             default_sheet = wb['Sheet']
@@ -740,34 +711,18 @@ def add_or_redo_scc(): # Options - Button - Add or redo an SCC
         scc_name = re.sub(r'_\d{2}$', '', scc_name).strip()
         
         # Load progress data from progress.json
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
-        
-        # Check if the SCC exists in progress data
-        if scc_name in progress_data['SCC']:
-            # Remove all entries with the matching SCC name
-            for key in ['BPERs', 'Attestations', 'Documents', 'SCC', 'Checks']:
-                progress_data[key] = {k: v for k, v in progress_data[key].items() if v.get('SCC') != scc_name}
+        store = get_progress_store()
         
         # Process the selected Excel file
-        bper_dict, doc_dict, attestation_dict, method_dict = src.SCC.scc_read.process_excel_file(file_path)
+        bper_dict, doc_dict, attestation_dict, method_dict = src.SCC.scc_read.process_excel_file(file_path, engine=scc_read_engine)
         
-        # Update progress data with the new information
-        for key, value in bper_dict.items():
-            progress_data['BPERs'][key] = value
-        for key, value in doc_dict.items():
-            progress_data['Documents'][key] = value
-        for key, value in attestation_dict.items():
-            progress_data['Attestations'][key] = value
-        for stig_id, details in method_dict.items():
-            progress_data['Checks'][stig_id] = {
-                'SCC': scc_name,
-                'Evidence method': details['Evidence Method']
-            }
+        # Merge the SCC's items in; items it already had keep their gathered state, items it no longer lists are removed
+        for key, items, refresh_fields in (('BPERs', bper_dict, ('Roles',)), ('Documents', doc_dict, ()), ('Attestations', attestation_dict, ())):
+            store.set_scc_items(key, scc_name, items, refresh_fields)
+        store.checks.set_scc(scc_name, method_dict) # replaces this SCC's checks, other SCCs sharing a STIG ID are untouched
         
         # Save the updated progress data to progress.json
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        store.changed(progress_store.CHECKS)
         
         error_label.config(text=f"SCC '{scc_name}' added or updated successfully.") # update status message
 def remove_scc(): # Options - Button - Remove an SCC - 
@@ -785,11 +740,10 @@ def remove_scc(): # Options - Button - Remove an SCC -
     scc_list_listbox.pack(fill="both", expand=True)
 
     if progress_file:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        scc_dict = get_progress_store().sccs
 
-        for scc_path in progress_data.get('SCC', {}):
-            scc_data = progress_data['SCC'][scc_path]
+        for scc_path in scc_dict:
+            scc_data = scc_dict[scc_path]
             scc_name = scc_data.get('SCC')
             if scc_name:
                 scc_list_listbox.insert(tk.END, scc_name) # add SCC names to listbox
@@ -798,22 +752,15 @@ def remove_scc(): # Options - Button - Remove an SCC -
     delete_button.pack(pady=10)
 def delete_scc(scc_name): # Options - Support - Supports remove an scc
     if progress_file:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        store = get_progress_store()
 
-        for key in ['BPERs', 'Attestations', 'Documents']:
-            updated_dict = {}
-            for item_key, item_list in progress_data[key].items():
-                updated_list = [item for item in item_list if item.get('SCC') != scc_name]
-                if updated_list:
-                    updated_dict[item_key] = updated_list
-            progress_data[key] = updated_dict
+        store.remove_scc_entries(scc_name) # only this SCC's entries, found through the store's (item, SCC) index
+        scc_dict = store.sccs
+        for scc_path in [k for k, v in scc_dict.items() if v.get('SCC') == scc_name]:
+            del scc_dict[scc_path]
+        store.checks.remove_scc(scc_name)
 
-        progress_data['SCC'] = {k: v for k, v in progress_data['SCC'].items() if v.get('SCC') != scc_name}
-        progress_data['Checks'] = {k: v for k, v in progress_data['Checks'].items() if v.get('SCC') != scc_name}
-
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        store.changed(progress_store.SCC, progress_store.CHECKS) # item sections were marked by remove_scc_entries
 
         error_label.config(text=f"SCC '{scc_name}' removed successfully.")
         load_project_settings()  # Refresh the dashboard after removing an SCC
@@ -882,8 +829,9 @@ def select_scc_directory(): # Options - Button - Select SCC Directory
         save_project_settings() # save settings
 def select_progress_file(): # Options - Button - Select progress file
     global progress_file
-    progress_file = filedialog.askopenfilename(title="Select the progress.json file", filetypes=[("JSON Files", "*.json")])
+    progress_file = filedialog.askopenfilename(title="Select the progress.json file (or a file in progress.d)", filetypes=[("JSON Files", "*.json")])
     if progress_file:
+        progress_file = progress_sections.progress_file_for(progress_file)
         progress_file_label.config(text=f"Progress File: {progress_file}") # update label
         load_project_settings() # load settings
         update_directory_labels() # update directory labels
@@ -901,19 +849,14 @@ def select_template_directory(): # Options - Button - Select Template Directory
         save_project_settings() # save settings
 def save_project_settings(): # Options - Support - Supports the buttons that select directories
     if progress_file:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
-        
-        program_settings = progress_data.get('Program Settings', {})
+        program_settings = get_progress_store().settings
         program_settings['SCC Directory'] = scc_dir
         program_settings['BPERs Directory'] = bpers_dir
         program_settings['Attestation Directory'] = attestation_dir
         program_settings['Supporting Documents Directory'] = supporting_docs_dir
         program_settings['Template Directory'] = template_dir
-        progress_data['Program Settings'] = program_settings
 
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        get_progress_store().changed('Program Settings')
 
 ## Dashboard Screen ##
 def show_dashboard(): # Dashboard - Screen - show the third screen (Doc Dashboard)
@@ -923,27 +866,14 @@ def show_dashboard(): # Dashboard - Screen - show the third screen (Doc Dashboar
 def refresh_dashboard(): # Dashboard - Presentation -  handles the dashboard screen
     scc_listbox.delete(0, tk.END)  # clear current list
     if progress_file:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        store = get_progress_store() # SCC list, settings and the item sections behind the counts; checks aren't read
+        ungathered_sccs = store.sccs_with_ungathered() # one pass over the SCC groups instead of a scan per SCC
         
-        for scc_path, scc_data in progress_data['SCC'].items():
+        for scc_path, scc_data in store.sccs.items():
             scc_name = scc_data.get('SCC')
             if scc_name:
-                # Check if any linked items are not gathered
-                has_ungathered_items = False
-                for category in ['Attestations', 'BPERs', 'Documents']:
-                    for item_data_list in progress_data.get(category, {}).values():
-                        for item_data in item_data_list:
-                            if item_data.get('SCC') == scc_name and not item_data.get('Gathered', False):
-                                has_ungathered_items = True
-                                break
-                        if has_ungathered_items:
-                            break
-                    if has_ungathered_items:
-                        break
-                
                 # Insert SCC name with appropriate background color
-                if has_ungathered_items:
+                if scc_name in ungathered_sccs:
                     scc_listbox.insert(tk.END, scc_name)
                     scc_listbox.itemconfig(tk.END, {'bg': '#FFB6C1'})  # Light red
                 else:
@@ -955,9 +885,7 @@ def refresh_dashboard(): # Dashboard - Presentation -  handles the dashboard scr
         total_counts = []
 
         for category in categories:
-            items = progress_data.get(category, {})
-            gathered_count = sum(1 for item_data_list in items.values() for item_data in item_data_list if item_data.get('Gathered', False) and not item_data.get('false_positive', False))
-            total_count = sum(1 for item_data_list in items.values() for item_data in item_data_list if not item_data.get('false_positive', False))
+            gathered_count, total_count = store.gathered_counts(category)
             gathered_counts.append(gathered_count)
             total_counts.append(total_count)
 
@@ -975,22 +903,7 @@ def refresh_dashboard(): # Dashboard - Presentation -  handles the dashboard scr
     not_gathered_bpers = []
     not_gathered_documents = []
     if progress_file:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
-        for item_type, item_dict in [('Attestations', progress_data.get('Attestations', {})),
-                                     ('BPERs', progress_data.get('BPERs', {})),
-                                     ('Documents', progress_data.get('Documents', {}))]:
-            for item_id, item_data_list in item_dict.items():
-                for item_data in item_data_list:
-                    if not item_data.get('Gathered', True) and not item_data.get('false_positive', False):
-                        item_name = item_data.get('BPER name') or item_data.get('Attestation num') or item_data.get('Doc name')
-                        scc = item_data.get('SCC')
-                        if item_type == 'Attestations':
-                            not_gathered_attestations.append(f"{item_name} - {scc}")
-                        elif item_type == 'BPERs':
-                            not_gathered_bpers.append(f"{item_name} - {scc}")
-                        else:
-                            not_gathered_documents.append(f"{item_name} - {scc}")
+        not_gathered_attestations, not_gathered_bpers, not_gathered_documents = not_gathered_lists(store)
     
     not_gathered_attestations_listbox.delete(0, tk.END)  # clear current list
     for item in not_gathered_attestations:
@@ -1006,9 +919,7 @@ def refresh_dashboard(): # Dashboard - Presentation -  handles the dashboard scr
     
     # Update date labels
     if progress_file:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
-        program_settings = progress_data.get('Program Settings', {})
+        program_settings = store.settings
         last_info_pull_date = program_settings.get('Pull Info Date', 'N/A')
         last_doc_pull_date = program_settings.get('Gather and Sort Date', 'N/A')
         last_checklist_generated_date = program_settings.get('Checklists generated', 'N/A')
@@ -1026,15 +937,13 @@ def open_scc_markdown_file(event): # Dashboard - Button - opens relevant checkli
     if selected_indices:
         selected_scc = scc_listbox.get(selected_indices[0])
         if progress_file:
-            with open(progress_file, 'r') as file:
-                progress_data = json.load(file)
-                for scc_path, scc_data in progress_data['SCC'].items():
-                    if scc_data.get('SCC') == selected_scc:
-                        md_file_path = scc_data.get('Info Doc Path')
-                        if md_file_path and os.path.exists(md_file_path):
-                            os.startfile(md_file_path)
-                            return
-                error_label.config(text=f"Markdown file not found for SCC: {selected_scc}")
+            for scc_path, scc_data in get_progress_store().sccs.items():
+                if scc_data.get('SCC') == selected_scc:
+                    md_file_path = scc_data.get('Info Doc Path')
+                    if md_file_path and os.path.exists(md_file_path):
+                        os.startfile(md_file_path)
+                        return
+            error_label.config(text=f"Markdown file not found for SCC: {selected_scc}")
     else:
         error_label.config(text="Please select a valid progress.json file.")
 # Dashboard - Items Not Gathered Section
@@ -1053,39 +962,15 @@ def mark_as_false_positive(item_type): #  Dashboard - Button - Mark as false pos
         listbox = not_gathered_documents_listbox
         dict_key = "Documents"
     
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file)
+    store = get_progress_store()
     
     for selected_item in selected_items:
         item_name, scc = selected_item.split(" - ")
-        
-        for item_id, item_data_list in progress_data[dict_key].items():
-            for item_data in item_data_list:
-                if item_data.get("BPER name") == item_name or item_data.get("Attestation num") == item_name or item_data.get("Doc name") == item_name:
-                    item_data["false_positive"] = True
-                    break
-    
-    with open(progress_file, 'w') as file:
-        json.dump(progress_data, file, indent=4)
+        store.set_entry_field(dict_key, item_name, scc, "false_positive", True) # journaled, only the selected SCC's entry
     
     for idx in reversed(listbox.curselection()): # remove marked items from listbox
         listbox.delete(idx)
-    
-    item_name, scc = selected_item.split(" - ")
-    
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file)
-    
-    for item_id, item_data_list in progress_data[dict_key].items():
-        for item_data in item_data_list:
-            if item_data.get("BPER name") == item_name or item_data.get("Attestation num") == item_name or item_data.get("Doc name") == item_name:
-                item_data["false_positive"] = True
-                break
-    
-    with open(progress_file, 'w') as file:
-        json.dump(progress_data, file, indent=4)
-    
-    listbox.delete(listbox.curselection())
+
 def manually_link_files(item_type): # Dashboard - Button - Assign Match - Manually link selected files to items based on item type
     if item_type == "BPERs":
         selected_items = [not_gathered_bpers_listbox.get(idx) for idx in not_gathered_bpers_listbox.curselection()]
@@ -1103,8 +988,7 @@ def manually_link_files(item_type): # Dashboard - Button - Assign Match - Manual
         dict_key = "Documents"
         directory = supporting_docs_dir
     
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file)
+    store = get_progress_store()
     
     for selected_item in selected_items:
         item_name, scc = selected_item.split(" - ")
@@ -1112,21 +996,7 @@ def manually_link_files(item_type): # Dashboard - Button - Assign Match - Manual
         file_path = filedialog.askopenfilename(initialdir=directory, title=f"Select file for {item_name}")
         
         if file_path:
-            for item_id, item_data_list in progress_data[dict_key].items():
-                if len(item_data_list) > 1:  # Check if there are multiple sub-values
-                    for item_data in item_data_list:
-                        if item_data.get("Doc name") == item_name:
-                            for sub_item_data in item_data_list:
-                                sub_item_data["manually_linked"] = file_path
-                            break
-                else:
-                    for item_data in item_data_list:
-                        if item_data.get("BPER name") == item_name or item_data.get("Attestation num") == item_name or item_data.get("Doc name") == item_name:
-                            item_data["manually_linked"] = file_path
-                            break
-    
-    with open(progress_file, 'w') as file:
-        json.dump(progress_data, file, indent=4)
+            store.set_entry_field(dict_key, item_name, None, "manually_linked", file_path) # journaled, the same file goes with every SCC's entry for the item
 
 ## Scans Screen ## 
 def show_scans(): # Scans - Screen - show the fourth screen (Scans)
@@ -1141,15 +1011,14 @@ def update_inventory_display(): # Scans - Area - Inventories pane updates/ popul
         widget.destroy()
 
     if progress_file:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        store = get_progress_store() # SCC section only
         
-        scc_dict = progress_data.get('SCC', {})
+        scc_dict = store.sccs
         
         for scc_path, scc_info in scc_dict.items():
             scc_name = scc_info['SCC']
             inventory_file = scc_info.get('Inventory File', '')
-            evidence_methods = [method.lower() for method in scc_info.get('Evidence Methods', [])]
+            evidence_methods = scc_info.get('Evidence Methods', []) # recorded on the SCC when it was pulled, Checks stays unread
             
             # Check if inventory is required (automated or manual-auto info)
             inventory_required = 'automated' in evidence_methods or 'manual-auto info' in evidence_methods
@@ -1184,32 +1053,25 @@ def check_inventories(): # Scans - Button - Check Inventories - checks for inven
     inventory_status = []
 
     try:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        store = get_progress_store()
 
-        for scc_path, scc_info in progress_data['SCC'].items():
+        for scc_path, scc_info in store.sccs.items():
             scc_name = scc_info['SCC']
             inventory_file_name = f"{scc_name}-Inventory.txt"
             inventory_file_path = os.path.join(project_dir, scc_name, inventory_file_name)
 
             if os.path.exists(inventory_file_path):
-                progress_data['SCC'][scc_path]['Inventory File'] = inventory_file_path
+                scc_info['Inventory File'] = inventory_file_path
                 inventory_status.append(f"Found inventory for {scc_name}")
             else:
-                progress_data['SCC'][scc_path]['Inventory File'] = ""
+                scc_info['Inventory File'] = ""
                 inventory_status.append(f"No inventory found for {scc_name}")
 
-        # Save the updated progress data
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
-
         # Update the last inventory check timestamp
-        program_settings = progress_data.get('Program Settings', {})
+        program_settings = store.settings
         program_settings['Last Inventory Check'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        progress_data['Program Settings'] = program_settings
 
-        with open(progress_file, 'w') as file:
-            json.dump(progress_data, file, indent=4)
+        store.changed('SCC', 'Program Settings') # inventory files and the check timestamp, one write
 
         print("Inventory check completed and progress.json updated.")
         
@@ -1226,15 +1088,14 @@ def update_scan_status_display(): # Scans - Area - Scan Status Pane - updates/ p
         widget.destroy()
 
     if progress_file:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        store = get_progress_store() # SCC section only
         
-        scc_dict = progress_data.get('SCC', {})
+        scc_dict = store.sccs
         
         for scc_path, scc_info in scc_dict.items():
             scc_name = scc_info['SCC']
             inventory_file = scc_info.get('Inventory File', '')
-            evidence_methods = [method.lower() for method in scc_info.get('Evidence Methods', [])]
+            evidence_methods = scc_info.get('Evidence Methods', [])
             
             if 'automated' in evidence_methods:
                 passfail_status = scc_info.get('PassFail_Status', 'Ready' if inventory_file else 'Not Ready')
@@ -1280,8 +1141,8 @@ def initiate_scans(): # Scans - Button - Initiate Scans - Launches the scans for
     # Ask user if they want to launch all scans
     launch_all = messagebox.askyesno("Launch Scans", "Do you want to launch all scans?", parent=root)
     
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file)
+    store = get_progress_store() # SCC section only
+    scc_dict = store.sccs
 
     # Get inputs
     chunk_size = simpledialog.askinteger("Input", "Enter chunk size:", minvalue=1, maxvalue=100, parent=root)
@@ -1305,7 +1166,7 @@ def initiate_scans(): # Scans - Button - Initiate Scans - Launches the scans for
 
     if launch_all:
         # Original - launch all scans
-        for scc_path, scc_info in progress_data['SCC'].items():
+        for scc_path, scc_info in scc_dict.items():
             scc_name = scc_info['SCC']
             inventory_file = scc_info.get('Inventory File')
             
@@ -1313,16 +1174,16 @@ def initiate_scans(): # Scans - Button - Initiate Scans - Launches the scans for
                 print(f"Skipping {scc_name}: No inventory file found.")
                 continue
 
-            evidence_methods = [method.lower() for method in scc_info.get('Evidence Methods', [])]
+            evidence_methods = scc_info.get('Evidence Methods', [])
             
             if 'automated' in evidence_methods:
-                progress_data['SCC'][scc_path]['PassFail_Status'] = 'Queued'
+                scc_dict[scc_path]['PassFail_Status'] = 'Queued'
                 passfail_scan_name = f"TDL-{scc_name}-PassFail"
                 print(f"Initiating PassFail scan for {scc_name}")
                 src.Tenable.scan_operations.chunk_and_create_scans(client, passfail_scan_name, inventory_file, start_time, chunk_size)
             
             if 'manual-auto info' in evidence_methods:
-                progress_data['SCC'][scc_path]['Info_Status'] = 'Queued'
+                scc_dict[scc_path]['Info_Status'] = 'Queued'
                 info_scan_name = f"TDL-{scc_name}-Info"
                 print(f"Initiating Info scan for {scc_name}")
                 src.Tenable.scan_operations.chunk_and_create_scans(client, info_scan_name, inventory_file, start_time, chunk_size)
@@ -1338,10 +1199,10 @@ def initiate_scans(): # Scans - Button - Initiate Scans - Launches the scans for
 
         # Populate listbox with eligible SCCs
         eligible_sccs = []
-        for scc_path, scc_info in progress_data['SCC'].items():
+        for scc_path, scc_info in scc_dict.items():
             scc_name = scc_info['SCC']
             inventory_file = scc_info.get('Inventory File')
-            evidence_methods = [method.lower() for method in scc_info.get('Evidence Methods', [])]
+            evidence_methods = scc_info.get('Evidence Methods', [])
             
             if inventory_file and ('automated' in evidence_methods or 'manual-auto info' in evidence_methods):
                 scc_listbox.insert(tk.END, scc_name)
@@ -1357,17 +1218,17 @@ def initiate_scans(): # Scans - Button - Initiate Scans - Launches the scans for
             scc_path, scc_info = eligible_sccs[selected_idx]
             scc_name = scc_info['SCC']
             inventory_file = scc_info.get('Inventory File')
-            evidence_methods = [method.lower() for method in scc_info.get('Evidence Methods', [])]
+            evidence_methods = scc_info.get('Evidence Methods', [])
 
             # Launch scans for selected SCC
             if 'automated' in evidence_methods:
-                progress_data['SCC'][scc_path]['PassFail_Status'] = 'Queued'
+                scc_dict[scc_path]['PassFail_Status'] = 'Queued'
                 passfail_scan_name = f"TDL-{scc_name}-PassFail"
                 print(f"Initiating PassFail scan for {scc_name}")
                 src.Tenable.scan_operations.chunk_and_create_scans(client, passfail_scan_name, inventory_file, start_time, chunk_size)
             
             if 'manual-auto info' in evidence_methods:
-                progress_data['SCC'][scc_path]['Info_Status'] = 'Queued'
+                scc_dict[scc_path]['Info_Status'] = 'Queued'
                 info_scan_name = f"TDL-{scc_name}-Info"
                 print(f"Initiating Info scan for {scc_name}")
                 src.Tenable.scan_operations.chunk_and_create_scans(client, info_scan_name, inventory_file, start_time, chunk_size)
@@ -1379,8 +1240,7 @@ def initiate_scans(): # Scans - Button - Initiate Scans - Launches the scans for
         launch_btn.pack(pady=10)
 
     # Save the updated progress data
-    with open(progress_file, 'w') as file:
-        json.dump(progress_data, file, indent=4)
+    store.changed('SCC')
 
     # Update the scan list display
     populate_scan_list()
@@ -1395,12 +1255,11 @@ def populate_scan_list(): # Scans - Support - supports the initiate scans
         error_label.config(text="Please select a valid progress.json file.")
         return
 
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file)
+    store = get_progress_store() # SCC section only
 
-    for scc_path, scc_info in progress_data['SCC'].items():
+    for scc_path, scc_info in store.sccs.items():
         scc_name = scc_info['SCC']
-        evidence_methods = [method.lower() for method in scc_info.get('Evidence Methods', [])]
+        evidence_methods = scc_info.get('Evidence Methods', [])
 
         if 'automated' in evidence_methods:
             status = scc_info.get('PassFail_Status', 'Ready')
@@ -1427,14 +1286,13 @@ def refresh_report_status(): # Scans - Button - Refresh Report Status - updates
         widget.destroy()
 
     if progress_file and project_dir:
-        with open(progress_file, 'r') as file:
-            progress_data = json.load(file)
+        store = get_progress_store() # SCC section only
         
-        scc_dict = progress_data.get('SCC', {})
+        scc_dict = store.sccs
         
         for scc_path, scc_info in scc_dict.items():
             scc_name = scc_info['SCC']
-            evidence_methods = [method.lower() for method in scc_info.get('Evidence Methods', [])]
+            evidence_methods = scc_info.get('Evidence Methods', [])
             
             passfail_required = 'automated' in evidence_methods
             info_required = 'manual-auto info' in evidence_methods
@@ -1521,8 +1379,8 @@ def organize_output_files(folder_path): # Scans - Support - Gather Reports - fun
         elif file.endswith("_FailedChecks.csv"):
             os.rename(os.path.join(folder_path, file), os.path.join(failed_folder, file))
 
-def scan_required(scc_info): # check if scan is required for given SCC
-    evidence_methods = [method.lower() for method in scc_info.get('Evidence Methods', [])]
+def scan_required(scc_info, checks): # check if scan is required for given SCC; checks is the project's scc_checks.ChecksTable
+    evidence_methods = checks.methods_for(scc_info['SCC'])
     return any(method in ['automated', 'manual-auto info'] for method in evidence_methods)
 def download_reports_for_owner_gui():
     if not progress_file or not project_dir:
@@ -1568,321 +1426,323 @@ def sort_docs():
 
 ############################
 ##### BEGIN GUI SETUP ######
-#root = ThemedTk(theme="equilux")  # Dark Mode, performance impacted
-root = ThemedTk(theme="")
-root.title("TDL on Easy Mode")
-root.geometry("800x600")
-
-## Welcome screen ##############################################################################################
-welcome_screen = ttk.Frame(root)
-# Welcome label
-welcome_label = ttk.Label(welcome_screen, text="Welcome to the TDL wizard! \n\n This program is your companion through the TDL process. \n\n Where would you like to start?")
-welcome_label.pack(pady=20)
-# New project button
-new_project_button = ttk.Button(welcome_screen, text="Start New Project", command=start_new_project)
-new_project_button.pack(pady=10)
-# Existing project button
-existing_project_button = ttk.Button(welcome_screen, text="Update Existing Project", command=update_existing_project)
-existing_project_button.pack(pady=10)
-## END Welcome Screen #########################################################################################
-
-
-## Options screen #############################################################################################
-options_screen = ttk.Frame(root)
-options_screen.pack(fill="both", expand=True)
-# Main label
-options_label = ttk.Label(options_screen, text="What would you like to do?", font=("Arial", 16, "bold"))
-options_label.pack(pady=20)
-# Button frame for main actions
-button_frame = ttk.Frame(options_screen)
-button_frame.pack(pady=20)
-# Options - Row 1 - Pull Information 
-pull_info_frame = ttk.LabelFrame(button_frame, text="Pull Information", padding=10)
-pull_info_frame.pack(side="left", padx=20)
-pull_info_button = ttk.Button(pull_info_frame, text="Pull", width=15, command=pull_information)
-pull_info_button.pack(pady=5)
-pull_info_status = ttk.Label(pull_info_frame, text="Not done")
-pull_info_status.pack()
-# Options - Row 1 - Build TDL Directories
-build_dirs_frame = ttk.LabelFrame(button_frame, text="Build TDL Directories", padding=10)
-build_dirs_frame.pack(side="left", padx=20)
-build_dirs_button = ttk.Button(build_dirs_frame, text="Build", width=15, command=build_dirs)
-build_dirs_button.pack(pady=5)
-build_dirs_status = ttk.Label(build_dirs_frame, text="Not done")
-build_dirs_status.pack()
-# Options - Row 1 - Build Templates
-build_templates_frame = ttk.LabelFrame(button_frame, text="Build Templates", padding=10)
-build_templates_frame.pack(side="left", padx=20)
-build_templates_button = ttk.Button(build_templates_frame, text="Build", width=15, command=build_templates)
-build_templates_button.pack(pady=5)
-build_templates_status = ttk.Label(build_templates_frame, text="Not done")
-build_templates_status.pack()
-# Options - Row 1 - Gather and Sort Documents 
-gather_docs_frame = ttk.LabelFrame(button_frame, text="Gather and Sort Documents", padding=10)
-gather_docs_frame.pack(side="left", padx=20)
-gather_docs_button = ttk.Button(gather_docs_frame, text="Gather", width=15, command=gather_docs)
-gather_docs_button.pack(pady=5)
-gather_docs_status = ttk.Label(gather_docs_frame, text="Not done")
-gather_docs_status.pack()
-# Options - Row 1 - Generate MD Files
-generate_md_frame = ttk.LabelFrame(button_frame, text="Generate MD Files", padding=10)
-generate_md_frame.pack(side="left", padx=20)
-generate_md_button = ttk.Button(generate_md_frame, text="Generate", width=15, command=generate_md_files)
-generate_md_button.pack(pady=5)
-generate_md_status = ttk.Label(generate_md_frame, text="Not done")
-generate_md_status.pack()
-# Options - Row 1 - Update Document Tracker
-update_document_validation_frame = ttk.LabelFrame(button_frame, text="Update Document Tracker", padding=10)
-update_document_validation_frame.pack(side="left", padx=20)
-update_document_validation_button = ttk.Button(update_document_validation_frame, text="Update", width=15, command=update_document_validation)
-update_document_validation_button.pack(pady=5)
-update_document_validation_status = ttk.Label(update_document_validation_frame, text="Not done")
-update_document_validation_status.pack()
-
-# Options - Row 2 - Frame
-additional_buttons_frame = ttk.Frame(options_screen)
-additional_buttons_frame.pack(pady=20)
-# Options - Row 2 - Button - Output Progress
-output_progress_button = ttk.Button(additional_buttons_frame, text="Output progress", width=15, command=output_progress)
-output_progress_button.pack(side="left", padx=10)
-# Options - Row 2 - Button - Add or redo an SCC
-add_redo_scc_button = ttk.Button(additional_buttons_frame, text="Add or redo an SCC", width=20, command=add_or_redo_scc)
-add_redo_scc_button.pack(side="left", padx=10)
-# Options - Row 2 - Button - Remove an SCC
-remove_scc_button = ttk.Button(additional_buttons_frame, text="Remove an SCC", width=20, command=remove_scc)
-remove_scc_button.pack(side="left", padx=10)
-# Options - Row 2 - Button - Sync
-sync_button = ttk.Button(additional_buttons_frame, text="Sync", width=15, command=sync_button_click)
-sync_button.pack(side="left", padx=10)
-
-# Options - Selected Dirs - Frame
-directory_labels_frame = ttk.LabelFrame(options_screen, text="Selected Directories", padding=10)
-directory_labels_frame.pack(pady=40)
-directory_canvas = tk.Canvas(directory_labels_frame, width=800)
-directory_canvas.pack(side="left", fill="both", expand=True)
-directory_scrollbar = ttk.Scrollbar(directory_labels_frame, orient="vertical", command=directory_canvas.yview)
-directory_scrollbar.pack(side="right", fill="y")
-directory_canvas.configure(yscrollcommand=directory_scrollbar.set)
-directory_canvas.bind("<Configure>", lambda e: directory_canvas.configure(scrollregion=directory_canvas.bbox("all")))
-directory_frame = ttk.Frame(directory_canvas, width=800)
-directory_canvas.create_window((0, 0), window=directory_frame, anchor="nw")
-# Options - Selected Dirs - BPERs
-bpers_frame = ttk.Frame(directory_frame)
-bpers_frame.pack(anchor="w", pady=5)
-bpers_dir_button = ttk.Button(bpers_frame, text="Select", command=select_bpers_directory)
-bpers_dir_button.pack(side="left", padx=10)
-bpers_dir_label = ttk.Label(bpers_frame, text="BPERs Directory: Not selected")
-bpers_dir_label.pack(side="left")
-# Options - Selected Dirs - Attestations
-attestation_frame = ttk.Frame(directory_frame)
-attestation_frame.pack(anchor="w", pady=5)
-attestation_dir_button = ttk.Button(attestation_frame, text="Select", command=select_attestation_directory)
-attestation_dir_button.pack(side="left", padx=10)
-attestation_dir_label = ttk.Label(attestation_frame, text="Attestation Directory: Not selected")
-attestation_dir_label.pack(side="left")
-# Options - Selected Dirs - SupDocs
-supporting_docs_frame = ttk.Frame(directory_frame)
-supporting_docs_frame.pack(anchor="w", pady=5)
-supporting_docs_dir_button = ttk.Button(supporting_docs_frame, text="Select", command=select_supporting_docs_directory)
-supporting_docs_dir_button.pack(side="left", padx=10)
-supporting_docs_dir_label = ttk.Label(supporting_docs_frame, text="Supporting Documents Directory: Not selected")
-supporting_docs_dir_label.pack(side="left")
-# Options - Selected Dirs - SCCs
-scc_frame = ttk.Frame(directory_frame)
-scc_frame.pack(anchor="w", pady=5)
-scc_dir_button = ttk.Button(scc_frame, text="Select", command=select_scc_directory)
-scc_dir_button.pack(side="left", padx=10)
-scc_dir_label = ttk.Label(scc_frame, text="SCC Directory: Not selected")
-scc_dir_label.pack(side="left")
-# Options - Selected Dirs - Progress File
-progress_file_frame = ttk.Frame(directory_frame)
-progress_file_frame.pack(anchor="w", pady=5)
-progress_file_button = ttk.Button(progress_file_frame, text="Select", command=select_progress_file)
-progress_file_button.pack(side="left", padx=10)
-progress_file_label = ttk.Label(progress_file_frame, text="Progress File: Not selected")
-progress_file_label.pack(side="left")
-# Options - Selected Dirs - Project Dir
-project_dir_frame = ttk.Frame(directory_frame)
-project_dir_frame.pack(anchor="w", pady=5)
-project_dir_button = ttk.Button(project_dir_frame, text="Select", command=select_project_directory)
-project_dir_button.pack(side="left", padx=10)
-project_dir_label = ttk.Label(project_dir_frame, text="Project Directory: Not selected")
-project_dir_label.pack(side="left")
-# Options - Selected Dirs - Templates
-template_dir_frame = ttk.Frame(directory_frame)
-template_dir_frame.pack(anchor="w", pady=5)
-template_dir_button = ttk.Button(template_dir_frame, text="Select", command=select_template_directory)
-template_dir_button.pack(side="left", padx=10)
-template_dir_label = ttk.Label(template_dir_frame, text="Template Directory: Not selected")
-template_dir_label.pack(side="left")
-
-# Options - Buttons - Navigation
-dashboard_scans_frame = ttk.Frame(options_screen)
-dashboard_scans_frame.pack(pady=10)
-dashboard_button = ttk.Button(dashboard_scans_frame, text="Dashboard", width=15, command=show_dashboard)
-dashboard_button.pack(side="left", padx=10)
-scans_button = ttk.Button(dashboard_scans_frame, text="Scans", width=15, command=show_scans)
-scans_button.pack(side="left", padx=10)
-
-# Options - Errors - Error label  
-error_label = ttk.Label(root, text="", foreground="red")
-error_label.pack(pady=10)
-## END Options Screen ############################################################################################################
-
-## Dashboard screen ##############################################################################################################
-dashboard_screen = ttk.Frame(root)
-
-# Dashboard - Button - Back button
-back_button = ttk.Button(dashboard_screen, text="Back", width=15, command=show_options)
-back_button.pack(side="bottom", padx=10, pady=10)
-
-# Dashboard - frame - Section 1 (SCC List) 
-section1_frame = ttk.Frame(dashboard_screen)
-section1_frame.pack(side="left", fill="both", expand=True)
-section1_label = ttk.Label(section1_frame, text="SCC List (Click Me!)", font=("Arial", 12, "bold"))
-section1_label.pack(pady=10)
-scc_list_frame = ttk.Frame(section1_frame)
-scc_list_frame.pack(fill="both", expand=True)
-scc_listbox = tk.Listbox(scc_list_frame, font=("Arial", 10), selectmode="single")
-scc_listbox.pack(side="left", fill="both", expand=True)
-scc_scrollbar = ttk.Scrollbar(scc_list_frame, orient="vertical", command=scc_listbox.yview)
-scc_scrollbar.pack(side="right", fill="y")
-scc_listbox.config(yscrollcommand=scc_scrollbar.set)
-scc_listbox.bind("<Double-Button-1>", open_scc_markdown_file)
-
-# Dashboard - frame - Section 2 (Items Not Gathered)
-section2_frame = ttk.Frame(dashboard_screen)
-section2_frame.pack(side="left", fill="both", expand=True)
-section2_label = ttk.Label(section2_frame, text="Items Not Gathered", font=("Arial", 12, "bold"))
-section2_label.pack(pady=10)
-# Dashboard - area - Items Not Gathered (Attestations) 
-not_gathered_attestations_label = ttk.Label(section2_frame, text="Attestations", font=("Arial", 10, "bold"))
-not_gathered_attestations_label.pack(pady=5)
-not_gathered_attestations_listbox = tk.Listbox(section2_frame, font=("Arial", 10), selectmode="multiple")
-not_gathered_attestations_listbox.pack(fill="both", expand=True)
-attestations_buttons_frame = ttk.Frame(section2_frame)
-attestations_buttons_frame.pack(pady=5)
-mark_attestation_false_positive_button = ttk.Button(attestations_buttons_frame, text="Mark as False Positive", command=lambda: mark_as_false_positive("Attestations"))
-mark_attestation_false_positive_button.pack(side="left", padx=5)
-manually_link_attestations_button = ttk.Button(attestations_buttons_frame, text="Assign Match", command=lambda: manually_link_files("Attestations"))
-manually_link_attestations_button.pack(side="left", padx=5)
-# Dashboard - area - Items Not Gathered (BPERs)
-not_gathered_bpers_label = ttk.Label(section2_frame, text="BPERs", font=("Arial", 10, "bold"))
-not_gathered_bpers_label.pack(pady=5)
-not_gathered_bpers_listbox = tk.Listbox(section2_frame, font=("Arial", 10), selectmode="multiple")
-not_gathered_bpers_listbox.pack(fill="both", expand=True)
-bpers_buttons_frame = ttk.Frame(section2_frame)
-bpers_buttons_frame.pack(pady=5)
-mark_bper_false_positive_button = ttk.Button(bpers_buttons_frame, text="Mark as False Positive", command=lambda: mark_as_false_positive("BPERs"))
-mark_bper_false_positive_button.pack(side="left", padx=5)
-manually_link_bpers_button = ttk.Button(bpers_buttons_frame, text="Assign Match", command=lambda: manually_link_files("BPERs"))
-manually_link_bpers_button.pack(side="left", padx=5)
-# Dashboard - area - Items Not Gathered (Documents)
-not_gathered_documents_label = ttk.Label(section2_frame, text="Documents", font=("Arial", 10, "bold"))
-not_gathered_documents_label.pack(pady=5)
-not_gathered_documents_listbox = tk.Listbox(section2_frame, font=("Arial", 10), selectmode="multiple")
-not_gathered_documents_listbox.pack(fill="both", expand=True)
-documents_buttons_frame = ttk.Frame(section2_frame)
-documents_buttons_frame.pack(pady=5)
-mark_document_false_positive_button = ttk.Button(documents_buttons_frame, text="Mark as False Positive", command=lambda: mark_as_false_positive("Documents"))
-mark_document_false_positive_button.pack(side="left", padx=5)
-manually_link_documents_button = ttk.Button(documents_buttons_frame, text="Assign Match", command=lambda: manually_link_files("Documents"))
-manually_link_documents_button.pack(side="left", padx=5)
-
-# Dashboard - area- Section 3 (Dates and Chart)
-section3_frame = ttk.Frame(dashboard_screen)
-section3_frame.pack(side="left", fill="both", expand=True)
-section3_label = ttk.Label(section3_frame, text="Dates and Chart", font=("Arial", 12))
-section3_label.pack(pady=10)
-last_info_pull_label = ttk.Label(section3_frame, text="Last Info Pull: N/A", font=("Arial", 10))
-last_info_pull_label.pack(pady=5)
-last_doc_pull_label = ttk.Label(section3_frame, text="Last Doc Pull: N/A", font=("Arial", 10))
-last_doc_pull_label.pack(pady=5)
-last_checklist_generated_label = ttk.Label(section3_frame, text="Last Checklist Generated: N/A", font=("Arial", 10))
-last_checklist_generated_label.pack(pady=5)
-
-# Placeholder for the pie chart
-pie_chart_label = ttk.Label(section3_frame, text="", font=("Arial", 10), justify="center")
-pie_chart_label.pack(pady=10)
-## END Dashboard Screen #######################################################################################################################
-
-
-## Scans screen ###############################################################################################################################
-scans_screen = ttk.Frame(root)
-
-# Scans - frame
-panes_frame = ttk.Frame(scans_screen)
-panes_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-# Scans - area - Left pane (Inventory Information)
-left_pane = ttk.Frame(panes_frame, width=250)
-left_pane.pack(side="left", fill="both", expand=True, padx=(0, 10))
-inventory_content = ttk.Frame(left_pane)
-inventory_content.pack(fill="both", expand=True)
-inventory_label = ttk.Label(inventory_content, text="Inventories", font=("Arial", 14, "bold"))
-inventory_label.pack(pady=10)
-inventory_canvas = tk.Canvas(inventory_content)
-inventory_canvas.pack(side="left", fill="both", expand=True)
-inventory_scrollbar = ttk.Scrollbar(inventory_content, orient="vertical", command=inventory_canvas.yview)
-inventory_scrollbar.pack(side="right", fill="y")
-inventory_canvas.configure(yscrollcommand=inventory_scrollbar.set)
-inventory_canvas.bind("<Configure>", lambda e: inventory_canvas.configure(scrollregion=inventory_canvas.bbox("all")))
-inventory_frame = ttk.Frame(inventory_canvas)
-inventory_canvas.create_window((0, 0), window=inventory_frame, anchor="nw")
-# Scans - button - check inventories
-check_inventories_button = ttk.Button(left_pane, text="Check Inventories", width=20, command=check_inventories)
-check_inventories_button.pack(side="bottom", pady=10)
-
-# Scans -area - Middle pane (Scan Status)
-middle_pane = ttk.Frame(panes_frame, width=250)
-middle_pane.pack(side="left", fill="both", expand=True, padx=10)
-scan_content = ttk.Frame(middle_pane)
-scan_content.pack(fill="both", expand=True)
-scan_status_label = ttk.Label(scan_content, text="Scan Status", font=("Arial", 14, "bold"))
-scan_status_label.pack(pady=10)
-scan_status_canvas = tk.Canvas(scan_content)
-scan_status_canvas.pack(side="left", fill="both", expand=True)
-scan_status_scrollbar = ttk.Scrollbar(scan_content, orient="vertical", command=scan_status_canvas.yview)
-scan_status_scrollbar.pack(side="right", fill="y")
-scan_status_canvas.configure(yscrollcommand=scan_status_scrollbar.set)
-scan_status_canvas.bind("<Configure>", lambda e: scan_status_canvas.configure(scrollregion=scan_status_canvas.bbox("all")))
-scan_status_frame = ttk.Frame(scan_status_canvas)
-scan_status_canvas.create_window((0, 0), window=scan_status_frame, anchor="nw")
-# Scans - button - initiate scans
-initiate_scans_button = ttk.Button(middle_pane, text="Initiate Scans", width=20, command=initiate_scans)
-initiate_scans_button.pack(side="bottom", pady=10)
-
-# Scans - area - Right pane (Report Status)
-right_pane = ttk.Frame(panes_frame, width=250)
-right_pane.pack(side="left", fill="both", expand=True, padx=(10, 0))
-report_content = ttk.Frame(right_pane)
-report_content.pack(fill="both", expand=True)
-report_status_label = ttk.Label(report_content, text="Report Status", font=("Arial", 14, "bold"))
-report_status_label.pack(pady=10)
-report_status_canvas = tk.Canvas(report_content)
-report_status_canvas.pack(side="left", fill="both", expand=True)
-report_status_scrollbar = ttk.Scrollbar(report_content, orient="vertical", command=report_status_canvas.yview)
-report_status_scrollbar.pack(side="right", fill="y")
-report_status_canvas.configure(yscrollcommand=report_status_scrollbar.set)
-report_status_canvas.bind("<Configure>", lambda e: report_status_canvas.configure(scrollregion=report_status_canvas.bbox("all")))
-report_status_frame = ttk.Frame(report_status_canvas)
-report_status_canvas.create_window((0, 0), window=report_status_frame, anchor="nw")
-# Scans - button - refresh report status
-button_frame = ttk.Frame(right_pane)
-button_frame.pack(side="bottom", pady=10)
-refresh_report_status_button = ttk.Button(button_frame, text="Refresh Report Status", width=20, command=refresh_report_status)
-refresh_report_status_button.pack(side="left", padx=5)
-# Scans - button - gather reports
-gather_reports_button = ttk.Button(button_frame, text="Gather Reports", width=20, command=gather_reports)
-gather_reports_button.pack(side="left", padx=5)
-
-# Scans - button - back 
-back_button = ttk.Button(scans_screen, text="Back", width=15, command=show_options)
-back_button.pack(side="bottom", padx=10, pady=10)
-## END Scans Screen ############################################################################################################################
-
-#######################
-#### START THE GUI ####
-show_welcome()
-root.mainloop()
+if __name__ == "__main__": # SCC worker processes re-import this file on Windows; only the real launch builds the GUI
+    #root = ThemedTk(theme="equilux")  # Dark Mode, performance impacted
+    root = ThemedTk(theme="")
+    root.title("TDL on Easy Mode")
+    root.geometry("800x600")
+
+    ## Welcome screen ##############################################################################################
+    welcome_screen = ttk.Frame(root)
+    # Welcome label
+    welcome_label = ttk.Label(welcome_screen, text="Welcome to the TDL wizard! \n\n This program is your companion through the TDL process. \n\n Where would you like to start?")
+    welcome_label.pack(pady=20)
+    # New project button
+    new_project_button = ttk.Button(welcome_screen, text="Start New Project", command=start_new_project)
+    new_project_button.pack(pady=10)
+    # Existing project button
+    existing_project_button = ttk.Button(welcome_screen, text="Update Existing Project", command=update_existing_project)
+    existing_project_button.pack(pady=10)
+    ## END Welcome Screen #########################################################################################
+
+
+    ## Options screen #############################################################################################
+    options_screen = ttk.Frame(root)
+    options_screen.pack(fill="both", expand=True)
+    # Main label
+    options_label = ttk.Label(options_screen, text="What would you like to do?", font=("Arial", 16, "bold"))
+    options_label.pack(pady=20)
+    # Button frame for main actions
+    button_frame = ttk.Frame(options_screen)
+    button_frame.pack(pady=20)
+    # Options - Row 1 - Pull Information 
+    pull_info_frame = ttk.LabelFrame(button_frame, text="Pull Information", padding=10)
+    pull_info_frame.pack(side="left", padx=20)
+    pull_info_button = ttk.Button(pull_info_frame, text="Pull", width=15, command=pull_information)
+    pull_info_button.pack(pady=5)
+    pull_info_status = ttk.Label(pull_info_frame, text="Not done")
+    pull_info_status.pack()
+    # Options - Row 1 - Build TDL Directories
+    build_dirs_frame = ttk.LabelFrame(button_frame, text="Build TDL Directories", padding=10)
+    build_dirs_frame.pack(side="left", padx=20)
+    build_dirs_button = ttk.Button(build_dirs_frame, text="Build", width=15, command=build_dirs)
+    build_dirs_button.pack(pady=5)
+    build_dirs_status = ttk.Label(build_dirs_frame, text="Not done")
+    build_dirs_status.pack()
+    # Options - Row 1 - Build Templates
+    build_templates_frame = ttk.LabelFrame(button_frame, text="Build Templates", padding=10)
+    build_templates_frame.pack(side="left", padx=20)
+    build_templates_button = ttk.Button(build_templates_frame, text="Build", width=15, command=build_templates)
+    build_templates_button.pack(pady=5)
+    build_templates_status = ttk.Label(build_templates_frame, text="Not done")
+    build_templates_status.pack()
+    # Options - Row 1 - Gather and Sort Documents 
+    gather_docs_frame = ttk.LabelFrame(button_frame, text="Gather and Sort Documents", padding=10)
+    gather_docs_frame.pack(side="left", padx=20)
+    gather_docs_button = ttk.Button(gather_docs_frame, text="Gather", width=15, command=gather_docs)
+    gather_docs_button.pack(pady=5)
+    gather_docs_status = ttk.Label(gather_docs_frame, text="Not done")
+    gather_docs_status.pack()
+    # Options - Row 1 - Generate MD Files
+    generate_md_frame = ttk.LabelFrame(button_frame, text="Generate MD Files", padding=10)
+    generate_md_frame.pack(side="left", padx=20)
+    generate_md_button = ttk.Button(generate_md_frame, text="Generate", width=15, command=generate_md_files)
+    generate_md_button.pack(pady=5)
+    generate_md_status = ttk.Label(generate_md_frame, text="Not done")
+    generate_md_status.pack()
+    # Options - Row 1 - Update Document Tracker
+    update_document_validation_frame = ttk.LabelFrame(button_frame, text="Update Document Tracker", padding=10)
+    update_document_validation_frame.pack(side="left", padx=20)
+    update_document_validation_button = ttk.Button(update_document_validation_frame, text="Update", width=15, command=update_document_validation)
+    update_document_validation_button.pack(pady=5)
+    update_document_validation_status = ttk.Label(update_document_validation_frame, text="Not done")
+    update_document_validation_status.pack()
+
+    # Options - Row 2 - Frame
+    additional_buttons_frame = ttk.Frame(options_screen)
+    additional_buttons_frame.pack(pady=20)
+    # Options - Row 2 - Button - Output Progress
+    output_progress_button = ttk.Button(additional_buttons_frame, text="Output progress", width=15, command=output_progress)
+    output_progress_button.pack(side="left", padx=10)
+    # Options - Row 2 - Button - Add or redo an SCC
+    add_redo_scc_button = ttk.Button(additional_buttons_frame, text="Add or redo an SCC", width=20, command=add_or_redo_scc)
+    add_redo_scc_button.pack(side="left", padx=10)
+    # Options - Row 2 - Button - Remove an SCC
+    remove_scc_button = ttk.Button(additional_buttons_frame, text="Remove an SCC", width=20, command=remove_scc)
+    remove_scc_button.pack(side="left", padx=10)
+    # Options - Row 2 - Button - Sync
+    sync_button = ttk.Button(additional_buttons_frame, text="Sync", width=15, command=sync_button_click)
+    sync_button.pack(side="left", padx=10)
+
+    # Options - Selected Dirs - Frame
+    directory_labels_frame = ttk.LabelFrame(options_screen, text="Selected Directories", padding=10)
+    directory_labels_frame.pack(pady=40)
+    directory_canvas = tk.Canvas(directory_labels_frame, width=800)
+    directory_canvas.pack(side="left", fill="both", expand=True)
+    directory_scrollbar = ttk.Scrollbar(directory_labels_frame, orient="vertical", command=directory_canvas.yview)
+    directory_scrollbar.pack(side="right", fill="y")
+    directory_canvas.configure(yscrollcommand=directory_scrollbar.set)
+    directory_canvas.bind("<Configure>", lambda e: directory_canvas.configure(scrollregion=directory_canvas.bbox("all")))
+    directory_frame = ttk.Frame(directory_canvas, width=800)
+    directory_canvas.create_window((0, 0), window=directory_frame, anchor="nw")
+    # Options - Selected Dirs - BPERs
+    bpers_frame = ttk.Frame(directory_frame)
+    bpers_frame.pack(anchor="w", pady=5)
+    bpers_dir_button = ttk.Button(bpers_frame, text="Select", command=select_bpers_directory)
+    bpers_dir_button.pack(side="left", padx=10)
+    bpers_dir_label = ttk.Label(bpers_frame, text="BPERs Directory: Not selected")
+    bpers_dir_label.pack(side="left")
+    # Options - Selected Dirs - Attestations
+    attestation_frame = ttk.Frame(directory_frame)
+    attestation_frame.pack(anchor="w", pady=5)
+    attestation_dir_button = ttk.Button(attestation_frame, text="Select", command=select_attestation_directory)
+    attestation_dir_button.pack(side="left", padx=10)
+    attestation_dir_label = ttk.Label(attestation_frame, text="Attestation Directory: Not selected")
+    attestation_dir_label.pack(side="left")
+    # Options - Selected Dirs - SupDocs
+    supporting_docs_frame = ttk.Frame(directory_frame)
+    supporting_docs_frame.pack(anchor="w", pady=5)
+    supporting_docs_dir_button = ttk.Button(supporting_docs_frame, text="Select", command=select_supporting_docs_directory)
+    supporting_docs_dir_button.pack(side="left", padx=10)
+    supporting_docs_dir_label = ttk.Label(supporting_docs_frame, text="Supporting Documents Directory: Not selected")
+    supporting_docs_dir_label.pack(side="left")
+    # Options - Selected Dirs - SCCs
+    scc_frame = ttk.Frame(directory_frame)
+    scc_frame.pack(anchor="w", pady=5)
+    scc_dir_button = ttk.Button(scc_frame, text="Select", command=select_scc_directory)
+    scc_dir_button.pack(side="left", padx=10)
+    scc_dir_label = ttk.Label(scc_frame, text="SCC Directory: Not selected")
+    scc_dir_label.pack(side="left")
+    # Options - Selected Dirs - Progress File
+    progress_file_frame = ttk.Frame(directory_frame)
+    progress_file_frame.pack(anchor="w", pady=5)
+    progress_file_button = ttk.Button(progress_file_frame, text="Select", command=select_progress_file)
+    progress_file_button.pack(side="left", padx=10)
+    progress_file_label = ttk.Label(progress_file_frame, text="Progress File: Not selected")
+    progress_file_label.pack(side="left")
+    # Options - Selected Dirs - Project Dir
+    project_dir_frame = ttk.Frame(directory_frame)
+    project_dir_frame.pack(anchor="w", pady=5)
+    project_dir_button = ttk.Button(project_dir_frame, text="Select", command=select_project_directory)
+    project_dir_button.pack(side="left", padx=10)
+    project_dir_label = ttk.Label(project_dir_frame, text="Project Directory: Not selected")
+    project_dir_label.pack(side="left")
+    # Options - Selected Dirs - Templates
+    template_dir_frame = ttk.Frame(directory_frame)
+    template_dir_frame.pack(anchor="w", pady=5)
+    template_dir_button = ttk.Button(template_dir_frame, text="Select", command=select_template_directory)
+    template_dir_button.pack(side="left", padx=10)
+    template_dir_label = ttk.Label(template_dir_frame, text="Template Directory: Not selected")
+    template_dir_label.pack(side="left")
+
+    # Options - Buttons - Navigation
+    dashboard_scans_frame = ttk.Frame(options_screen)
+    dashboard_scans_frame.pack(pady=10)
+    dashboard_button = ttk.Button(dashboard_scans_frame, text="Dashboard", width=15, command=show_dashboard)
+    dashboard_button.pack(side="left", padx=10)
+    scans_button = ttk.Button(dashboard_scans_frame, text="Scans", width=15, command=show_scans)
+    scans_button.pack(side="left", padx=10)
+
+    # Options - Errors - Error label  
+    error_label = ttk.Label(root, text="", foreground="red")
+    error_label.pack(pady=10)
+    ## END Options Screen ############################################################################################################
+
+    ## Dashboard screen ##############################################################################################################
+    dashboard_screen = ttk.Frame(root)
+
+    # Dashboard - Button - Back button
+    back_button = ttk.Button(dashboard_screen, text="Back", width=15, command=show_options)
+    back_button.pack(side="bottom", padx=10, pady=10)
+
+    # Dashboard - frame - Section 1 (SCC List) 
+    section1_frame = ttk.Frame(dashboard_screen)
+    section1_frame.pack(side="left", fill="both", expand=True)
+    section1_label = ttk.Label(section1_frame, text="SCC List (Click Me!)", font=("Arial", 12, "bold"))
+    section1_label.pack(pady=10)
+    scc_list_frame = ttk.Frame(section1_frame)
+    scc_list_frame.pack(fill="both", expand=True)
+    scc_listbox = tk.Listbox(scc_list_frame, font=("Arial", 10), selectmode="single")
+    scc_listbox.pack(side="left", fill="both", expand=True)
+    scc_scrollbar = ttk.Scrollbar(scc_list_frame, orient="vertical", command=scc_listbox.yview)
+    scc_scrollbar.pack(side="right", fill="y")
+    scc_listbox.config(yscrollcommand=scc_scrollbar.set)
+    scc_listbox.bind("<Double-Button-1>", open_scc_markdown_file)
+
+    # Dashboard - frame - Section 2 (Items Not Gathered)
+    section2_frame = ttk.Frame(dashboard_screen)
+    section2_frame.pack(side="left", fill="both", expand=True)
+    section2_label = ttk.Label(section2_frame, text="Items Not Gathered", font=("Arial", 12, "bold"))
+    section2_label.pack(pady=10)
+    # Dashboard - area - Items Not Gathered (Attestations) 
+    not_gathered_attestations_label = ttk.Label(section2_frame, text="Attestations", font=("Arial", 10, "bold"))
+    not_gathered_attestations_label.pack(pady=5)
+    not_gathered_attestations_listbox = tk.Listbox(section2_frame, font=("Arial", 10), selectmode="multiple")
+    not_gathered_attestations_listbox.pack(fill="both", expand=True)
+    attestations_buttons_frame = ttk.Frame(section2_frame)
+    attestations_buttons_frame.pack(pady=5)
+    mark_attestation_false_positive_button = ttk.Button(attestations_buttons_frame, text="Mark as False Positive", command=lambda: mark_as_false_positive("Attestations"))
+    mark_attestation_false_positive_button.pack(side="left", padx=5)
+    manually_link_attestations_button = ttk.Button(attestations_buttons_frame, text="Assign Match", command=lambda: manually_link_files("Attestations"))
+    manually_link_attestations_button.pack(side="left", padx=5)
+    # Dashboard - area - Items Not Gathered (BPERs)
+    not_gathered_bpers_label = ttk.Label(section2_frame, text="BPERs", font=("Arial", 10, "bold"))
+    not_gathered_bpers_label.pack(pady=5)
+    not_gathered_bpers_listbox = tk.Listbox(section2_frame, font=("Arial", 10), selectmode="multiple")
+    not_gathered_bpers_listbox.pack(fill="both", expand=True)
+    bpers_buttons_frame = ttk.Frame(section2_frame)
+    bpers_buttons_frame.pack(pady=5)
+    mark_bper_false_positive_button = ttk.Button(bpers_buttons_frame, text="Mark as False Positive", command=lambda: mark_as_false_positive("BPERs"))
+    mark_bper_false_positive_button.pack(side="left", padx=5)
+    manually_link_bpers_button = ttk.Button(bpers_buttons_frame, text="Assign Match", command=lambda: manually_link_files("BPERs"))
+    manually_link_bpers_button.pack(side="left", padx=5)
+    # Dashboard - area - Items Not Gathered (Documents)
+    not_gathered_documents_label = ttk.Label(section2_frame, text="Documents", font=("Arial", 10, "bold"))
+    not_gathered_documents_label.pack(pady=5)
+    not_gathered_documents_listbox = tk.Listbox(section2_frame, font=("Arial", 10), selectmode="multiple")
+    not_gathered_documents_listbox.pack(fill="both", expand=True)
+    documents_buttons_frame = ttk.Frame(section2_frame)
+    documents_buttons_frame.pack(pady=5)
+    mark_document_false_positive_button = ttk.Button(documents_buttons_frame, text="Mark as False Positive", command=lambda: mark_as_false_positive("Documents"))
+    mark_document_false_positive_button.pack(side="left", padx=5)
+    manually_link_documents_button = ttk.Button(documents_buttons_frame, text="Assign Match", command=lambda: manually_link_files("Documents"))
+    manually_link_documents_button.pack(side="left", padx=5)
+
+    # Dashboard - area- Section 3 (Dates and Chart)
+    section3_frame = ttk.Frame(dashboard_screen)
+    section3_frame.pack(side="left", fill="both", expand=True)
+    section3_label = ttk.Label(section3_frame, text="Dates and Chart", font=("Arial", 12))
+    section3_label.pack(pady=10)
+    last_info_pull_label = ttk.Label(section3_frame, text="Last Info Pull: N/A", font=("Arial", 10))
+    last_info_pull_label.pack(pady=5)
+    last_doc_pull_label = ttk.Label(section3_frame, text="Last Doc Pull: N/A", font=("Arial", 10))
+    last_doc_pull_label.pack(pady=5)
+    last_checklist_generated_label = ttk.Label(section3_frame, text="Last Checklist Generated: N/A", font=("Arial", 10))
+    last_checklist_generated_label.pack(pady=5)
+
+    # Placeholder for the pie chart
+    pie_chart_label = ttk.Label(section3_frame, text="", font=("Arial", 10), justify="center")
+    pie_chart_label.pack(pady=10)
+    ## END Dashboard Screen #######################################################################################################################
+
+
+    ## Scans screen ###############################################################################################################################
+    scans_screen = ttk.Frame(root)
+
+    # Scans - frame
+    panes_frame = ttk.Frame(scans_screen)
+    panes_frame.pack(fill="both", expand=True, padx=20, pady=10)
+
+    # Scans - area - Left pane (Inventory Information)
+    left_pane = ttk.Frame(panes_frame, width=250)
+    left_pane.pack(side="left", fill="both", expand=True, padx=(0, 10))
+    inventory_content = ttk.Frame(left_pane)
+    inventory_content.pack(fill="both", expand=True)
+    inventory_label = ttk.Label(inventory_content, text="Inventories", font=("Arial", 14, "bold"))
+    inventory_label.pack(pady=10)
+    inventory_canvas = tk.Canvas(inventory_content)
+    inventory_canvas.pack(side="left", fill="both", expand=True)
+    inventory_scrollbar = ttk.Scrollbar(inventory_content, orient="vertical", command=inventory_canvas.yview)
+    inventory_scrollbar.pack(side="right", fill="y")
+    inventory_canvas.configure(yscrollcommand=inventory_scrollbar.set)
+    inventory_canvas.bind("<Configure>", lambda e: inventory_canvas.configure(scrollregion=inventory_canvas.bbox("all")))
+    inventory_frame = ttk.Frame(inventory_canvas)
+    inventory_canvas.create_window((0, 0), window=inventory_frame, anchor="nw")
+    # Scans - button - check inventories
+    check_inventories_button = ttk.Button(left_pane, text="Check Inventories", width=20, command=check_inventories)
+    check_inventories_button.pack(side="bottom", pady=10)
+
+    # Scans -area - Middle pane (Scan Status)
+    middle_pane = ttk.Frame(panes_frame, width=250)
+    middle_pane.pack(side="left", fill="both", expand=True, padx=10)
+    scan_content = ttk.Frame(middle_pane)
+    scan_content.pack(fill="both", expand=True)
+    scan_status_label = ttk.Label(scan_content, text="Scan Status", font=("Arial", 14, "bold"))
+    scan_status_label.pack(pady=10)
+    scan_status_canvas = tk.Canvas(scan_content)
+    scan_status_canvas.pack(side="left", fill="both", expand=True)
+    scan_status_scrollbar = ttk.Scrollbar(scan_content, orient="vertical", command=scan_status_canvas.yview)
+    scan_status_scrollbar.pack(side="right", fill="y")
+    scan_status_canvas.configure(yscrollcommand=scan_status_scrollbar.set)
+    scan_status_canvas.bind("<Configure>", lambda e: scan_status_canvas.configure(scrollregion=scan_status_canvas.bbox("all")))
+    scan_status_frame = ttk.Frame(scan_status_canvas)
+    scan_status_canvas.create_window((0, 0), window=scan_status_frame, anchor="nw")
+    # Scans - button - initiate scans
+    initiate_scans_button = ttk.Button(middle_pane, text="Initiate Scans", width=20, command=initiate_scans)
+    initiate_scans_button.pack(side="bottom", pady=10)
+
+    # Scans - area - Right pane (Report Status)
+    right_pane = ttk.Frame(panes_frame, width=250)
+    right_pane.pack(side="left", fill="both", expand=True, padx=(10, 0))
+    report_content = ttk.Frame(right_pane)
+    report_content.pack(fill="both", expand=True)
+    report_status_label = ttk.Label(report_content, text="Report Status", font=("Arial", 14, "bold"))
+    report_status_label.pack(pady=10)
+    report_status_canvas = tk.Canvas(report_content)
+    report_status_canvas.pack(side="left", fill="both", expand=True)
+    report_status_scrollbar = ttk.Scrollbar(report_content, orient="vertical", command=report_status_canvas.yview)
+    report_status_scrollbar.pack(side="right", fill="y")
+    report_status_canvas.configure(yscrollcommand=report_status_scrollbar.set)
+    report_status_canvas.bind("<Configure>", lambda e: report_status_canvas.configure(scrollregion=report_status_canvas.bbox("all")))
+    report_status_frame = ttk.Frame(report_status_canvas)
+    report_status_canvas.create_window((0, 0), window=report_status_frame, anchor="nw")
+    # Scans - button - refresh report status
+    button_frame = ttk.Frame(right_pane)
+    button_frame.pack(side="bottom", pady=10)
+    refresh_report_status_button = ttk.Button(button_frame, text="Refresh Report Status", width=20, command=refresh_report_status)
+    refresh_report_status_button.pack(side="left", padx=5)
+    # Scans - button - gather reports
+    gather_reports_button = ttk.Button(button_frame, text="Gather Reports", width=20, command=gather_reports)
+    gather_reports_button.pack(side="left", padx=5)
+
+    # Scans - button - back 
+    back_button = ttk.Button(scans_screen, text="Back", width=15, command=show_options)
+    back_button.pack(side="bottom", padx=10, pady=10)
+    ## END Scans Screen ############################################################################################################################
+
+    #######################
+    #### START THE GUI ####
+    show_welcome()
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    root.mainloop()
 #######################
@@ -0,0 +1,79 @@
+"""Benchmark for scc_check.regex_match_with_diff against the original slice-by-slice matcher.
+
+Builds paragraph-length first sheet cells (the kind found in SCC guidance text), checks that both
+matchers agree on every cell for the four first sheet patterns, then times them.
+
+Usage (from the repo root):
+    python scripts/bench_regex_match.py --cells 50 --length 800
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.SCC.scc_check import regex_match_with_diff
+
+PATTERNS = [ # (pattern, max_diff) exactly as process_scc_file uses them
+    (re.compile(r'SCM\d+', re.IGNORECASE), 0),
+    (re.compile(r'SCC Guidance Source', re.IGNORECASE), 5),
+    (re.compile(r'SCC Policy and Procedures Source', re.IGNORECASE), 5),
+    (re.compile(r'SCC System Scope', re.IGNORECASE), 3),
+]
+
+WORDS = ("the system shall be configured per the applicable security technical implementation guide "
+         "and all deviations documented by the control owner within the review period scope source").split()
+
+def slice_match_with_diff(pattern, text, max_diff):
+    """Original implementation: fullmatch on every slice text[i:j]."""
+    for i in range(len(text) - max_diff + 1):
+        for j in range(i + 1, len(text) + 1):
+            if pattern.fullmatch(text[i:j]):
+                return True
+    return False
+
+def build_cells(count, length, seed=1):
+    """Free-text cells of roughly `length` characters; some contain one of the patterns somewhere."""
+    rng = random.Random(seed)
+    needles = ['SCM1042', 'SCC Guidance Source', 'SCC Policy and Procedures Source', 'SCC System Scope']
+    cells = []
+    for _ in range(count):
+        words = []
+        while sum(len(w) + 1 for w in words) < length:
+            words.append(rng.choice(WORDS))
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(needles))
+        cells.append(' '.join(words))
+    return cells
+
+def time_matcher(matcher, cells):
+    start = time.perf_counter()
+    results = [matcher(pattern, cell, max_diff) for cell in cells for pattern, max_diff in PATTERNS]
+    return time.perf_counter() - start, results
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark regex_match_with_diff on long free-text cells.')
+    parser.add_argument('--cells', type=int, default=20, help='Number of cells to generate')
+    parser.add_argument('--length', type=int, default=600, help='Approximate characters per cell')
+    args = parser.parse_args()
+
+    cells = build_cells(args.cells, args.length)
+    old_time, old_results = time_matcher(slice_match_with_diff, cells)
+    new_time, new_results = time_matcher(regex_match_with_diff, cells)
+
+    if old_results != new_results:
+        mismatches = sum(1 for a, b in zip(old_results, new_results) if a != b)
+        print(f"MISMATCH: {mismatches} of {len(old_results)} results differ")
+        sys.exit(1)
+
+    print(f"{args.cells} cells x {len(PATTERNS)} patterns, ~{args.length} chars per cell, results identical")
+    print(f"  slice matcher:  {old_time:.4f}s")
+    print(f"  search matcher: {new_time:.4f}s")
+    print(f"  speedup:        {old_time / new_time:.0f}x" if new_time else "  speedup: n/a")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Benchmark suite for SCC parsing (scc_read, scc_check, scc_analyze, scc_validate) on synthetic SCCs.
+
+Builds a directory of synthetic SCCs with src/SCC/scc_synth.py (or uses an existing directory), runs each
+benchmark over every file and reports seconds per file, data rows per second and peak Python memory
+(tracemalloc, measured on a separate untimed pass). Results can be saved as a baseline JSON and later
+runs compared against it; anything slower or hungrier than the baseline by more than the tolerance is
+reported as a regression and the script exits 1.
+
+Baselines are only comparable on the same machine with the same synthetic settings; the settings are
+stored with the baseline and a mismatch is warned about.
+
+Usage (from the repo root):
+    python scripts/bench_scc_parsing.py --files 5 --rows 2000 --phantom-rows 20000 --save-baseline bench_baseline.json
+    python scripts/bench_scc_parsing.py --files 5 --rows 2000 --phantom-rows 20000 --baseline bench_baseline.json
+    python scripts/bench_scc_parsing.py --directory path/to/SCCs --only analyze/xml
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.SCC import scc_analyze, scc_check, scc_read, scc_schema, scc_synth, scc_validate
+from src.SCC.scc_ingest import list_scc_files
+
+BENCHMARKS = { # name -> function run on each file
+    'read/streaming': lambda file_path: scc_read.process_excel_file(file_path, 'streaming'),
+    'read/xml': lambda file_path: scc_read.process_excel_file(file_path, 'xml'),
+    'read/cell': lambda file_path: scc_read.process_excel_file(file_path, 'cell'),
+    'check/streaming': lambda file_path: scc_check.process_scc_file(file_path, 'streaming'),
+    'check/xml': lambda file_path: scc_check.process_scc_file(file_path, 'xml'),
+    'analyze/streaming': lambda file_path: scc_analyze.analyze_scc_file(file_path, 'streaming'),
+    'analyze/xml': lambda file_path: scc_analyze.analyze_scc_file(file_path, 'xml'),
+    'validate/xml': lambda file_path: scc_validate.validate_scc_file(file_path, 'xml'),
+}
+METRICS = ('seconds_per_file', 'peak_mb') # lower is better; rows_per_second follows seconds_per_file
+
+def count_data_rows(file_path):
+    """Data rows (up to the last row with something in a key column) across the check sheets."""
+    workbook = scc_read.read_excel(file_path, read_only=True)
+    if workbook is None:
+        return 0
+    try:
+        total = 0
+        for sheet_name, schema in scc_schema.sheet_schemas(workbook).items():
+            key_cols = [1] + [col for col in schema.columns if col is not None]
+            total += scc_read.find_last_data_row(workbook[sheet_name], key_cols) - 1
+        return total
+    finally:
+        workbook.close()
+
+def run_benchmark(function, file_paths, repeat):
+    """Best wall time over repeat runs, then peak traced memory of one more run."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for file_path in file_paths:
+                function(file_path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for file_path in file_paths:
+                function(file_path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Regression messages for every metric more than tolerance worse than the baseline."""
+    regressions = []
+    for name, metrics in results.items():
+        expected = baseline.get('results', {}).get(name)
+        if not expected:
+            continue
+        for metric in METRICS:
+            if expected.get(metric) and metrics[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(f"{name} {metric}: {metrics[metric]:.4g} vs baseline {expected[metric]:.4g} (+{metrics[metric] / expected[metric] - 1:.0%})")
+    return regressions
+
+def main():
+    defaults = scc_synth.SynthConfig()
+    parser = argparse.ArgumentParser(description='Benchmark SCC parsing on synthetic (or existing) SCC workbooks.')
+    parser.add_argument('--directory', type=str, help='Use the SCCs in this directory instead of generating them')
+    parser.add_argument('--files', type=int, default=3, help='Synthetic SCCs to generate')
+    parser.add_argument('--sheets', type=int, default=defaults.sheets, help='Check sheets per synthetic SCC')
+    parser.add_argument('--rows', type=int, default=defaults.rows, help='Data rows per check sheet')
+    parser.add_argument('--phantom-rows', type=int, default=defaults.phantom_rows, help='Formatted empty rows after the data')
+    parser.add_argument('--long-text-length', type=int, default=defaults.long_text_length, help='Characters in long free-text cells')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='Benchmarks to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per benchmark (best is reported)')
+    parser.add_argument('--baseline', type=str, help='Baseline JSON to check for regressions against')
+    parser.add_argument('--save-baseline', type=str, help='Write these results to a baseline JSON')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown / memory growth over the baseline (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING) # scc_read logs every BPER
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.directory:
+            directory = args.directory
+            settings = {'directory': os.path.abspath(directory)}
+        else:
+            directory = temp_dir
+            config = defaults._replace(sheets=args.sheets, rows=args.rows, phantom_rows=args.phantom_rows, long_text_length=args.long_text_length)
+            settings = {'files': args.files, **config._asdict()}
+            settings.pop('review_date')
+            print(f"Generating {args.files} synthetic SCCs ({args.sheets} sheets x {args.rows} rows, {args.phantom_rows} phantom rows)")
+            scc_synth.generate_scc_directory(directory, args.files, config)
+
+        file_paths = list_scc_files(directory)
+        if not file_paths:
+            print(f"No SCC files in {directory}")
+            sys.exit(1)
+        data_rows = sum(count_data_rows(file_path) for file_path in file_paths)
+        print(f"{len(file_paths)} files, {data_rows} data rows\n")
+
+        results = {}
+        print(f"{'benchmark':<20}{'s/file':>10}{'rows/s':>12}{'peak MB':>10}")
+        for name in args.only or BENCHMARKS:
+            seconds, peak = run_benchmark(BENCHMARKS[name], file_paths, args.repeat)
+            results[name] = {
+                'seconds_per_file': seconds / len(file_paths),
+                'rows_per_second': data_rows / seconds if seconds else 0.0,
+                'peak_mb': peak / 2**20,
+            }
+            print(f"{name:<20}{results[name]['seconds_per_file']:>10.4f}{results[name]['rows_per_second']:>12.0f}{results[name]['peak_mb']:>10.1f}")
+
+    failed = False
+    if args.baseline:
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)
+        if baseline.get('settings') != settings:
+            print("\nWarning: baseline was recorded with different settings, comparison may not mean much")
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        print(f"\n{len(regressions)} regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+        for message in regressions:
+            print(f"  {message}")
+        failed = bool(regressions)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as file:
+            json.dump({'settings': settings, 'results': results}, file, indent=4)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
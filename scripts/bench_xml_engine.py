@@ -0,0 +1,98 @@
+"""Parity check and benchmark for the direct-XML SCC reader (src/SCC/scc_xml.py) against openpyxl.
+
+For every .xlsx in the directory it checks, sheet by sheet, that XmlSheet.iter_rows returns exactly what
+openpyxl's read-only iter_rows does (whole sheet, header row, and a bounded column range), then that
+analyze_scc_file gives identical dictionaries with both engines. Then it times both engines.
+Exits 1 if anything differs. check_xml_engine.py runs the same comparison on generated workbooks, with no SCCs needed.
+
+Usage (from the repo root):
+    python scripts/bench_xml_engine.py path/to/SCCs --repeat 3
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.SCC import scc_read, scc_xml
+from src.SCC.scc_analyze import analyze_scc_file
+from src.SCC.scc_ingest import list_scc_files
+
+ROW_RANGES = [ # iter_rows arguments the SCC code actually uses
+    {},
+    {'min_row': 1, 'max_row': 1, 'max_col': 50},
+    {'min_row': 1, 'max_row': 150},
+    {'min_row': 2, 'min_col': 1, 'max_col': 7},
+]
+
+def compare_sheets(file_path):
+    """Differences between openpyxl and XmlSheet rows for one file (empty list if identical)."""
+    problems = []
+    try:
+        xml_workbook = scc_xml.XmlWorkbook(file_path)
+    except scc_xml.XmlWorkbookUnsupported as e:
+        return [f"falls back to openpyxl: {e}"]
+    openpyxl_workbook = scc_read.read_excel(file_path, read_only=True)
+    try:
+        if xml_workbook.sheetnames != openpyxl_workbook.sheetnames:
+            return [f"sheet names differ: {xml_workbook.sheetnames} vs {openpyxl_workbook.sheetnames}"]
+        for sheet_name in openpyxl_workbook.sheetnames:
+            for kwargs in ROW_RANGES:
+                expected = list(openpyxl_workbook[sheet_name].iter_rows(values_only=True, **kwargs))
+                actual = list(xml_workbook[sheet_name].iter_rows(values_only=True, **kwargs))
+                if expected != actual:
+                    problems.append(f"{sheet_name} {kwargs or 'all rows'}: rows differ")
+    finally:
+        xml_workbook.close()
+        openpyxl_workbook.close()
+    return problems
+
+def time_engine(file_paths, engine, repeat):
+    """Best wall time of analyzing every file with an engine, plus the results from the last run."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = [analyze_scc_file(file_path, engine) for file_path in file_paths]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the direct-XML SCC reader with openpyxl.')
+    parser.add_argument('directory', type=str, help='Directory of SCC .xlsx files')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing runs per engine (best is reported)')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO) # scc_read logs every BPER
+    file_paths = [file_path for file_path in list_scc_files(args.directory) if file_path.endswith('.xlsx')]
+    if not file_paths:
+        print(f"No .xlsx files in {args.directory}")
+        sys.exit(1)
+
+    failed = False
+    for file_path in file_paths:
+        for problem in compare_sheets(file_path):
+            failed = failed or not problem.startswith('falls back')
+            print(f"{os.path.basename(file_path)}: {problem}")
+
+    openpyxl_time, openpyxl_results = time_engine(file_paths, 'streaming', args.repeat)
+    xml_time, xml_results = time_engine(file_paths, 'xml', args.repeat)
+    for file_path, expected, actual in zip(file_paths, openpyxl_results, xml_results):
+        if expected != actual:
+            failed = True
+            print(f"{os.path.basename(file_path)}: analyze_scc_file results differ")
+
+    print(f"{len(file_paths)} files, {'MISMATCHES FOUND' if failed else 'results identical'}")
+    print(f"  openpyxl read-only: {openpyxl_time:.3f}s")
+    print(f"  direct XML:         {xml_time:.3f}s")
+    print(f"  speedup:            {openpyxl_time / xml_time:.1f}x" if xml_time else "  speedup: n/a")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
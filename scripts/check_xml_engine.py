@@ -0,0 +1,269 @@
+"""Self-contained parity check for the direct-XML SCC reader (src/SCC/scc_xml.py) against openpyxl.
+
+bench_xml_engine.py needs a directory of real SCCs. This builds everything it checks in a temporary directory, so it runs
+anywhere (a fresh checkout, CI) without confidential data:
+
+- synthetic SCCs from src/SCC/scc_synth.py, one of them with phantom rows. openpyxl writes every string inline and leaves
+  out the sharedStrings part, so these cover that layout
+- the first synthetic SCC with its strings moved to a sharedStrings part, the way Excel saves it
+- the same with rich-text shared strings (runs, phonetic runs) and _x005F_ escapes
+- hand-written workbooks of unusual cells: booleans, errors, formulas with and without cached values, dates, times and
+  durations (1900 and 1904 date systems), exponent numbers, empty and styled-only cells, cells and rows without a reference,
+  missing rows, cells past the sheet's dimension, a sheet with no dimension and one with prefixed namespaces
+
+Every sheet goes through bench_xml_engine.compare_sheets (whole sheet, header row, bounded ranges) and every workbook through
+analyze_scc_file with both engines. Each workbook is built to be something the XML reader should handle, so falling back to
+openpyxl counts as a failure here. Exits 1 if anything differs.
+
+Usage (from the repo root):
+    python scripts/check_xml_engine.py
+    python scripts/check_xml_engine.py --files 5 --rows 1000 --keep parity_workbooks
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import sys
+import tempfile
+import warnings
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import etree
+
+from bench_xml_engine import compare_sheets
+from src.SCC import scc_xml
+from src.SCC.scc_analyze import analyze_scc_file
+from src.SCC.scc_synth import SynthConfig, generate_scc_directory
+
+CONTENT_TYPES_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+SHARED_STRINGS_PART = 'xl/sharedStrings.xml'
+WORKBOOK_RELS_PART = 'xl/_rels/workbook.xml.rels'
+
+STYLES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="{scc_xml.MAIN_NS}">
+<numFmts count="1"><numFmt numFmtId="164" formatCode="[h]:mm:ss"/></numFmts>
+<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>
+<fills count="1"><fill><patternFill patternType="none"/></fill></fills>
+<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="5"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/><xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="21" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/><xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="10" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>
+</styleSheet>"""
+# cellXfs: 0 general, 1 date, 2 time, 3 duration, 4 percent
+
+UNUSUAL_ROWS = """
+<row r="1"><c r="A1" t="b"><v>1</v></c><c r="B1" t="b"><v>0</v></c><c r="C1" t="e"><v>#N/A</v></c><c r="D1" t="e"><v>#DIV/0!</v></c>
+  <c r="E1" t="str"><f>A1&amp;"x"</f><v>TRUEx</v></c><c r="F1"><f>1+1</f><v>2</v></c><c r="G1"><f>NOW()</f></c><c r="H1" t="s"><v>0</v></c></row>
+<row r="2"><c r="A2"><v>42</v></c><c r="B2"><v>-7</v></c><c r="C2"><v>1.5E+3</v></c><c r="D2"><v>2.5e-4</v></c><c r="E2" s="4"><v>0.1</v></c>
+  <c r="F2"><v>12345678901234567890</v></c><c r="G2" s="1"/><c r="H2"><v></v></c></row>
+<row r="3"><c r="A3" s="1"><v>45000</v></c><c r="B3" s="1"><v>45000.5</v></c><c r="C3" s="2"><v>0.75</v></c><c r="D3" s="3"><v>1.25</v></c>
+  <c r="E3" s="1"><v>60</v></c><c r="F3" s="1"><v>10000000000</v></c><c r="G3" t="s"><v>1</v></c><c r="H3" t="s"><v>2</v></c></row>
+<row r="4"><c r="A4" t="d"><v>2024-02-29T12:30:00</v></c><c r="B4" t="s"><v>3</v></c><c r="C4" t="s"><v>4</v></c><c r="AD4"><v>30</v></c></row>
+<row r="6"><c t="inlineStr"><is><t>no reference</t></is></c><c><v>2</v></c><c r="E6" t="inlineStr"><is><t xml:space="preserve"> padded </t></is></c>
+  <c t="inlineStr"><is><r><t>rich</t></r><r><rPr><b/></rPr><t xml:space="preserve"> inline</t></r></is></c></row>
+<row><c r="A7"><v>7</v></c><c r="B7" t="inlineStr"><is><t>row without a reference</t></is></c></row>
+<row r="9" spans="1:3"><c r="A9" t="inlineStr"><is/></c><c r="B9" t="inlineStr"><is><t>line1
+line2</t></is></c><c r="C9" t="inlineStr"><is><t>éè ✓ 中文</t></is></c></row>
+"""
+
+UNUSUAL_STRINGS = ['<si><t>shared</t></si>',
+                   '<si><r><t>ru</t></r><r><rPr><i/></rPr><t>ns</t></r><rPh sb="0" eb="1"><t>ル</t></rPh></si>',
+                   '<si><t>escaped_x005F_x000D_</t></si>',
+                   '<si><t/></si>',
+                   '<si><t xml:space="preserve">  two leading spaces</t></si>']
+
+def _sheet_xml(rows, dimension='A1:H9', prefix=None):
+    """A worksheet part around sheetData rows; no <dimension> if dimension is None, elements prefixed if prefix is given."""
+    xml = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{scc_xml.MAIN_NS}">'
+           + (f'<dimension ref="{dimension}"/>' if dimension else '') + f'<sheetData>{rows}</sheetData></worksheet>')
+    if prefix:
+        root = etree.fromstring(xml.encode('utf-8'))
+        prefixed = etree.Element(root.tag, nsmap={prefix: scc_xml.MAIN_NS})
+        prefixed.extend(list(root))
+        xml = etree.tostring(prefixed, xml_declaration=True, encoding='UTF-8', standalone=True).decode('utf-8')
+    return xml
+
+def write_package(file_path, sheets, shared_strings=None, date1904=False):
+    """
+    Write a minimal xlsx by hand, for cells openpyxl won't write itself.
+
+    Args:
+        file_path (str): Where to write it
+        sheets (list): (sheet name, worksheet XML) pairs
+        shared_strings (list): <si> elements as XML text; None leaves out the sharedStrings part
+        date1904 (bool): Use the 1904 date system
+    """
+    overrides = [('/xl/workbook.xml', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml'),
+                 ('/xl/styles.xml', 'application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml')]
+    relationships = [('rIdStyles', 'styles', 'styles.xml')]
+    sheet_entries = []
+    for index, (name, _) in enumerate(sheets, 1):
+        overrides.append((f'/xl/worksheets/sheet{index}.xml', 'application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml'))
+        relationships.append((f'rId{index}', 'worksheet', f'worksheets/sheet{index}.xml'))
+        sheet_entries.append(f'<sheet name="{name}" sheetId="{index}" r:id="rId{index}"/>')
+    if shared_strings is not None:
+        overrides.append((f'/{SHARED_STRINGS_PART}', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml'))
+        relationships.append(('rIdStrings', 'sharedStrings', 'sharedStrings.xml'))
+
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', f'<?xml version="1.0" encoding="UTF-8"?><Types xmlns="{CONTENT_TYPES_NS}">'
+                         '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                         '<Default Extension="xml" ContentType="application/xml"/>'
+                         + ''.join(f'<Override PartName="{part}" ContentType="{content_type}"/>' for part, content_type in overrides) + '</Types>')
+        archive.writestr('_rels/.rels', f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{scc_xml.PKG_REL_NS}">'
+                         f'<Relationship Id="rId1" Type="{scc_xml.OFFICE_DOCUMENT_REL}" Target="xl/workbook.xml"/></Relationships>')
+        archive.writestr('xl/workbook.xml', f'<?xml version="1.0" encoding="UTF-8"?><workbook xmlns="{scc_xml.MAIN_NS}" xmlns:r="{scc_xml.REL_NS}">'
+                         + (f'<workbookPr date1904="1"/>' if date1904 else '') + f'<sheets>{"".join(sheet_entries)}</sheets></workbook>')
+        archive.writestr(WORKBOOK_RELS_PART, f'<?xml version="1.0" encoding="UTF-8"?><Relationships xmlns="{scc_xml.PKG_REL_NS}">'
+                         + ''.join(f'<Relationship Id="{rel_id}" Type="{scc_xml.REL_NS}/{rel_type}" Target="{target}"/>' for rel_id, rel_type, target in relationships)
+                         + '</Relationships>')
+        archive.writestr('xl/styles.xml', STYLES_XML)
+        for index, (_, sheet_xml) in enumerate(sheets, 1):
+            archive.writestr(f'xl/worksheets/sheet{index}.xml', sheet_xml)
+        if shared_strings is not None:
+            archive.writestr(SHARED_STRINGS_PART, f'<?xml version="1.0" encoding="UTF-8"?><sst xmlns="{scc_xml.MAIN_NS}" count="{len(shared_strings)}" '
+                             f'uniqueCount="{len(shared_strings)}">{"".join(shared_strings)}</sst>')
+
+def write_unusual_workbooks(directory):
+    """The hand-written edge case workbooks (1900 and 1904 date systems). Returns their paths."""
+    sheets = [('Unusual', _sheet_xml(UNUSUAL_ROWS)),
+              ('No dimension', _sheet_xml(UNUSUAL_ROWS, dimension=None)),
+              ('Prefixed', _sheet_xml(UNUSUAL_ROWS, prefix='x'))]
+    paths = []
+    for name, date1904 in (('Unusual_cells_01.xlsx', False), ('Unusual_cells_1904_01.xlsx', True)):
+        path = os.path.join(directory, name)
+        write_package(path, sheets, UNUSUAL_STRINGS, date1904)
+        paths.append(path)
+    return paths
+
+def _rewrite_package(source, target, parts):
+    """Copy an xlsx with some parts replaced or added (name -> new bytes)."""
+    with zipfile.ZipFile(source) as original, zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for info in original.infolist():
+            archive.writestr(info, parts.pop(info.filename, None) or original.read(info.filename))
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+def _rich_item(item, index):
+    """Every third string split into two runs (the second bold) plus a phonetic run, and an escape added to every fifth."""
+    text = item.findtext(scc_xml.TEXT_TAG)
+    if text is None:
+        return
+    if index % 5 == 0:
+        text = f"{text}_x005F_x000D_"
+    item.clear()
+    if index % 3:
+        etree.SubElement(item, scc_xml.TEXT_TAG).text = text
+        return
+    middle = len(text) // 2
+    for position, snippet in enumerate((text[:middle], text[middle:])):
+        run = etree.SubElement(item, scc_xml.RUN_TAG)
+        if position:
+            etree.SubElement(etree.SubElement(run, f'{{{scc_xml.MAIN_NS}}}rPr'), f'{{{scc_xml.MAIN_NS}}}b')
+        snippet_element = etree.SubElement(run, scc_xml.TEXT_TAG)
+        snippet_element.text = snippet
+        snippet_element.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
+    phonetic = etree.SubElement(item, f'{{{scc_xml.MAIN_NS}}}rPh', sb='0', eb='1')
+    etree.SubElement(phonetic, scc_xml.TEXT_TAG).text = 'phonetic'
+
+def write_shared_strings(source, target, rich=False):
+    """
+    Copy of a workbook with its inline strings (what openpyxl writes) moved to a sharedStrings part (what Excel writes).
+
+    Args:
+        source (str): Workbook with inline strings
+        target (str): Where to write the copy
+        rich (bool): Also make some of the strings rich text, see _rich_item
+    """
+    items = {} # serialised <is> content -> its index in the table
+    table = etree.Element(f'{{{scc_xml.MAIN_NS}}}sst', nsmap={None: scc_xml.MAIN_NS})
+    parts = {}
+    with zipfile.ZipFile(source) as archive:
+        for name in archive.namelist():
+            if not (name.startswith('xl/worksheets/') and name.endswith('.xml')):
+                continue
+            root = etree.fromstring(archive.read(name))
+            for cell in root.iter(scc_xml.CELL_TAG):
+                inline = cell.find(scc_xml.INLINE_STRING_TAG)
+                if cell.get('t') != 'inlineStr' or inline is None:
+                    continue
+                key = b''.join(etree.tostring(child) for child in inline)
+                if key not in items:
+                    items[key] = len(items)
+                    item = etree.SubElement(table, scc_xml.SHARED_STRING_TAG)
+                    item.extend(list(inline))
+                    if rich:
+                        _rich_item(item, items[key])
+                cell.remove(inline)
+                cell.set('t', 's')
+                etree.SubElement(cell, scc_xml.VALUE_TAG).text = str(items[key])
+            parts[name] = etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+        rels = etree.fromstring(archive.read(WORKBOOK_RELS_PART))
+        etree.SubElement(rels, f'{{{scc_xml.PKG_REL_NS}}}Relationship', Id='rIdStrings', Type=scc_xml.SHARED_STRINGS_REL, Target='/xl/sharedStrings.xml')
+        parts[WORKBOOK_RELS_PART] = etree.tostring(rels, xml_declaration=True, encoding='UTF-8', standalone=True)
+        types = etree.fromstring(archive.read('[Content_Types].xml'))
+        etree.SubElement(types, f'{{{CONTENT_TYPES_NS}}}Override', PartName=f'/{SHARED_STRINGS_PART}',
+                         ContentType='application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml')
+        parts['[Content_Types].xml'] = etree.tostring(types, xml_declaration=True, encoding='UTF-8', standalone=True)
+    table.set('count', str(len(items)))
+    table.set('uniqueCount', str(len(items)))
+    parts[SHARED_STRINGS_PART] = etree.tostring(table, xml_declaration=True, encoding='UTF-8', standalone=True)
+    _rewrite_package(source, target, parts)
+
+def build_workbooks(directory, files, rows):
+    """Every workbook the check runs over, written into directory."""
+    paths = generate_scc_directory(directory, files, SynthConfig(sheets=2, rows=rows))
+    paths.append(generate_scc_directory(os.path.join(directory, 'phantom'), 1, SynthConfig(sheets=2, rows=rows // 2, phantom_rows=rows), seed=files)[0])
+    shared_path = os.path.join(directory, 'Shared_strings_01.xlsx')
+    write_shared_strings(paths[0], shared_path)
+    rich_path = os.path.join(directory, 'Rich_strings_01.xlsx')
+    write_shared_strings(paths[0], rich_path, rich=True)
+    return paths + [shared_path, rich_path] + write_unusual_workbooks(directory)
+
+def _analyze(file_path, engine):
+    """analyze_scc_file's result, or the exception it raised (by type and message), so failures can be compared too."""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return analyze_scc_file(file_path, engine)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+def check(file_paths):
+    """Print every difference between the engines; returns True if there were none."""
+    identical = True
+    for file_path in file_paths:
+        try:
+            problems = compare_sheets(file_path)
+        except scc_xml.XmlWorkbookUnsupported as e: # a fallback partway through a sheet
+            problems = [f"falls back to openpyxl: {e}"]
+        if _analyze(file_path, 'streaming') != _analyze(file_path, 'xml'):
+            problems.append("analyze_scc_file results differ")
+        for problem in problems:
+            print(f"{os.path.basename(file_path)}: {problem}")
+        identical = identical and not problems
+    return identical
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the direct-XML SCC reader against openpyxl on generated workbooks.')
+    parser.add_argument('--files', type=int, default=3, help='Synthetic SCCs to generate')
+    parser.add_argument('--rows', type=int, default=300, help='Data rows per check sheet')
+    parser.add_argument('--keep', type=str, default=None, help='Write the workbooks here and keep them (default: a temporary directory)')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO) # scc_read logs every BPER
+    warnings.simplefilter('ignore') # both readers warn about the out-of-range date cell
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = args.keep or temp_dir
+        os.makedirs(directory, exist_ok=True)
+        file_paths = build_workbooks(directory, args.files, args.rows)
+        identical = check(file_paths)
+    print(f"{len(file_paths)} workbooks, {'results identical' if identical else 'MISMATCHES FOUND'}")
+    sys.exit(0 if identical else 1)
+
+if __name__ == "__main__":
+    main()
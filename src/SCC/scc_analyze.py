@@ -0,0 +1,93 @@
+"""Single-pass SCC analysis. Loads each SCC workbook once and runs both the scc_read extraction (BPERs, docs, attestations, methods) and the scc_check first sheet checks against it, instead of opening the file once per module.
+
+Functions:
+    analyze_scc_file: Load an SCC once and return everything progress.json needs from it
+    analyze_scc_sheets: Same, reusing cached extracts for sheets whose content hasn't changed
+"""
+
+import argparse
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from src.SCC import scc_check
+from src.SCC import scc_read
+from src.SCC import scc_schema
+from src.SCC import scc_xml
+
+def analyze_scc_file(file_path: str, engine: str = 'streaming') -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Load an SCC workbook once (read-only) and run the extraction and the checks on it.
+
+    Args:
+        file_path: Path to SCC Excel file
+        engine: 'streaming' (openpyxl read-only) or 'xml' (scc_xml direct reader, falls back to openpyxl for unusual files)
+
+    Returns:
+        Tuple of (bper_dict, doc_dict, attestation_dict, method_dict, scc_info); all empty if the file couldn't be opened
+    """
+    return analyze_scc_sheets(file_path, engine=engine, sheet_hashes={})[0]
+
+def analyze_scc_sheets(file_path: str, known_sheets: Optional[Dict[str, Dict[str, Any]]] = None, engine: str = 'streaming',
+                       sheet_hashes: Optional[Dict[str, str]] = None) -> Tuple[Tuple[Dict[str, Any], ...], Dict[str, Dict[str, Any]]]:
+    """Same as analyze_scc_file, but sheets whose content hash is in known_sheets reuse that extract instead of being read again.
+
+    Args:
+        file_path: Path to SCC Excel file
+        known_sheets: Sheet content hash -> scc_read.extract_sheet result, from earlier parses (any SCC or version)
+        engine: 'streaming' or 'xml'
+        sheet_hashes: Sheet name -> content hash if already worked out; None works them out, {} skips hashing
+
+    Returns:
+        Tuple of (the analyze_scc_file result, sheet content hash -> extract for every hashed sheet)
+    """
+    if engine not in ('streaming', 'xml'):
+        raise ValueError(f"Unknown SCC read engine: {engine}")
+    if sheet_hashes is None:
+        sheet_hashes = scc_xml.sheet_content_hashes(file_path)
+    known_sheets = known_sheets or {}
+    reused = sum(1 for sheet_hash in set(sheet_hashes.values()) if sheet_hash in known_sheets)
+    print(f'Analyzing {file_path}' + (f' ({reused} unchanged sheets reused)' if reused else ''))
+
+    sheet_extracts: Dict[str, Dict[str, Any]] = {}
+    scc_name = scc_read.get_scc_name(file_path)
+
+    def analyze(workbook: Any) -> Tuple[Dict[str, Any], ...]:
+        sheet_extracts.clear() # in case the xml engine bailed out partway and this is the openpyxl retry
+        extracts = []
+        for sheet_name, schema in scc_schema.sheet_schemas(workbook).items():
+            sheet_hash = sheet_hashes.get(sheet_name)
+            extract = known_sheets.get(sheet_hash) if sheet_hash else None
+            if extract is None:
+                extract = scc_read.extract_sheet(workbook[sheet_name], schema.columns)
+            if sheet_hash:
+                sheet_extracts[sheet_hash] = extract
+            extracts.append(extract)
+        bper_dict, doc_dict, attestation_dict, method_dict = scc_read.merge_sheet_extracts(extracts, scc_name)
+        scc_info = scc_check.build_scc_info(workbook, file_path)
+        return bper_dict, doc_dict, attestation_dict, method_dict, scc_info
+
+    result = scc_read.with_workbook(file_path, engine, analyze)
+
+    if result is None:
+        print(f"Skipping file due to error: {file_path}")
+        return ({}, {}, {}, {}, {}), {}
+
+    return result, sheet_extracts
+
+def main() -> None:
+    """Run from command line."""
+    parser = argparse.ArgumentParser(description='Extract and check an SCC file in one pass.')
+    parser.add_argument('file_path', type=str, help='Path to the Excel file')
+    parser.add_argument('--engine', choices=['streaming', 'xml'], default='streaming', help='Workbook reader to use')
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.file_path):
+        print(f"File not found: {args.file_path}")
+        return
+
+    bper_dict, doc_dict, attestation_dict, method_dict, scc_info = analyze_scc_file(args.file_path, args.engine)
+    for key, value in scc_info.items():
+        print(f"{key}: {value}")
+    print(f"\n{len(bper_dict)} BPERs, {len(doc_dict)} documents, {len(attestation_dict)} attestations, {len(method_dict)} checks")
+
+if __name__ == "__main__":
+    main()
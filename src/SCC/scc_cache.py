@@ -0,0 +1,183 @@
+"""On-disk cache of parsed SCC results, stored next to progress.json as scc_cache.json.
+
+Each entry is keyed by the SCC's path and remembers its size, mtime and a SHA-1 of its contents. A workbook
+only gets reparsed when its fingerprint changes, so repeat pulls during a cycle skip openpyxl entirely.
+If size and mtime match, the cached result is used without reading the file. If they don't (a copy or a
+touch), the content hash decides.
+
+It also keeps per-sheet extraction results keyed by sheet content hash (scc_xml.sheet_content_hashes), so
+when a new SCC version lands only the sheets that actually changed get reparsed.
+
+Fields worked out against today's date ('Reviewed within 180 days') are recomputed whenever a cached result is
+served, rather than handed back as they were on the day it was parsed.
+
+Classes:
+    SCCParseCache: Load, query, update, evict and save the cache
+"""
+
+import copy
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from src.SCC import scc_check
+
+CACHE_FILE_NAME = 'scc_cache.json'
+CACHE_VERSION = 3 # bump when the parsers change what they return, so stale results get thrown away
+
+def analyzer_key(analyzer: Callable[[str], Any]) -> str:
+    """Name results are stored under, so different analyzers (full analysis vs checks only) don't collide.
+    A functools.partial (e.g. a different read engine) shares its function's results, since every engine gives the same answers."""
+    analyzer = getattr(analyzer, 'func', analyzer)
+    return f"{analyzer.__module__}.{analyzer.__qualname__}"
+
+def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-1 of a file's contents, read in chunks."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _refresh_dated_fields(result: Any) -> None:
+    """Recompute the date-relative checks in a cached result (the scc_info dict, alone or at the end of an analysis tuple)."""
+    for part in (result if isinstance(result, (list, tuple)) else (result,)):
+        if isinstance(part, dict) and 'Last Review Date' in part:
+            scc_check.refresh_review_status(part)
+
+class SCCParseCache:
+    """Fingerprint-keyed cache of SCC parse results."""
+
+    def __init__(self, cache_file: str):
+        """
+        Args:
+            cache_file: Path to the cache JSON (normally <project>/scc_cache.json)
+        """
+        self.cache_file = cache_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.sheets: Dict[str, Dict[str, Any]] = {} # sheet content hash -> scc_read.extract_sheet result
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._hashes: Dict[str, str] = {} # content hashes worked out this session, so put() doesn't re-read the file
+        self.load()
+
+    @classmethod
+    def for_project(cls, project_dir: str) -> 'SCCParseCache':
+        """Cache stored alongside progress.json in the project directory."""
+        return cls(os.path.join(project_dir, CACHE_FILE_NAME))
+
+    def load(self) -> None:
+        """Read the cache file; a missing, corrupt or old-version cache just starts empty."""
+        try:
+            with open(self.cache_file, 'r') as file:
+                data = json.load(file)
+            if data.get('version') == CACHE_VERSION:
+                self.entries = data.get('entries', {})
+                self.sheets = data.get('sheets', {})
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, AttributeError) as e:
+            print(f"Ignoring unreadable SCC cache {self.cache_file}: {e}")
+
+    def save(self) -> None:
+        """Write the cache if anything changed (temp file + rename, so a crash can't leave half a cache)."""
+        if not self.dirty:
+            return
+        temp_file = f"{self.cache_file}.tmp"
+        with open(temp_file, 'w') as file:
+            json.dump({'version': CACHE_VERSION, 'entries': self.entries, 'sheets': self.sheets}, file, default=str) # stray datetime cells end up as strings, same as in progress.json
+        os.replace(temp_file, self.cache_file)
+        self.dirty = False
+
+    def _key(self, file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def _content_hash(self, key: str) -> str:
+        if key not in self._hashes:
+            self._hashes[key] = hash_file(key)
+        return self._hashes[key]
+
+    def get(self, file_path: str, analyzer: Callable[[str], Any]) -> Optional[Any]:
+        """Cached result for a file, or None if it isn't cached or has changed.
+
+        Args:
+            file_path: SCC file
+            analyzer: Function whose result is wanted
+
+        Returns:
+            A copy of the cached result (lists come back as tuples, like the analyzers return them), with the review-age check
+            redone as of today, or None
+        """
+        key = self._key(file_path)
+        entry = self.entries.get(key)
+        result = entry.get('results', {}).get(analyzer_key(analyzer)) if entry else None
+        if result is None:
+            self.misses += 1
+            return None
+
+        stat = os.stat(key)
+        if entry['size'] != stat.st_size or entry['mtime'] != stat.st_mtime:
+            if entry['size'] != stat.st_size or entry['sha1'] != self._content_hash(key):
+                self.misses += 1
+                return None
+            entry['mtime'] = stat.st_mtime # same content, just touched or copied
+            self.dirty = True
+
+        self.hits += 1
+        result = copy.deepcopy(result)
+        _refresh_dated_fields(result) # relative to today, not to when it was cached
+        return tuple(result) if isinstance(result, list) else result
+
+    def known_sheets(self, sheet_hashes: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Cached sheet extracts for whichever of these sheet hashes have been seen before.
+
+        Args:
+            sheet_hashes: Sheet name -> content hash for one workbook
+
+        Returns:
+            Dict of content hash -> extract (copies)
+        """
+        return {sheet_hash: copy.deepcopy(self.sheets[sheet_hash]) for sheet_hash in sheet_hashes.values() if sheet_hash in self.sheets}
+
+    def put(self, file_path: str, analyzer: Callable[[str], Any], result: Any, sheet_extracts: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """Store a freshly parsed result under the file's current fingerprint, plus its per-sheet extracts if there are any."""
+        key = self._key(file_path)
+        stat = os.stat(key)
+        content_hash = self._content_hash(key)
+        entry = self.entries.get(key)
+        if not entry or entry['sha1'] != content_hash:
+            entry = {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha1': content_hash, 'results': {}}
+            self.entries[key] = entry
+        entry['size'] = stat.st_size
+        entry['mtime'] = stat.st_mtime
+        entry['results'][analyzer_key(analyzer)] = copy.deepcopy(result)
+        if sheet_extracts:
+            entry['sheet_hashes'] = list(sheet_extracts)
+            for sheet_hash, extract in sheet_extracts.items():
+                self.sheets.setdefault(sheet_hash, copy.deepcopy(extract))
+        self.dirty = True
+
+    def evict_missing(self, scc_files: List[str]) -> List[str]:
+        """Drop entries for SCCs that are no longer in the SCC directory, and sheet extracts nothing refers to any more.
+
+        Args:
+            scc_files: SCC files currently in the directory
+
+        Returns:
+            Paths that were evicted
+        """
+        keep = {self._key(file_path) for file_path in scc_files}
+        evicted = [key for key in self.entries if key not in keep]
+        for key in evicted:
+            del self.entries[key]
+
+        referenced = {sheet_hash for entry in self.entries.values() for sheet_hash in entry.get('sheet_hashes', [])}
+        orphaned = [sheet_hash for sheet_hash in self.sheets if sheet_hash not in referenced]
+        for sheet_hash in orphaned:
+            del self.sheets[sheet_hash]
+
+        if evicted or orphaned:
+            self.dirty = True
+        return evicted
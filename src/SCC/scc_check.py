@@ -2,9 +2,13 @@
 
 Functions:
     process_scc_file: Main function to analyze SCC file
+    build_scc_info: Run the checks against an already loaded workbook
     read_excel: Safely load Excel workbook
+    register_first_sheet_check: Add a pattern to the first sheet check registry
+    classify_first_sheet: Run every registered first sheet check (and the date check) in one pass
     find_value_with_regex: Search cells for regex pattern
     check_column_presence: Validate column existence
+    refresh_review_status: Recompute the review-age check of an earlier result as of today
 """
 
 import openpyxl
@@ -12,19 +16,24 @@ import re
 import argparse
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any, Union, Pattern
+from functools import lru_cache
+from typing import Optional, Dict, Any, Union, Pattern, Tuple
 
-def read_excel(file_path: str) -> Optional[openpyxl.Workbook]:
+from src.SCC import scc_regions, scc_schema
+from src.SCC.scc_read import MAX_EMPTY_ROWS, iter_data_rows
+
+def read_excel(file_path: str, read_only: bool = False) -> Optional[openpyxl.Workbook]:
     """Load an Excel workbook SCC form the specified file path
 
     Args:
         file_path: Path to Excel file
+        read_only: Open in openpyxl's read-only (streaming) mode; caller should close the workbook
 
     Returns:
         Workbook if successful, None if permission denied
     """
     try:
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = openpyxl.load_workbook(file_path, read_only=read_only, data_only=True)
         return workbook
     except PermissionError:
         print(f"Permission denied: Unable to access '{file_path}'.") # handles files that are already open somewhere else
@@ -56,6 +65,11 @@ def find_value_with_regex(sheet: openpyxl.worksheet.worksheet.Worksheet,  patter
 def regex_match_with_diff(pattern: Pattern, text: str, max_diff: int) -> bool:
     """Match text to regex pattern with flexible slicing within max_diff
 
+    True when some non-empty slice text[i:j] with i <= len(text) - max_diff fully matches the pattern.
+    Rather than trying fullmatch on every slice (O(n^2) regex calls), one search finds the leftmost
+    match and its start is checked against the max_diff window. Lookarounds and anchors see the whole
+    cell rather than the slice edges, which makes no difference for the SCC first sheet patterns.
+
     Args:
         pattern: Compiled regex
         text: String to match
@@ -64,11 +78,18 @@ def regex_match_with_diff(pattern: Pattern, text: str, max_diff: int) -> bool:
     Returns:
         True if match found within max_diff
     """
-    for i in range(len(text) - max_diff + 1):
-        for j in range(i + 1, len(text) + 1):
-            if pattern.fullmatch(text[i:j]):
-                return True
-    return False
+    last_start = len(text) - max_diff
+    if last_start < 0:
+        return False
+    if _can_match_empty(pattern): # search could stop on an empty match, so fall back to checking the slices
+        return any(pattern.fullmatch(text[i:j]) for i in range(last_start + 1) for j in range(i + 1, len(text) + 1))
+    match = pattern.search(text)
+    return match is not None and match.start() <= last_start
+
+@lru_cache(maxsize=None)
+def _can_match_empty(pattern: Pattern) -> bool:
+    """Whether the pattern matches the empty string (cached per compiled pattern)."""
+    return pattern.fullmatch('') is not None
 
 def find_most_recent_date(sheet: openpyxl.worksheet.worksheet.Worksheet, max_rows: int = 150) -> Optional[datetime]:
     """Find most recent date in worksheet.
@@ -88,6 +109,88 @@ def find_most_recent_date(sheet: openpyxl.worksheet.worksheet.Worksheet, max_row
                     latest_date = cell
     return latest_date
 
+# First sheet check registry. Each entry is looked for in one combined pass over the first sheet by
+# classify_first_sheet, so a new first sheet check is a register_first_sheet_check call, not another sheet walk.
+FIRST_SHEET_CHECKS: Dict[str, Dict[str, Any]] = {}
+
+def register_first_sheet_check(name: str, pattern: Union[str, Pattern], max_diff: int = 5, presence: bool = True) -> None:
+    """Register a pattern to look for on the SCC first sheet.
+
+    Args:
+        name: scc_info key the result is stored under
+        pattern: Regex (case-insensitive if given as a string); must not match the empty string or use backreferences
+        max_diff: Same meaning as in regex_match_with_diff
+        presence: True to store a bool, False to store the matching cell text (or False)
+    """
+    compiled_pattern = re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern
+    if compiled_pattern.fullmatch(''):
+        raise ValueError(f"First sheet check '{name}' matches the empty string")
+    FIRST_SHEET_CHECKS[name] = {'pattern': compiled_pattern, 'max_diff': max_diff, 'presence': presence}
+    _combined_first_sheet_pattern.cache_clear()
+
+@lru_cache(maxsize=1)
+def _combined_first_sheet_pattern() -> Tuple[Pattern, Dict[str, str]]:
+    """One alternation over every registered check. Each alternative is a zero-width lookahead with its own
+    named group, so finditer reports every position where any check starts without consuming the text.
+
+    Returns:
+        Compiled alternation and a map of check name -> group name
+    """
+    alternatives = []
+    group_names = {}
+    for index, (name, check) in enumerate(FIRST_SHEET_CHECKS.items()):
+        group_names[name] = f"check_{index}"
+        inline_flag = '(?i:' if check['pattern'].flags & re.IGNORECASE else '(?:'
+        alternatives.append(f"(?=(?P<check_{index}>{inline_flag}{check['pattern'].pattern})))")
+    return re.compile('|'.join(alternatives)), group_names
+
+register_first_sheet_check('SCM Name', r'SCM\d+', 0, presence=False)
+register_first_sheet_check('SCC Guidance source presence', r'SCC Guidance Source', 5)
+register_first_sheet_check('SCC Policy and Procedure presence', r'SCC Policy and Procedures Source', 5)
+register_first_sheet_check('SCC System Scope Presence', r'SCC System Scope', 3)
+
+def classify_first_sheet(sheet: openpyxl.worksheet.worksheet.Worksheet, max_rows: int = 150, max_cols: int = 50, max_empty_rows: Optional[int] = MAX_EMPTY_ROWS) -> Dict[str, Any]:
+    """Visit each cell of the first sheet once, recording the first hit for every registered check and the most recent date.
+
+    Gives the same answers as calling find_value_with_regex per check plus find_most_recent_date.
+
+    Args:
+        sheet: SCC first sheet
+        max_rows/max_cols: Search limits for the pattern checks (dates are checked across every column, like find_most_recent_date)
+        max_empty_rows: Stop early after this many blank rows in a row (see scc_read.iter_data_rows)
+
+    Returns:
+        Dict with 'matches' (check name -> first matching cell text or False) and 'latest_date' (datetime or None)
+    """
+    combined_pattern, group_names = _combined_first_sheet_pattern()
+    matches: Dict[str, Union[str, bool]] = {name: False for name in FIRST_SHEET_CHECKS}
+    pending = dict(FIRST_SHEET_CHECKS)
+    latest_date = None
+
+    for row in iter_data_rows(sheet.iter_rows(min_row=1, max_row=max_rows, values_only=True), max_empty_rows=max_empty_rows):
+        for col_index, cell in enumerate(row, 1):
+            if isinstance(cell, datetime):
+                if not latest_date or cell > latest_date:
+                    latest_date = cell
+            if not cell or not pending or col_index > max_cols:
+                continue
+            text = str(cell)
+            for match in combined_pattern.finditer(text): # only cells with a candidate position get a closer look
+                position = match.start()
+                for name, check in list(pending.items()):
+                    if position > len(text) - check['max_diff']:
+                        continue
+                    if match.group(group_names[name]) is not None: # this check is the alternative that matched here
+                        end = match.end(group_names[name])
+                    else: # alternation reports one check per position, so others starting here are checked directly
+                        check_match = check['pattern'].match(text, position)
+                        end = check_match.end() if check_match else position
+                    if end > position:
+                        matches[name] = text
+                        del pending[name]
+
+    return {'matches': matches, 'latest_date': latest_date}
+
 def check_column_presence(workbook: openpyxl.Workbook, column_name: str, max_cols: int = 50) -> bool:
     """Check if column with certain name exists on all sheets after first.
 
@@ -99,11 +202,15 @@ def check_column_presence(workbook: openpyxl.Workbook, column_name: str, max_col
     Returns:
         True if column found in any sheet
     """
+    if max_cols == scc_schema.MAX_HEADER_COLS: # same header rows the extraction uses, read once per workbook
+        return scc_schema.column_present(workbook, column_name)
+
     for sheet_name in workbook.sheetnames[1:]:
         sheet = workbook[sheet_name]
-        for column in sheet.iter_cols(min_row=1, max_row=1, max_col=max_cols, values_only=True):
-            if column[0] and column_name.lower() in column[0].lower():
-                return True
+        for header_row in sheet.iter_rows(min_row=1, max_row=1, max_col=max_cols, values_only=True): # iter_rows so read-only workbooks work too
+            for value in header_row:
+                if value and column_name.lower() in str(value).lower():
+                    return True
     return False
 
 def check_reviewed_within_days(last_review_date: Optional[datetime],
@@ -121,51 +228,89 @@ def check_reviewed_within_days(last_review_date: Optional[datetime],
         return (datetime.now() - last_review_date).days <= days
     return False
 
-def process_scc_file(file_path: str) -> Dict[str, Any]:
+def refresh_review_status(scc_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Recompute 'Reviewed within 180 days' from 'Last Review Date' as of today, for results that weren't just parsed
+    (cached parses, unchanged SCCs). The check is relative to the day it ran, so a reused answer goes stale.
+
+    Args:
+        scc_info: SCC analysis results, updated in place
+
+    Returns:
+        The same dict
+    """
+    last_review_date = scc_info.get('Last Review Date')
+    try:
+        last_review_date = datetime.fromisoformat(last_review_date) if last_review_date else None
+    except (TypeError, ValueError):
+        return scc_info # not an ISO date, leave the earlier answer alone
+    scc_info['Reviewed within 180 days'] = check_reviewed_within_days(last_review_date)
+    return scc_info
+
+def process_scc_file(file_path: str, engine: str = 'streaming') -> Dict[str, Any]:
     """Process single SCC file  info.
 
     Args:
         file_path: Path to SCC Excel file
+        engine: 'streaming' (openpyxl read-only) or 'xml' (scc_xml direct reader, falls back to openpyxl), used to load the regions (see scc_regions)
 
     Returns:
         Dict containing SCC analysis results
     """
     print(f'Performing SCC checks on {file_path}')
-    workbook = read_excel(file_path)
+    regions = scc_regions.load_regions(file_path, engine) # only the first sheet block and header rows, the checks don't look anywhere else
+    if regions is not None:
+        return build_scc_info(regions, file_path)
+    # couldn't be loaded, go through the normal path so errors surface the same way
+
+    workbook = read_excel(file_path, read_only=True)
 
     if workbook is None:
         print(f"Skipping file due to error: {file_path}")
         return {}
 
+    try:
+        return build_scc_info(workbook, file_path)
+    finally:
+        workbook.close()
+
+def build_scc_info(workbook: openpyxl.Workbook, file_path: str) -> Dict[str, Any]:
+    """Run the first sheet and column checks against an already loaded workbook.
+
+    Args:
+        workbook: Loaded SCC workbook (normal, read-only or scc_regions.RegionWorkbook)
+        file_path: Path the workbook was loaded from, used for the SCC name and version
+
+    Returns:
+        Dict containing SCC analysis results
+    """
     first_sheet = workbook[workbook.sheetnames[0]]
-    scm_pattern = re.compile(r'SCM\d+', re.IGNORECASE)
-    guidance_pattern = re.compile(r'SCC Guidance Source', re.IGNORECASE)
-    policy_procedure_pattern = re.compile(r'SCC Policy and Procedures Source', re.IGNORECASE)
-    system_scope_pattern = re.compile(r'SCC System Scope', re.IGNORECASE)
 
     scc_name = os.path.splitext(os.path.basename(file_path))[0]
     version_match = re.search(r'_(\d{2})$', scc_name)
     version = version_match.group(1) if version_match else None
     scc_name = re.sub(r'_\d{2}$', '', scc_name)
 
-    last_review_date = find_most_recent_date(first_sheet)
+    first_sheet_results = classify_first_sheet(first_sheet) # one walk for all pattern checks and the review date
+    first_sheet_checks = {name: (bool(value) if FIRST_SHEET_CHECKS[name]['presence'] else value) for name, value in first_sheet_results['matches'].items()}
+    last_review_date = first_sheet_results['latest_date']
     
     scc_info = {
         'SCC': scc_name,
         'Version': version,
-        'SCM Name': find_value_with_regex(first_sheet, scm_pattern, 0),
+        'SCM Name': first_sheet_checks.pop('SCM Name'),
         'Last Review Date': last_review_date.isoformat() if last_review_date else None,  # Convert to ISO format string
-        'SCC Guidance source presence': bool(find_value_with_regex(first_sheet, guidance_pattern, 5)),
-        'SCC Policy and Procedure presence': bool(find_value_with_regex(first_sheet, policy_procedure_pattern, 5)),
+        'SCC Guidance source presence': first_sheet_checks.pop('SCC Guidance source presence'),
+        'SCC Policy and Procedure presence': first_sheet_checks.pop('SCC Policy and Procedure presence'),
         'Exception column presence': check_column_presence(workbook, 'exception'),
         'Deviation column presence': check_column_presence(workbook, 'deviation'),
         'TLA column presence': check_column_presence(workbook, 'TLA'),
         'Compliance method column presence': check_column_presence(workbook, 'method'),
         'WPS config sup doc presence': check_column_presence(workbook, 'documentation'),
         'Reviewed within 180 days': check_reviewed_within_days(last_review_date),
-        'SCC System Scope Presence': bool(find_value_with_regex(first_sheet, system_scope_pattern, 3)),
+        'SCC System Scope Presence': first_sheet_checks.pop('SCC System Scope Presence'),
         'Evidence Methods': []
     }
+    scc_info.update(first_sheet_checks) # any additionally registered first sheet checks
 
     return scc_info
 
@@ -173,13 +318,14 @@ def main() -> None:
     """Run from command line."""
     parser = argparse.ArgumentParser(description='Analyze SCC files.')
     parser.add_argument('file_path', type=str, help='Path to the Excel file')
+    parser.add_argument('--engine', choices=['streaming', 'xml'], default='streaming', help='Workbook reader to use')
     args = parser.parse_args()
 
     if not os.path.isfile(args.file_path):
         print(f"File not found: {args.file_path}")
         return
 
-    scc_info = process_scc_file(args.file_path)
+    scc_info = process_scc_file(args.file_path, args.engine)
     for key, value in scc_info.items():
         print(f"{key}: {value}")
 
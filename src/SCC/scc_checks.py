@@ -0,0 +1,195 @@
+"""Checks table for progress.json, keyed by (SCC, STIG ID), with an index of the evidence methods each SCC uses.
+
+Checks used to be keyed by STIG ID alone, so a STIG ID that appeared in two SCCs kept only whichever SCC was written last,
+and working out an SCC's evidence methods meant scanning every check. They're now stored per SCC:
+
+    "Checks": {"<SCC>": {"<STIG ID>": {"Evidence method": "Manual-Screenshot"}}}
+
+The method index (SCC -> method -> STIG IDs, methods lowercased) is built once when the table is opened and kept up to date
+as checks are inserted and removed, so template building, directory building and scan eligibility read an SCC's methods straight out of it.
+Checks in the old STIG ID keyed layout are migrated when the table is opened from progress data.
+
+Callers name SCCs both ways: scc_info['SCC'] as parsed, and stripped of its version suffix (e.g. for directory names). Every
+method runs the name through scc_key first, so both forms find the same checks instead of one coming back empty.
+
+Classes:
+    ChecksTable: Insert, remove, replace and query checks per SCC
+
+Functions:
+    scc_key: The form of an SCC name checks are stored under
+    is_legacy_checks: Whether a Checks section is still keyed by STIG ID
+    unmigratable_checks: STIG ID keyed checks that can't be migrated (no SCC)
+    migrate_checks: Convert STIG ID keyed Checks to the per-SCC layout
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+METHOD_FIELD = 'Evidence method'
+
+def scc_key(scc_name: str) -> str:
+    """SCC name without a trailing version number ("_03") or surrounding whitespace, the form checks are keyed by."""
+    return re.sub(r'_\d{2}$', '', scc_name.strip()).strip()
+
+def _is_legacy_check(value: Any) -> bool:
+    return isinstance(value, dict) and METHOD_FIELD in value
+
+def is_legacy_checks(checks: Dict[str, Any]) -> bool:
+    """True if a Checks section has any checks in the old STIG ID -> {'SCC', 'Evidence method'} layout."""
+    return any(_is_legacy_check(value) for value in checks.values())
+
+def unmigratable_checks(checks: Dict[str, Any]) -> List[str]:
+    """Keys migrate_checks would drop: old-layout checks without an SCC, and values that are neither a check nor an SCC's checks."""
+    return [key for key, value in checks.items() if not isinstance(value, dict) or (_is_legacy_check(value) and not value.get('SCC'))]
+
+def migrate_checks(checks: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Convert STIG ID keyed Checks to SCC -> STIG ID -> check. A section can be a mix of both layouts (an old file that
+    a newer version has already added to): SCC groups are carried over as they are, and win over an old-layout check for the
+    same (SCC, STIG ID). Old-layout checks without an SCC are dropped (see unmigratable_checks).
+
+    Args:
+        checks: Checks section in the old (or a mixed) layout
+
+    Returns:
+        Checks in the per-SCC layout (other fields on each check are kept)
+    """
+    migrated = {}
+    for key, value in checks.items():
+        if not isinstance(value, dict):
+            continue
+        if not _is_legacy_check(value): # already SCC -> STIG ID -> check
+            migrated.setdefault(scc_key(key), {}).update(value)
+        elif value.get('SCC'):
+            check = dict(value)
+            migrated.setdefault(scc_key(check.pop('SCC')), {}).setdefault(key, check)
+    return migrated
+
+class ChecksTable:
+    """(SCC, STIG ID) -> check, with SCC -> evidence method -> STIG IDs kept alongside."""
+
+    def __init__(self, checks: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None):
+        """
+        Args:
+            checks: Checks section in the per-SCC layout; it's used (and updated) in place. None starts an empty table.
+                SCCs stored under another form of their name are merged into the scc_key one
+        """
+        self.checks = checks if checks is not None else {}
+        for scc_name in [scc_name for scc_name in self.checks if scc_key(scc_name) != scc_name]:
+            scc_checks = self.checks.pop(scc_name)
+            self.checks.setdefault(scc_key(scc_name), {}).update(scc_checks)
+        self.methods: Dict[str, Dict[str, Dict[str, None]]] = {} # SCC -> lowercased method -> STIG IDs (dict as an ordered set)
+        for scc_name, scc_checks in self.checks.items():
+            for stig_id, check in scc_checks.items():
+                self._index(scc_name, stig_id, check.get(METHOD_FIELD, ''))
+
+    @classmethod
+    def for_progress(cls, progress_data: Dict[str, Any]) -> 'ChecksTable':
+        """Table over progress_data['Checks'], migrating it to the per-SCC layout first if it's still keyed by STIG ID."""
+        checks = progress_data.setdefault('Checks', {})
+        if is_legacy_checks(checks):
+            dropped = unmigratable_checks(checks)
+            if dropped:
+                print(f"Checks: dropped {len(dropped)} checks with no SCC ({', '.join(dropped[:5])}{', ...' if len(dropped) > 5 else ''})")
+            checks = progress_data['Checks'] = migrate_checks(checks)
+        return cls(checks)
+
+    def _index(self, scc_name: str, stig_id: str, method: str) -> None:
+        self.methods.setdefault(scc_name, {}).setdefault(method.lower(), {})[stig_id] = None
+
+    def _unindex(self, scc_name: str, stig_id: str, method: str) -> None:
+        scc_methods = self.methods.get(scc_name, {})
+        stig_ids = scc_methods.get(method.lower(), {})
+        stig_ids.pop(stig_id, None)
+        if not stig_ids:
+            scc_methods.pop(method.lower(), None)
+        if not scc_methods:
+            self.methods.pop(scc_name, None)
+
+    def insert(self, scc_name: str, stig_id: str, method: str) -> bool:
+        """Add a check, or update the evidence method on an existing one (its other fields are kept).
+
+        Args:
+            scc_name: SCC the check belongs to
+            stig_id: STIG ID of the check
+            method: Evidence method from the SCC
+
+        Returns:
+            True if the check is new
+        """
+        scc_name = scc_key(scc_name)
+        check = self.checks.setdefault(scc_name, {}).get(stig_id)
+        if check is not None:
+            self._unindex(scc_name, stig_id, check.get(METHOD_FIELD, ''))
+            check[METHOD_FIELD] = method
+        else:
+            self.checks[scc_name][stig_id] = {METHOD_FIELD: method}
+        self._index(scc_name, stig_id, method)
+        return check is None
+
+    def remove(self, scc_name: str, stig_id: str) -> bool:
+        """Drop one check. Returns False if it wasn't there."""
+        scc_name = scc_key(scc_name)
+        scc_checks = self.checks.get(scc_name, {})
+        check = scc_checks.pop(stig_id, None)
+        if check is None:
+            return False
+        self._unindex(scc_name, stig_id, check.get(METHOD_FIELD, ''))
+        if not scc_checks:
+            del self.checks[scc_name]
+        return True
+
+    def set_scc(self, scc_name: str, method_dict: Dict[str, Dict[str, Any]]) -> Tuple[int, int]:
+        """Replace one SCC's checks with freshly parsed ones as a delta; existing checks keep any other fields.
+
+        Args:
+            scc_name: SCC the methods came from
+            method_dict: STIG ID -> method entry, as scc_read returns them
+
+        Returns:
+            (added, removed) check counts
+        """
+        scc_name = scc_key(scc_name)
+        added = sum(self.insert(scc_name, stig_id, details['Evidence Method']) for stig_id, details in method_dict.items())
+        stale = [stig_id for stig_id in self.checks.get(scc_name, {}) if stig_id not in method_dict]
+        for stig_id in stale:
+            self.remove(scc_name, stig_id)
+        return added, len(stale)
+
+    def remove_scc(self, scc_name: str) -> int:
+        """Drop every check for an SCC. Returns how many there were."""
+        scc_name = scc_key(scc_name)
+        removed = len(self.checks.pop(scc_name, {}))
+        self.methods.pop(scc_name, None)
+        return removed
+
+    def get(self, scc_name: str, stig_id: str) -> Optional[Dict[str, Any]]:
+        """One check, or None."""
+        return self.checks.get(scc_key(scc_name), {}).get(stig_id)
+
+    def checks_for(self, scc_name: str) -> Dict[str, Dict[str, Any]]:
+        """STIG ID -> check for one SCC ({} if it has none)."""
+        return self.checks.get(scc_key(scc_name), {})
+
+    def methods_for(self, scc_name: str) -> List[str]:
+        """Evidence methods (lowercased) one SCC uses, in the order they were first seen."""
+        return list(self.methods.get(scc_key(scc_name), {}))
+
+    def stig_ids_for(self, scc_name: str, method: str) -> List[str]:
+        """STIG IDs in one SCC that use an evidence method (case-insensitive)."""
+        return list(self.methods.get(scc_key(scc_name), {}).get(method.lower(), {}))
+
+    def sccs(self) -> List[str]:
+        """SCCs that have checks."""
+        return list(self.checks)
+
+    def as_entries(self) -> Dict[str, List[Dict[str, Any]]]:
+        """SCC -> list of checks with their STIG ID, the shape json_to_excel writes as rows."""
+        return {scc_name: [{'STIG ID': stig_id, **check} for stig_id, check in scc_checks.items()] for scc_name, scc_checks in self.checks.items()}
+
+    def __iter__(self) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        for scc_name, scc_checks in self.checks.items():
+            for stig_id, check in scc_checks.items():
+                yield scc_name, stig_id, check
+
+    def __len__(self) -> int:
+        return sum(len(scc_checks) for scc_checks in self.checks.values())
@@ -0,0 +1,199 @@
+"""Works out what changed between two versions of an SCC (or an SCC and what progress.json already has for it), so only the affected stages need re-running when a new version lands.
+
+Everything is compared on the scc_read.process_excel_file outputs: BPERs, supporting documents, attestations and the STIG ID -> evidence method map.
+
+Functions:
+    diff_extractions: Change set between two sets of extracted dictionaries
+    diff_scc_files: Change set between two SCC workbooks
+    diff_against_progress: Change set between an SCC workbook and its current entries in progress.json
+    extraction_from_progress: Rebuild an SCC's extracted dictionaries from progress.json
+    affected_stages: Which project stages a change set touches
+    has_changes: Whether a change set has anything in it
+"""
+
+import argparse
+import json
+import os
+from typing import Any, Dict, List, Tuple
+
+from src.SCC import scc_checks
+from src.SCC import scc_read
+from src.utils import progress_store
+
+STAGE_DIRECTORIES = 'directories' # KAIZEN.create_directories: per-SCC folders, Attestations/Automated/Manual subfolders
+STAGE_TEMPLATES = 'templates' # KAIZEN.build_templates: one template per check
+STAGE_GATHER = 'gather' # gather_docs: BPERs, supporting documents and attestations to fetch
+STAGE_CHECKLISTS = 'checklists' # scc_tables: the SCC markdown checklists
+
+Extraction = Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]
+
+def _key_diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List[str]]:
+    return {
+        'added': [key for key in new if key not in old],
+        'removed': [key for key in old if key not in new],
+    }
+
+def _evidence_methods(method_dict: Dict[str, Any]) -> set:
+    return {details['Evidence Method'].lower() for details in method_dict.values()}
+
+def diff_extractions(old: Extraction, new: Extraction) -> Dict[str, Any]:
+    """Compare two sets of (bper_dict, doc_dict, attestation_dict, method_dict).
+
+    Args:
+        old: Dictionaries for the previous version
+        new: Dictionaries for the new version
+
+    Returns:
+        Change set: added/removed keys per category, BPERs whose TLA flag changed, checks whose evidence
+        method changed (old and new), evidence methods added/removed, and the stages affected
+    """
+    old_bpers, old_docs, old_atts, old_methods = old
+    new_bpers, new_docs, new_atts, new_methods = new
+
+    bpers = _key_diff(old_bpers, new_bpers)
+    bpers['tla_changed'] = [key for key in new_bpers if key in old_bpers and bool(new_bpers[key].get('TLA')) != bool(old_bpers[key].get('TLA'))]
+
+    checks = _key_diff(old_methods, new_methods)
+    checks['method_changed'] = {
+        stig_id: {'old': old_methods[stig_id]['Evidence Method'], 'new': details['Evidence Method']}
+        for stig_id, details in new_methods.items()
+        if stig_id in old_methods and old_methods[stig_id]['Evidence Method'] != details['Evidence Method']
+    }
+
+    old_evidence, new_evidence = _evidence_methods(old_methods), _evidence_methods(new_methods)
+    change_set = {
+        'BPERs': bpers,
+        'Documents': _key_diff(old_docs, new_docs),
+        'Attestations': _key_diff(old_atts, new_atts),
+        'Checks': checks,
+        'Evidence Methods': {'added': sorted(new_evidence - old_evidence), 'removed': sorted(old_evidence - new_evidence)},
+        'Had attestations': bool(old_atts),
+        'Has attestations': bool(new_atts),
+    }
+    change_set['Stages'] = affected_stages(change_set)
+    return change_set
+
+def affected_stages(change_set: Dict[str, Any]) -> List[str]:
+    """Project stages that need re-running for a change set.
+
+    Args:
+        change_set: Result of diff_extractions
+
+    Returns:
+        Stage names (STAGE_* constants) in pipeline order
+    """
+    items_changed = any(change_set[category]['added'] or change_set[category]['removed'] for category in ('BPERs', 'Documents', 'Attestations'))
+    checks = change_set['Checks']
+    checks_changed = bool(checks['added'] or checks['removed'] or checks['method_changed'])
+    evidence = change_set['Evidence Methods']
+
+    stages = []
+    if (evidence['added'] or evidence['removed']) or change_set['Has attestations'] != change_set['Had attestations']:
+        stages.append(STAGE_DIRECTORIES)
+    if checks_changed:
+        stages.append(STAGE_TEMPLATES)
+    if any(change_set[category]['added'] for category in ('BPERs', 'Documents', 'Attestations')):
+        stages.append(STAGE_GATHER)
+    if items_changed or checks_changed or change_set['BPERs']['tla_changed']:
+        stages.append(STAGE_CHECKLISTS)
+    return stages
+
+def has_changes(change_set: Dict[str, Any]) -> bool:
+    """True if anything at all differs."""
+    return bool(change_set['Stages'])
+
+def diff_scc_files(old_path: str, new_path: str, engine: str = 'streaming') -> Dict[str, Any]:
+    """Change set between two SCC workbooks (normally _03 and _04 of the same SCC).
+
+    Args:
+        old_path: Previous version
+        new_path: New version
+        engine: scc_read engine to use
+
+    Returns:
+        Change set (see diff_extractions), with 'SCC' set to the new file's SCC name
+    """
+    change_set = diff_extractions(scc_read.process_excel_file(old_path, engine), scc_read.process_excel_file(new_path, engine))
+    change_set['SCC'] = scc_read.get_scc_name(new_path)
+    return change_set
+
+def extraction_from_progress(progress_data: Dict[str, Any], scc_name: str) -> Extraction:
+    """Rebuild an SCC's extracted dictionaries from what progress.json holds for it.
+
+    Args:
+        progress_data: Loaded progress.json
+        scc_name: SCC name (no version suffix)
+
+    Returns:
+        (bper_dict, doc_dict, attestation_dict, method_dict) shaped like scc_read's output
+    """
+    def entries_for(category: str) -> Dict[str, Any]:
+        found = {}
+        for key, entries in progress_data.get(category, {}).items():
+            for entry in entries:
+                if entry.get('SCC') == scc_name:
+                    found.setdefault(key, entry)
+        return found
+
+    method_dict = {stig_id: {'SCC': scc_name, 'STIG ID': stig_id, 'Evidence Method': check.get('Evidence method', '')}
+                   for stig_id, check in scc_checks.ChecksTable.for_progress(progress_data).checks_for(scc_name).items()}
+    return entries_for('BPERs'), entries_for('Documents'), entries_for('Attestations'), method_dict
+
+def diff_against_progress(file_path: str, progress_data: Dict[str, Any], engine: str = 'streaming') -> Dict[str, Any]:
+    """Change set between an SCC workbook and the entries progress.json has for that SCC.
+
+    Args:
+        file_path: SCC workbook (any version)
+        progress_data: Loaded progress.json
+        engine: scc_read engine to use
+
+    Returns:
+        Change set (see diff_extractions)
+    """
+    scc_name = scc_read.get_scc_name(file_path)
+    change_set = diff_extractions(extraction_from_progress(progress_data, scc_name), scc_read.process_excel_file(file_path, engine))
+    change_set['SCC'] = scc_name
+    return change_set
+
+def print_change_set(change_set: Dict[str, Any]) -> None:
+    """Readable summary of a change set."""
+    print(f"SCC: {change_set['SCC']}")
+    for category in ('BPERs', 'Documents', 'Attestations', 'Checks', 'Evidence Methods'):
+        changes = change_set[category]
+        for kind in ('added', 'removed'):
+            if changes[kind]:
+                print(f"  {category} {kind} ({len(changes[kind])}): {', '.join(changes[kind])}")
+    for bper in change_set['BPERs']['tla_changed']:
+        print(f"  BPER TLA changed: {bper}")
+    for stig_id, change in change_set['Checks']['method_changed'].items():
+        print(f"  {stig_id}: {change['old']} -> {change['new']}")
+    print(f"  Stages to re-run: {', '.join(change_set['Stages']) or 'none'}")
+
+def main() -> None:
+    """Run from command line."""
+    parser = argparse.ArgumentParser(description='Show what changed between two SCC versions, or between an SCC and progress.json.')
+    parser.add_argument('file_path', type=str, help='New SCC version')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--old', type=str, help='Previous SCC version to compare against')
+    source.add_argument('--progress', type=str, help='progress.json to compare against')
+    parser.add_argument('--engine', choices=scc_read.ENGINES[:2], default='streaming', help='Workbook reader to use')
+    parser.add_argument('--json', action='store_true', help='Print the change set as JSON')
+    args = parser.parse_args()
+
+    for path in (args.file_path, args.old or args.progress):
+        if not os.path.isfile(path):
+            print(f"File not found: {path}")
+            return
+
+    if args.old:
+        change_set = diff_scc_files(args.old, args.file_path, args.engine)
+    else:
+        change_set = diff_against_progress(args.file_path, progress_store.get_store(args.progress).data, args.engine) # migrated to the current layout on load
+
+    if args.json:
+        print(json.dumps(change_set, indent=4))
+    else:
+        print_change_set(change_set)
+
+if __name__ == "__main__":
+    main()
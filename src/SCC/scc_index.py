@@ -0,0 +1,72 @@
+"""Which SCCs reference each BPER, supporting document and attestation, and which items each SCC references.
+
+SCCEntries holds the entries of the item sections keyed by SCC and item, so per-SCC passes (checklists, syncing, directory
+building) take their slice directly, and inserts can find an existing (item, SCC) entry without a scan. The other direction,
+an item's SCCs, is read from the item's own entries. ProgressStore keeps one SCCEntries over the live progress data and regroups a
+section when it's edited outside the store, so there is one grouping and nothing on disk to fall out of step with progress.json
+(earlier versions also kept an item_index.json; it's no longer read and can be deleted).
+
+Classes:
+    SCCEntries: SCC -> item -> entry groups over the live entries in progress data
+"""
+
+from typing import Any, Dict, List, Optional
+
+CATEGORIES = ('BPERs', 'Documents', 'Attestations') # progress.json sections that are grouped
+
+class SCCEntries:
+    """Entries of each item section keyed by SCC and item. The groups hold the entries from progress data themselves, so field
+    edits show up straight away. ProgressStore also uses them to keep (item, SCC) unique: an insert looks the pair up here
+    instead of scanning the item's list, and add/remove keep the groups in step. Edits made to the sections directly need regroup."""
+
+    def __init__(self, progress_data: Dict[str, Any]):
+        """
+        Args:
+            progress_data: Loaded progress.json; every section is grouped in one pass each
+        """
+        self.progress_data = progress_data
+        self.groups: Dict[str, Dict[str, Dict[str, Any]]] = {} # category -> SCC -> item -> entry
+        self.regroup(*CATEGORIES)
+
+    def regroup(self, *categories: str) -> None:
+        """Rebuild the groups for sections whose entries were added, removed or replaced. If an item has two entries for one SCC the first is grouped."""
+        for category in categories:
+            groups = self.groups[category] = {}
+            for item, entries in self.progress_data.get(category, {}).items():
+                for entry in entries:
+                    groups.setdefault(entry.get('SCC'), {}).setdefault(item, entry)
+
+    def get(self, category: str, item: str, scc_name: str) -> Optional[Any]:
+        """An item's entry for one SCC, or None if it doesn't have one."""
+        return self.groups[category].get(scc_name, {}).get(item)
+
+    def add(self, category: str, item: str, entry: Any) -> None:
+        """Group an entry that was just appended to its item's list."""
+        self.groups[category].setdefault(entry.get('SCC'), {})[item] = entry
+
+    def remove(self, category: str, item: str, scc_name: str) -> None:
+        """Ungroup an item's entry for one SCC once it's been taken out of progress data."""
+        scc_items = self.groups[category].get(scc_name)
+        if scc_items is not None:
+            scc_items.pop(item, None)
+            if not scc_items:
+                del self.groups[category][scc_name]
+
+    def entries_for(self, category: str, scc_name: str) -> List[Any]:
+        """(item, entry) pairs one SCC has in a section, in progress.json order. The entries are the live ones; edits to them are edits to the progress data."""
+        return list(self.groups[category].get(scc_name, {}).items())
+
+    def items_for(self, category: str, scc_name: str) -> List[str]:
+        """Items one SCC has an entry for in a section."""
+        return list(self.groups[category].get(scc_name, {}))
+
+    def sccs_for(self, category: str, item: str) -> List[str]:
+        """SCCs with an entry for an item, read from the item's live entries so it can't go stale."""
+        return list(dict.fromkeys(entry.get('SCC') for entry in self.progress_data.get(category, {}).get(item, []) if entry.get('SCC')))
+
+    def has_entries(self, category: str, scc_name: str) -> bool:
+        return bool(self.groups[category].get(scc_name))
+
+    def sccs(self, category: str) -> List[str]:
+        """SCCs with at least one entry in a section."""
+        return [scc_name for scc_name in self.groups[category] if scc_name]
@@ -0,0 +1,114 @@
+"""Parallel SCC ingestion. Fans SCC workbooks out to a process pool (openpyxl parsing is CPU-bound, so threads don't help) and hands the results back in the same order the files were given, so callers can merge them exactly like the serial loop did.
+
+Cached results (see scc_cache) are handed back without touching the pool; only the misses get parsed. For the full analysis, misses also reuse the cached extracts of any sheets whose content hasn't changed (a new SCC version usually only touches a few).
+
+Functions:
+    ingest_scc_files: Analyze a list of SCC files, serially or across worker processes
+    list_scc_files: SCC workbooks in a directory, in os.listdir order
+    resolve_workers: Turn a configured worker count into the number of processes to use
+
+Note: on Windows the pool starts workers by re-importing the main script, so any script calling this needs an if __name__ == "__main__": guard around its startup code.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
+
+from src.SCC import scc_analyze
+from src.SCC import scc_xml
+from src.SCC.scc_cache import SCCParseCache
+
+def list_scc_files(directory: str) -> List[str]:
+    """SCC workbooks in a directory, in the same order the serial loops picked them up.
+
+    Args:
+        directory: Directory containing SCC files
+
+    Returns:
+        Full paths of the .xlsx/.xls files
+    """
+    return [os.path.join(directory, file) for file in os.listdir(directory) if file.endswith('.xlsx') or file.endswith('.xls')]
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Turn a configured worker count into the number of processes to use.
+
+    Args:
+        workers: Configured count; None or 0 means one per CPU
+
+    Returns:
+        Worker count, at least 1
+    """
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, int(workers))
+
+def _run_safely(analyzer: Callable[[str], Any], file_path: str) -> Tuple[Any, Optional[str]]:
+    """Run the analyzer on one file, catching errors so one bad SCC doesn't take down the whole pool."""
+    try:
+        return analyzer(file_path), None
+    except Exception as e:
+        return None, str(e)
+
+def _is_cacheable(result: Any) -> bool:
+    """Don't cache the empty results the analyzers return when a workbook fails to load; the next pull should retry it."""
+    if isinstance(result, tuple):
+        return any(result)
+    return bool(result)
+
+def _sheet_tasks(analyzer: Callable[[str], Any], file_paths: List[str], cache: SCCParseCache) -> List[Callable[[str], Any]]:
+    """One scc_analyze.analyze_scc_sheets call per file, primed with the cached extracts of its unchanged sheets."""
+    engine = getattr(analyzer, 'keywords', {}).get('engine', 'streaming')
+    tasks = []
+    for file_path in file_paths:
+        sheet_hashes = scc_xml.sheet_content_hashes(file_path)
+        tasks.append(partial(scc_analyze.analyze_scc_sheets, known_sheets=cache.known_sheets(sheet_hashes), engine=engine, sheet_hashes=sheet_hashes))
+    return tasks
+
+def ingest_scc_files(file_paths: List[str], workers: Optional[int] = None, analyzer: Callable[[str], Any] = scc_analyze.analyze_scc_file, cache: Optional[SCCParseCache] = None) -> List[Tuple[str, Any, Optional[str]]]:
+    """Analyze SCC files, across a process pool when more than one worker is configured.
+
+    Results come back in the order of file_paths regardless of which worker finished first, so merging
+    them in a loop gives the same progress data as the serial path.
+
+    Args:
+        file_paths: SCC files to process
+        workers: Number of worker processes; None/0 = one per CPU, 1 = serial in this process
+        analyzer: Module-level function run on each file (must be picklable); defaults to scc_analyze.analyze_scc_file
+        cache: Parse cache to read hits from and store new results in (caller saves it)
+
+    Returns:
+        List of (file_path, result, error) tuples; result is None and error holds the message if the file failed
+    """
+    file_paths = list(file_paths)
+    outcomes = {}
+    if cache is not None:
+        for file_path in file_paths:
+            cached = cache.get(file_path, analyzer)
+            if cached is not None:
+                outcomes[file_path] = (cached, None)
+        if outcomes:
+            print(f"Using cached results for {len(outcomes)} of {len(file_paths)} SCC files")
+
+    to_parse = [file_path for file_path in dict.fromkeys(file_paths) if file_path not in outcomes]
+    workers = min(resolve_workers(workers), len(to_parse))
+
+    per_sheet = cache is not None and getattr(analyzer, 'func', analyzer) is scc_analyze.analyze_scc_file # full analysis can reuse unchanged sheets
+    tasks = _sheet_tasks(analyzer, to_parse, cache) if per_sheet else [analyzer] * len(to_parse)
+
+    if workers <= 1:
+        parsed = [_run_safely(task, file_path) for task, file_path in zip(tasks, to_parse)]
+    else:
+        print(f"Processing {len(to_parse)} SCC files with {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(_run_safely, tasks, to_parse)) # map keeps input order
+
+    for file_path, (result, error) in zip(to_parse, parsed):
+        sheet_extracts = None
+        if per_sheet and error is None:
+            result, sheet_extracts = result
+        outcomes[file_path] = (result, error)
+        if cache is not None and error is None and _is_cacheable(result):
+            cache.put(file_path, analyzer, result, sheet_extracts)
+
+    return [(file_path,) + outcomes[file_path] for file_path in file_paths]
@@ -0,0 +1,127 @@
+"""Cheap freshness probe for .xlsx SCCs: says whether a workbook changed, and when it was last saved, without parsing it.
+
+An .xlsx is a zip. Its central directory lists every part with a CRC-32 and size, so hashing that list fingerprints the
+workbook's contents without decompressing anything, and docProps/core.xml (a few hundred bytes) has the modified timestamp,
+lastModifiedBy and revision that Excel writes on save. Unlike filesystem mtime, none of that changes when a file is copied.
+
+Classes:
+    SCCProbe: What the probe found for one file
+
+Functions:
+    probe_scc_file: Probe one SCC
+    latest_version: Most recently saved of several versions of an SCC
+    parse_stamp: Fingerprint plus parser version, recorded on an SCC entry once it has been merged into progress data
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import zipfile
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+from lxml import etree
+
+from src.SCC.scc_cache import CACHE_VERSION
+
+CORE_PROPERTIES_PATH = 'docProps/core.xml'
+CP_NS = 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties'
+DCTERMS_NS = 'http://purl.org/dc/terms/'
+
+class SCCProbe(NamedTuple):
+    """Zip metadata for one SCC workbook."""
+    file_path: str
+    fingerprint: str # SHA-1 of the central directory's (name, CRC-32, size) entries
+    modified: Optional[datetime] # dcterms:modified (UTC), None if the workbook doesn't record it
+    last_modified_by: Optional[str]
+    revision: Optional[int]
+
+def _core_datetime(value: Optional[str]) -> Optional[datetime]:
+    """W3CDTF timestamp from core.xml as an aware UTC datetime (no zone is taken as UTC)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(re.sub(r'Z$', '+00:00', value.strip())) # fromisoformat only takes 'Z' from 3.11
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed.astimezone(timezone.utc)
+
+def probe_scc_file(file_path: str) -> Optional[SCCProbe]:
+    """Fingerprint and save metadata for an SCC, from the zip central directory and docProps/core.xml only.
+
+    Args:
+        file_path: .xlsx SCC
+
+    Returns:
+        SCCProbe, or None if the file can't be opened as a zip (e.g. an old .xls)
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            digest = hashlib.sha1()
+            for info in sorted(archive.infolist(), key=lambda info: info.filename):
+                digest.update(f"{info.filename}\0{info.CRC:08x}\0{info.file_size}\n".encode('utf-8'))
+            try:
+                core = etree.fromstring(archive.read(CORE_PROPERTIES_PATH))
+            except (KeyError, etree.XMLSyntaxError):
+                core = None
+    except (zipfile.BadZipFile, OSError):
+        return None
+
+    modified = last_modified_by = revision = None
+    if core is not None:
+        modified = _core_datetime(core.findtext(f'{{{DCTERMS_NS}}}modified'))
+        last_modified_by = core.findtext(f'{{{CP_NS}}}lastModifiedBy')
+        revision_text = (core.findtext(f'{{{CP_NS}}}revision') or '').strip()
+        revision = int(revision_text) if revision_text.isdigit() else None
+    return SCCProbe(file_path, digest.hexdigest(), modified, last_modified_by, revision)
+
+def _version_number(file_path: str) -> int:
+    """The trailing _## version from an SCC file name, 0 if there isn't one."""
+    match = re.search(r'_(\d+)$', os.path.splitext(os.path.basename(file_path))[0])
+    return int(match.group(1)) if match else 0
+
+def latest_version(file_paths: List[str], probes: Optional[Dict[str, Optional[SCCProbe]]] = None) -> Optional[str]:
+    """The most recently saved of several versions of one SCC.
+
+    Ordered by core.xml modified time, then revision, then the _## version in the file name. Files the probe can't read go last.
+
+    Args:
+        file_paths: Candidate files
+        probes: Probes already taken, by path; anything not in it is probed here
+
+    Returns:
+        Path of the latest version, or None if there are no candidates
+    """
+    def sort_key(probe_and_path):
+        probe, file_path = probe_and_path
+        if probe is None:
+            return (False, datetime.min.replace(tzinfo=timezone.utc), -1, _version_number(file_path))
+        return (True, probe.modified or datetime.min.replace(tzinfo=timezone.utc), probe.revision or 0, _version_number(file_path))
+
+    if not file_paths:
+        return None
+    probes = probes if probes is not None else {}
+    return max(((probes[file_path] if file_path in probes else probe_scc_file(file_path), file_path) for file_path in file_paths), key=sort_key)[1]
+
+def parse_stamp(probe: Optional[SCCProbe]) -> Optional[str]:
+    """What an SCC entry records once the file has been merged. The parser version is part of it, so a parser change still reparses everything."""
+    return f"{CACHE_VERSION}:{probe.fingerprint}" if probe else None
+
+def main() -> None:
+    """Run from command line."""
+    parser = argparse.ArgumentParser(description='Show zip metadata for SCC files without parsing them.')
+    parser.add_argument('file_paths', nargs='+', type=str, help='SCC files (versions of the same SCC to see which is latest)')
+    args = parser.parse_args()
+
+    for file_path in args.file_paths:
+        probe = probe_scc_file(file_path)
+        if probe is None:
+            print(f"{file_path}: not an xlsx zip")
+            continue
+        print(f"{file_path}: modified {probe.modified.isoformat() if probe.modified else 'unknown'} by {probe.last_modified_by or 'unknown'}, revision {probe.revision}, fingerprint {probe.fingerprint}")
+    if len(args.file_paths) > 1:
+        print(f"Latest: {latest_version(args.file_paths)}")
+
+if __name__ == "__main__":
+    main()
@@ -7,21 +7,30 @@ import argparse
 import os
 import logging
 
+from src.SCC import scc_schema
+from src.SCC import scc_xml
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def read_excel(file_path):
+ATTESTATION_PATTERN = re.compile(r'(?<!\w)\d{6}(?!\w)')
+ENGINES = ('streaming', 'xml', 'cell') # workbook readers process_excel_file can use
+BPER_ROLES = ('exception', 'deviation', 'tla') # columns a BPER can be referenced from, in column precedence order
+MAX_EMPTY_ROWS = 500 # a run of this many rows with nothing in the key columns is treated as the end of the data
+
+def read_excel(file_path, read_only=False):
     """
     Load an Excel workbook from the specified file path.
     
     Args:
     file_path (str): Path to the Excel file.
+    read_only (bool): Open the workbook in openpyxl's read-only (streaming) mode. Sheets can then only be walked with iter_rows, and the workbook should be closed when done.
     
     Returns:
     openpyxl.Workbook or None: The loaded workbook, or None if there was an error.
     """
     try:
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = openpyxl.load_workbook(file_path, read_only=read_only, data_only=True)
         return workbook
     except PermissionError:
         logging.error(f"Permission denied: Unable to access '{file_path}'. The file may be open in another program.")
@@ -29,6 +38,52 @@ def read_excel(file_path):
         logging.error(f"Unexpected error while reading '{file_path}': {e}")
     return None
 
+def open_workbook(file_path, engine='streaming'):
+    """
+    Open an SCC read-only with the chosen engine.
+    
+    Args:
+    file_path (str): Path to the Excel file.
+    engine (str): 'xml' tries the direct-XML reader (scc_xml) first and falls back to openpyxl for files it doesn't handle; anything else uses openpyxl read-only.
+    
+    Returns:
+    Workbook or None: An XmlWorkbook or read-only openpyxl workbook (close it when done), or None if there was an error.
+    """
+    if engine == 'xml':
+        try:
+            return scc_xml.XmlWorkbook(file_path)
+        except scc_xml.XmlWorkbookUnsupported as e:
+            logging.info(f"Using openpyxl for '{file_path}': {e}")
+    return read_excel(file_path, read_only=True)
+
+def with_workbook(file_path, engine, action):
+    """
+    Open an SCC, run action on it and close it. If the direct-XML reader runs into something it doesn't handle partway through, the whole action is redone with openpyxl so results never come from a mix of the two.
+    
+    Args:
+    file_path (str): Path to the Excel file.
+    engine (str): 'streaming' or 'xml' (see open_workbook).
+    action (callable): Function taking the workbook.
+    
+    Returns:
+    Whatever action returns, or None if the workbook couldn't be opened.
+    """
+    workbook = open_workbook(file_path, engine)
+    if workbook is None:
+        return None
+    try:
+        return action(workbook)
+    except scc_xml.XmlWorkbookUnsupported as e:
+        logging.info(f"Using openpyxl for '{file_path}': {e}")
+        workbook.close()
+        workbook = read_excel(file_path, read_only=True)
+        if workbook is None:
+            return None
+        return action(workbook)
+    finally:
+        if workbook is not None:
+            workbook.close() # read-only workbooks keep the file handle open until closed
+
 def find_unique_values(sheet, column_index):
     """
     Find unique values in a specific column of the sheet.
@@ -41,7 +96,7 @@ def find_unique_values(sheet, column_index):
     set: A set of unique values found in the column.
     """
     unique_values = set()
-    for row in sheet.iter_rows(min_row=2, max_row=1000, min_col=column_index, max_col=column_index, values_only=True):
+    for row in iter_data_rows(sheet.iter_rows(min_row=2, min_col=column_index, max_col=column_index, values_only=True)):
         cell_value = row[0]
         if cell_value:
             unique_values.add(str(cell_value))
@@ -88,15 +143,15 @@ def process_bper_columns(sheet, row_index, exception_col, deviation_col, tla_col
     scc_name (str): The name of the current SCC.
     
     Returns:
-    list: A list of tuples containing BPER information (bper_value, is_tla, scc_name).
+    list: A list of tuples containing BPER information (bper_value, is_tla, scc_name, role).
     """
     bper_info = []
-    for col_index in [exception_col, deviation_col, tla_col]:
+    for role, col_index in zip(BPER_ROLES, [exception_col, deviation_col, tla_col]):
         if col_index is not None:
             cell_value = sheet.cell(row=row_index, column=col_index).value
             bper_values = extract_bpers_from_cell(cell_value)
             for bper_value in bper_values:
-                bper_info.append((bper_value, col_index == tla_col, scc_name))
+                bper_info.append((bper_value, col_index == tla_col, scc_name, role))
     return bper_info
 
 def update_bper_dict(bper_dict, bper_value, scc_name, is_tla):
@@ -119,7 +174,8 @@ def update_bper_dict(bper_dict, bper_value, scc_name, is_tla):
             'Approval Status': '',
             'Valid to': '',
             'Gathered': False,
-            'TLA': is_tla
+            'TLA': is_tla,
+            'Roles': []
         }
         logging.info(f"Added new BPER entry: {bper_value} for SCC {scc_name}")
     elif bper_dict[bper_value]['SCC'] == scc_name:
@@ -131,6 +187,22 @@ def update_bper_dict(bper_dict, bper_value, scc_name, is_tla):
 
     return bper_dict
 
+def add_bper_roles(bper_dict, bper_value, scc_name, roles):
+    """
+    Record which columns (exception, deviation, tla) an SCC references a BPER from, on that SCC's entry.
+    
+    Args:
+    bper_dict (dict): The current BPER dictionary.
+    bper_value (str): The BPER number.
+    scc_name (str): The name of the current SCC.
+    roles (iterable): Roles seen for the BPER (values from BPER_ROLES).
+    """
+    entry = bper_dict.get(bper_value)
+    if entry is None or entry['SCC'] != scc_name:
+        return
+    seen = set(entry.setdefault('Roles', [])) | set(roles)
+    entry['Roles'] = [role for role in BPER_ROLES if role in seen] # always in column order, so entries compare equal however they were built
+
 def load_progress_data(progress_file):
     """
     Load existing progress data from progress.json.
@@ -151,10 +223,315 @@ def load_progress_data(progress_file):
         logging.error(f"Error decoding JSON from {progress_file}. Starting with empty data.")
         return {'BPERs': {}, 'Documents': {}, 'Attestations': {}, 'Checks': {}}
 
-def process_excel_file(file_path):
+def find_header_columns(header_row):
+    """
+    Work out which columns hold the Exception, Deviation, TLA, Documentation and Method values from a sheet's header row (see scc_schema.detect_header_schema).
+    
+    Args:
+    header_row (tuple): Values of the first row of the sheet.
+    
+    Returns:
+    tuple: 1-based column indexes (exception, deviation, tla, documentation, method), None for any not found.
+    """
+    return scc_schema.detect_header_schema(tuple(header_row)).columns
+
+def documentation_items(value):
+    """
+    Split a Documentation cell into the attestation numbers and supporting document names it lists.
+    
+    Args:
+    value: The content of the Documentation cell.
+    
+    Yields:
+    tuple: ('attestation', number) or ('document', name), in the order they appear.
+    """
+    if not value:
+        return
+    for doc_name in split_documentation_text(str(value)):
+        doc_name_for_comparison = doc_name.replace('\n', '').strip().upper()
+        if doc_name_for_comparison in ['NA', 'N/A', 'NO', 'NONE']:
+            continue
+        attestation_match = ATTESTATION_PATTERN.search(doc_name)
+        if attestation_match:
+            yield 'attestation', attestation_match.group()
+        else:
+            doc_name_final = re.sub(r'\b\d{6}\b', '', doc_name).strip()
+            if doc_name_final:
+                yield 'document', doc_name_final
+
+def add_attestation(attestation_dict, attestation_num, scc_name):
+    """
+    Add an attestation entry unless the number is already in the dictionary.
+    """
+    if attestation_num not in attestation_dict:
+        attestation_dict[attestation_num] = {
+            'SCC': scc_name,
+            'Attestation num': attestation_num,
+            'Gathered': False,
+            'Approval Status': '',
+            'Valid to': ''
+        }
+
+def add_document(doc_dict, doc_name, scc_name):
+    """
+    Add a supporting document entry unless the name is already in the dictionary.
+    """
+    if doc_name not in doc_dict:
+        doc_dict[doc_name] = {
+            'SCC': scc_name,
+            'Doc name': doc_name,
+            'Version': '',
+            'Last update': '',
+            'Gathered': False
+        }
+
+def process_documentation_value(value, scc_name, doc_dict, attestation_dict):
+    """
+    Split a Documentation cell into attestation numbers and supporting document names and add them to the dictionaries.
+    
+    Args:
+    value: The content of the Documentation cell.
+    scc_name (str): The name of the current SCC.
+    doc_dict (dict): Document dictionary, updated in place.
+    attestation_dict (dict): Attestation dictionary, updated in place.
+    """
+    for kind, name in documentation_items(value):
+        if kind == 'attestation':
+            add_attestation(attestation_dict, name, scc_name)
+        else:
+            add_document(doc_dict, name, scc_name)
+
+def process_method_value(method_value, stig_id_value, scc_name, method_dict):
+    """
+    Record the compliance method for a STIG ID.
+    
+    Args:
+    method_value: The content of the Method cell.
+    stig_id_value: The content of the first (STIG ID) cell of the row.
+    scc_name (str): The name of the current SCC.
+    method_dict (dict): Compliance method dictionary, updated in place.
+    """
+    if method_value is None:
+        return
+    stig_id = str(stig_id_value)
+    method_dict[stig_id] = {
+        'SCC': scc_name,
+        'STIG ID': stig_id,
+        'Evidence Method': str(method_value),
+        'compliant': '',
+        'Gathered': False
+    }
+
+def get_scc_name(file_path):
+    """
+    Build the SCC name from a file path (no extension, no trailing _## version).
+    
+    Args:
+    file_path (str): Path to the SCC file.
+    
+    Returns:
+    str: The SCC name.
+    """
+    scc_name = os.path.splitext(os.path.basename(file_path))[0]
+    return re.sub(r'_\d{2}$', '', scc_name).strip()
+
+def row_value(row, col_index):
+    """
+    Get a value out of a row tuple by 1-based column index. Read-only rows can come back shorter than the header, so anything past the end is None.
+    
+    Args:
+    row (tuple): Row values from iter_rows(values_only=True).
+    col_index (int): 1-based column index, or None.
+    
+    Returns:
+    The cell value, or None.
+    """
+    if col_index is None or col_index > len(row):
+        return None
+    return row[col_index - 1]
+
+def row_is_empty(row, key_cols=None):
+    """
+    Check whether a row has nothing in its key columns.
+    
+    Args:
+    row (tuple): Row values from iter_rows(values_only=True).
+    key_cols (list): 1-based column indexes to look at, or None for the whole row.
+    
+    Returns:
+    bool: True if every key column is empty.
+    """
+    if key_cols is None:
+        return all(value is None for value in row)
+    return all(row_value(row, col_index) is None for col_index in key_cols)
+
+def iter_data_rows(rows, key_cols=None, max_empty_rows=MAX_EMPTY_ROWS):
+    """
+    Yield rows until the real end of the data. Sheets that once had formatting applied down to row 1,048,576 report a huge max_row, so instead of trusting it, stop after a run of max_empty_rows rows with nothing in the key columns.
+    
+    Args:
+    rows (iterator): Rows from iter_rows(values_only=True).
+    key_cols (list): 1-based column indexes that count as data, or None for the whole row.
+    max_empty_rows (int): Length of the empty run that ends the data; None reads every row.
+    
+    Yields:
+    tuple: Each row up to the end of the data (empty rows in between included).
+    """
+    empty_run = 0
+    for row in rows:
+        if row_is_empty(row, key_cols):
+            empty_run += 1
+            if max_empty_rows is not None and empty_run >= max_empty_rows:
+                return
+        else:
+            empty_run = 0
+        yield row
+
+def find_last_data_row(sheet, key_cols, min_row=2, max_empty_rows=MAX_EMPTY_ROWS):
+    """
+    Find the last row that has something in the key columns, without walking phantom formatted rows all the way to max_row.
+    
+    Args:
+    sheet (openpyxl.worksheet.worksheet.Worksheet): The worksheet to check.
+    key_cols (list): 1-based column indexes that count as data.
+    min_row (int): First data row.
+    max_empty_rows (int): Length of the empty run that ends the data; None reads every row.
+    
+    Returns:
+    int: Last populated row number, or min_row - 1 if there is none.
+    """
+    last_row = min_row - 1
+    if not key_cols:
+        return last_row
+    rows = sheet.iter_rows(min_row=min_row, max_col=max(key_cols), values_only=True)
+    for row_index, row in enumerate(iter_data_rows(rows, key_cols, max_empty_rows), start=min_row):
+        if not row_is_empty(row, key_cols):
+            last_row = row_index
+    return last_row
+
+def process_excel_file(file_path, engine='streaming'):
     """
     Process an Excel file to extract BPERs, documents, attestations, and compliance methods.
     
+    Args:
+    file_path (str): Path to the Excel file to process.
+    engine (str): 'streaming' opens the workbook read-only and walks each sheet once with iter_rows; 'xml' does the same walk straight off the sheet XML (scc_xml), falling back to openpyxl for unusual files; 'cell' is the original random-access reader.
+    
+    Returns:
+    tuple: Dictionaries containing BPERs, documents, attestations, and compliance methods.
+    """
+    if engine == 'cell':
+        return process_excel_file_by_cell(file_path)
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown SCC read engine: {engine}")
+
+    logging.info(f'Processing {file_path}')
+    result = with_workbook(file_path, engine, lambda workbook: extract_from_workbook(workbook, get_scc_name(file_path)))
+
+    if result is None:
+        logging.error(f"Skipping file due to error: {file_path}")
+        return {}, {}, {}, {}
+
+    bper_dict, doc_dict, attestation_dict, method_dict = result
+
+    logging.info(f"Extracted {len(bper_dict)} BPERs, {len(doc_dict)} documents, {len(attestation_dict)} attestations, and {len(method_dict)} compliance methods from {file_path}")
+    return bper_dict, doc_dict, attestation_dict, method_dict
+
+def extract_from_workbook(workbook, scc_name, max_empty_rows=MAX_EMPTY_ROWS):
+    """
+    Walk every sheet after the first once with iter_rows and build the BPER, document, attestation and compliance method dictionaries. Works on normal and read-only workbooks.
+    
+    Args:
+    workbook (openpyxl.Workbook): An already loaded workbook.
+    scc_name (str): The name of the SCC the workbook belongs to.
+    max_empty_rows (int): Stop reading a sheet after this many rows in a row with nothing in the columns we pull from (see iter_data_rows).
+    
+    Returns:
+    tuple: Dictionaries containing BPERs, documents, attestations, and compliance methods.
+    """
+    sheet_extracts = [extract_sheet(workbook[sheet_name], schema.columns, max_empty_rows)
+                      for sheet_name, schema in scc_schema.sheet_schemas(workbook).items()] # header maps are shared with the scc_check column checks
+    return merge_sheet_extracts(sheet_extracts, scc_name)
+
+def extract_sheet(sheet, columns, max_empty_rows=MAX_EMPTY_ROWS):
+    """
+    Pull the raw BPERs, documents, attestations and compliance methods out of one sheet. The result doesn't depend on which SCC the sheet is in and is plain JSON, so it can be cached by sheet content and reused when a new SCC version leaves the sheet alone.
+    
+    Args:
+    sheet (openpyxl.worksheet.worksheet.Worksheet): The worksheet to read.
+    columns (tuple): 1-based (exception, deviation, tla, documentation, method) columns from the header schema.
+    max_empty_rows (int): Stop after this many rows in a row with nothing in those columns (see iter_data_rows).
+    
+    Returns:
+    dict: 'BPERs' (BPER -> TLA flag), 'BPER roles' (BPER -> columns it appears in), 'Documents' and 'Attestations' (names in order of appearance), 'Methods' (STIG ID -> method, last one wins).
+    """
+    bpers = {}
+    bper_roles = {}
+    documents = {}
+    attestations = {}
+    methods = {}
+
+    exception_col, deviation_col, tla_col, documentation_col, method_col = columns
+    key_cols = [col for col in columns if col]
+    if key_cols: # otherwise there's nothing to pull from this sheet
+        rows = sheet.iter_rows(min_row=2, max_col=max(key_cols + [1]), values_only=True) # only out as far as the last column we use (STIG ID is column 1)
+
+        for row in iter_data_rows(rows, key_cols, max_empty_rows): # one pass per sheet, every column comes from the same row tuple
+            # Process BPERs
+            for role, col_index in zip(BPER_ROLES, [exception_col, deviation_col, tla_col]):
+                if col_index is not None:
+                    for bper_value in extract_bpers_from_cell(row_value(row, col_index)):
+                        bpers[bper_value] = bpers.get(bper_value, False) or col_index == tla_col
+                        roles = bper_roles.setdefault(bper_value, [])
+                        if role not in roles:
+                            roles.append(role)
+
+            # Process documentation
+            if documentation_col:
+                for kind, name in documentation_items(row_value(row, documentation_col)):
+                    (attestations if kind == 'attestation' else documents).setdefault(name, None)
+
+            # Process compliance method
+            if method_col:
+                method_value = row_value(row, method_col)
+                if method_value is not None:
+                    methods[str(row_value(row, 1))] = str(method_value)
+
+    return {'BPERs': bpers, 'BPER roles': bper_roles, 'Documents': list(documents), 'Attestations': list(attestations), 'Methods': methods}
+
+def merge_sheet_extracts(sheet_extracts, scc_name):
+    """
+    Combine per-sheet extracts (in sheet order) into the four SCC dictionaries, giving exactly what a single walk over the workbook would.
+    
+    Args:
+    sheet_extracts (list): Results of extract_sheet, in sheet order.
+    scc_name (str): The name of the SCC the sheets belong to.
+    
+    Returns:
+    tuple: Dictionaries containing BPERs, documents, attestations, and compliance methods.
+    """
+    bper_dict = {}
+    doc_dict = {}
+    attestation_dict = {}
+    method_dict = {}
+
+    for extract in sheet_extracts:
+        for bper_value, is_tla in extract['BPERs'].items():
+            bper_dict = update_bper_dict(bper_dict, bper_value, scc_name, is_tla)
+            add_bper_roles(bper_dict, bper_value, scc_name, extract['BPER roles'].get(bper_value, ()))
+        for doc_name in extract['Documents']:
+            add_document(doc_dict, doc_name, scc_name)
+        for attestation_num in extract['Attestations']:
+            add_attestation(attestation_dict, attestation_num, scc_name)
+        for stig_id, method_value in extract['Methods'].items():
+            process_method_value(method_value, stig_id, scc_name, method_dict)
+
+    return bper_dict, doc_dict, attestation_dict, method_dict
+
+def process_excel_file_by_cell(file_path):
+    """
+    Process an Excel file cell by cell (original engine). Kept for comparison and as a fallback for workbooks the streaming reader has trouble with.
+    
     Args:
     file_path (str): Path to the Excel file to process.
     
@@ -173,84 +550,34 @@ def process_excel_file(file_path):
     attestation_dict = {}
     method_dict = {}
 
-    attestation_pattern = re.compile(r'(?<!\w)\d{6}(?!\w)')
-
-    scc_name = os.path.splitext(os.path.basename(file_path))[0]
-    scc_name = re.sub(r'_\d{2}$', '', scc_name).strip()
+    scc_name = get_scc_name(file_path)
 
     for sheet_name in workbook.sheetnames[1:]:
         sheet = workbook[sheet_name]
-        exception_col = None
-        deviation_col = None
-        tla_col = None
-        documentation_col = None
-        method_col = None
 
         # Find relevant columns
-        for col_index, column in enumerate(sheet.iter_cols(min_row=1, max_row=1, max_col=50, values_only=True), 1):
-            header = str(column[0]).lower() if column[0] else ""
-            if 'exception' in header:
-                exception_col = col_index
-            elif 'deviation' in header:
-                deviation_col = col_index
-            elif 'tla' in header:
-                tla_col = col_index
-            elif 'documentation' in header:
-                documentation_col = col_index
-            elif 'method' in header:
-                method_col = col_index
-
-        # Process rows
-        for row_index in range(2, sheet.max_row + 1):
+        header_row = next(sheet.iter_rows(min_row=1, max_row=1, max_col=50, values_only=True), ())
+        exception_col, deviation_col, tla_col, documentation_col, method_col = find_header_columns(header_row)
+        key_cols = [col for col in (exception_col, deviation_col, tla_col, documentation_col, method_col) if col]
+
+        # Process rows, up to the last one with data rather than sheet.max_row (which counts formatted-but-empty rows)
+        for row_index in range(2, find_last_data_row(sheet, key_cols) + 1):
             # Process BPERs
             bper_info = process_bper_columns(sheet, row_index, exception_col, deviation_col, tla_col, scc_name)
-            for bper_value, is_tla, bper_scc_name in bper_info:
+            for bper_value, is_tla, bper_scc_name, role in bper_info:
                 bper_dict = update_bper_dict(bper_dict, bper_value, bper_scc_name, is_tla)
+                add_bper_roles(bper_dict, bper_value, bper_scc_name, [role])
 
             # Process documentation
             if documentation_col:
                 doc_cell = sheet.cell(row=row_index, column=documentation_col)
-                if doc_cell.value:
-                    doc_names = split_documentation_text(str(doc_cell.value))
-                    for doc_name in doc_names:
-                        doc_name_for_comparison = doc_name.replace('\n', '').strip().upper()
-                        if doc_name_for_comparison not in ['NA', 'N/A', 'NO', 'NONE']:
-                            attestation_match = attestation_pattern.search(doc_name)
-                            if attestation_match:
-                                attestation_num = attestation_match.group()
-                                if attestation_num not in attestation_dict:
-                                    attestation_dict[attestation_num] = {
-                                        'SCC': scc_name,
-                                        'Attestation num': attestation_num,
-                                        'Gathered': False,
-                                        'Approval Status': '',
-                                        'Valid to': ''
-                                    }
-                            else:
-                                doc_name_final = re.sub(r'\b\d{6}\b', '', doc_name).strip()
-                                if doc_name_final and doc_name_final not in doc_dict:
-                                    doc_dict[doc_name_final] = {
-                                        'SCC': scc_name,
-                                        'Doc name': doc_name_final,
-                                        'Version': '',
-                                        'Last update': '',
-                                        'Gathered': False
-                                    }
+                process_documentation_value(doc_cell.value, scc_name, doc_dict, attestation_dict)
 
             # Process compliance method
             if method_col:
                 method_cell = sheet.cell(row=row_index, column=method_col)
                 stig_id_cell = sheet.cell(row=row_index, column=1)
-                if method_cell.value is not None:
-                    method = str(method_cell.value)
-                    stig_id = str(stig_id_cell.value)
-                    method_dict[stig_id] = {
-                        'SCC': scc_name,
-                        'STIG ID': stig_id,
-                        'Evidence Method': method,
-                        'compliant': '',
-                        'Gathered': False
-                    }
+                process_method_value(method_cell.value, stig_id_cell.value, scc_name, method_dict)
 
     logging.info(f"Extracted {len(bper_dict)} BPERs, {len(doc_dict)} documents, {len(attestation_dict)} attestations, and {len(method_dict)} compliance methods from {file_path}")
     return bper_dict, doc_dict, attestation_dict, method_dict
@@ -258,13 +585,14 @@ def process_excel_file(file_path):
 def main():
     parser = argparse.ArgumentParser(description='Grabs BPERs and docs from an SCC.')
     parser.add_argument('file_path', type=str, help='Path to the Excel file')
+    parser.add_argument('--engine', choices=ENGINES, default='streaming', help='Workbook reader to use')
     args = parser.parse_args()
 
     if not os.path.isfile(args.file_path):
         logging.error(f"File not found: {args.file_path}")
         return
 
-    bper_dict, doc_dict, attestation_dict, method_dict = process_excel_file(args.file_path)
+    bper_dict, doc_dict, attestation_dict, method_dict = process_excel_file(args.file_path, engine=args.engine)
 
     # Print results
     print("BPER Names:")
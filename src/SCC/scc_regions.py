@@ -0,0 +1,95 @@
+"""Region-limited SCC loading. Reads only the parts of an SCC the well-formedness checks look at (the first sheet's top rows and the header row of every other sheet) into memory and closes the file, instead of keeping every cell of every sheet around.
+
+With the 'xml' engine the reads stop at the last row of each region and shared strings are only resolved as far as the regions need them, so even large SCCs load in a fraction of the time a full pull takes.
+
+Classes:
+    RegionWorkbook: Loaded regions, with the sheetnames / [] / close surface scc_check and scc_schema use
+    RegionSheet: One sheet's loaded rows, answering iter_rows calls that fall inside them
+
+Functions:
+    load_regions: Load the first sheet block and header rows of an SCC
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.SCC import scc_schema
+from src.SCC.scc_read import with_workbook
+
+FIRST_SHEET_ROWS = 150 # same limit the scc_check first sheet checks use
+
+class RegionSheet:
+    """Rows 1..max_row of a sheet, as read-only iter_rows returned them."""
+
+    def __init__(self, title: str, rows: List[Tuple[Any, ...]], max_row: int, max_col: Optional[int]):
+        """
+        Args:
+            title: Sheet name
+            rows: Row values starting at row 1
+            max_row: Last row the region covers
+            max_col: Last column the region covers, None for every column
+        """
+        self.title = title
+        self._rows = rows
+        self.region_max_row = max_row
+        self.region_max_col = max_col
+
+    def iter_rows(self, min_row: Optional[int] = None, max_row: Optional[int] = None, min_col: Optional[int] = None, max_col: Optional[int] = None, values_only: bool = True) -> Iterator[Tuple[Any, ...]]:
+        """Same arguments and padding as openpyxl's read-only iter_rows, limited to the loaded region.
+
+        Raises:
+            ValueError: If the request reaches outside the region or asks for cells rather than values
+        """
+        if not values_only:
+            raise ValueError("Region sheets only hold values")
+        min_row = min_row or 1
+        min_col = min_col or 1
+        if max_row is None or max_row > self.region_max_row:
+            raise ValueError(f"Sheet '{self.title}' only has rows 1-{self.region_max_row} loaded")
+        if self.region_max_col is not None and (max_col is None or max_col > self.region_max_col):
+            raise ValueError(f"Sheet '{self.title}' only has columns 1-{self.region_max_col} loaded")
+
+        for row in self._rows[min_row - 1:max_row]:
+            if max_col is None:
+                yield row[min_col - 1:]
+            else:
+                values = row[min_col - 1:max_col]
+                yield values + (None,) * (max_col + 1 - min_col - len(values)) # read-only rows are padded out to max_col
+
+class RegionWorkbook:
+    """The loaded regions of one SCC. Nothing to close, the file is already closed."""
+
+    def __init__(self, file_path: str, sheets: Dict[str, RegionSheet]):
+        self.file_path = file_path
+        self._sheets = sheets
+        self.sheetnames = list(sheets)
+
+    def __getitem__(self, sheet_name: str) -> RegionSheet:
+        return self._sheets[sheet_name]
+
+    def close(self) -> None:
+        pass
+
+def _read_regions(workbook: Any, file_path: str, first_sheet_rows: int) -> RegionWorkbook:
+    sheets = {}
+    for index, sheet_name in enumerate(workbook.sheetnames):
+        sheet = workbook[sheet_name]
+        if index == 0: # every column, the review date can be anywhere on the first sheet
+            max_row, max_col = first_sheet_rows, None
+        else:
+            max_row, max_col = 1, scc_schema.MAX_HEADER_COLS
+        rows = [tuple(row) for row in sheet.iter_rows(min_row=1, max_row=max_row, max_col=max_col, values_only=True)]
+        sheets[sheet_name] = RegionSheet(sheet_name, rows, max_row, max_col)
+    return RegionWorkbook(file_path, sheets)
+
+def load_regions(file_path: str, engine: str = 'xml', first_sheet_rows: int = FIRST_SHEET_ROWS) -> Optional[RegionWorkbook]:
+    """Load the first sheet's top rows (every column) and row 1 (first MAX_HEADER_COLS columns) of every other sheet.
+
+    Args:
+        file_path: Path to the SCC
+        engine: 'xml' (scc_xml, falls back to openpyxl) or 'streaming' (openpyxl read-only)
+        first_sheet_rows: How many rows of the first sheet to load
+
+    Returns:
+        RegionWorkbook, or None if the file couldn't be opened (the error is logged)
+    """
+    return with_workbook(file_path, engine, lambda workbook: _read_regions(workbook, file_path, first_sheet_rows))
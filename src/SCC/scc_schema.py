@@ -0,0 +1,122 @@
+"""Header schema detection for SCC sheets. Works out once per sheet which columns hold the Exception, Deviation, TLA, Documentation and Method values, and shares that map between the row extraction (scc_read) and the column presence checks (scc_check).
+
+Detection is cached on the header row itself, so every sheet built from the same template (and every SCC built from it) only gets detected once per process. Each workbook's per-sheet schemas are also kept for as long as the workbook is open, so the header rows are only read once.
+
+Headers that match a column more than once, or one cell that matches several columns, get logged as warnings. The map still picks the same column as before (last match, checked in exception > deviation > tla > documentation > method order).
+
+Functions:
+    detect_header_schema: Column map for one header row (cached)
+    sheet_schemas: Column maps for every sheet after the first in a workbook
+    column_present: Whether any sheet has a header containing a name
+"""
+
+import argparse
+import logging
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+COLUMN_ROLES = ('exception', 'deviation', 'tla', 'documentation', 'method') # matched as substrings, in this order of precedence
+MAX_HEADER_COLS = 50
+
+class HeaderSchema(NamedTuple):
+    """What one header row says about a sheet's layout."""
+    columns: Tuple[Optional[int], ...] # 1-based (exception, deviation, tla, documentation, method), None if missing
+    headers: Tuple[str, ...] # lowercased header text, for presence checks
+    duplicates: Tuple[Tuple[str, Tuple[int, ...]], ...] # (role, columns) where more than one column matched
+    overlaps: Tuple[Tuple[int, Tuple[str, ...]], ...] # (column, roles) where one header matched several roles
+
+    def has_column(self, name: str) -> bool:
+        """True if any header contains name (case-insensitive)."""
+        name = name.lower()
+        return any(name in header for header in self.headers)
+
+    def issues(self) -> list:
+        """Readable descriptions of the duplicate and ambiguous matches."""
+        messages = []
+        for role, cols in self.duplicates:
+            messages.append(f"'{role}' matches columns {', '.join(map(str, cols))}; using column {cols[-1]}")
+        for col, roles in self.overlaps:
+            messages.append(f"column {col} ('{self.headers[col - 1]}') matches {', '.join(roles)}; treated as {roles[0]}")
+        return messages
+
+@lru_cache(maxsize=256)
+def detect_header_schema(header_row: Tuple[Any, ...]) -> HeaderSchema:
+    """Build the column map for a header row. Cached on the row's values, so identical templates skip detection.
+
+    Args:
+        header_row: Values of a sheet's first row (tuple, so it can be hashed)
+
+    Returns:
+        HeaderSchema for the row
+    """
+    headers = tuple(str(value).lower() if value else "" for value in header_row)
+    matched: Dict[str, list] = {role: [] for role in COLUMN_ROLES}
+    overlaps = []
+
+    for col_index, header in enumerate(headers, 1):
+        roles = tuple(role for role in COLUMN_ROLES if role in header)
+        if roles:
+            matched[roles[0]].append(col_index) # first role wins, same as the old elif chain
+        if len(roles) > 1:
+            overlaps.append((col_index, roles))
+
+    columns = tuple(cols[-1] if cols else None for cols in matched.values()) # last match wins, same as before
+    duplicates = tuple((role, tuple(cols)) for role, cols in matched.items() if len(cols) > 1)
+    return HeaderSchema(columns, headers, duplicates, tuple(overlaps))
+
+_workbook_schemas: 'weakref.WeakKeyDictionary[Any, Dict[str, HeaderSchema]]' = weakref.WeakKeyDictionary()
+
+def sheet_schemas(workbook: Any) -> Dict[str, HeaderSchema]:
+    """Header schemas for every sheet after the first, read once per workbook.
+
+    Args:
+        workbook: Loaded SCC workbook (openpyxl, read-only or scc_xml)
+
+    Returns:
+        Dict of sheet name -> HeaderSchema, in sheet order
+    """
+    try:
+        return _workbook_schemas[workbook]
+    except (KeyError, TypeError):
+        pass
+
+    schemas = {}
+    for sheet_name in workbook.sheetnames[1:]:
+        header_row = next(workbook[sheet_name].iter_rows(min_row=1, max_row=1, max_col=MAX_HEADER_COLS, values_only=True), ())
+        schema = detect_header_schema(tuple(header_row))
+        for message in schema.issues():
+            logging.warning(f"Sheet '{sheet_name}': {message}")
+        schemas[sheet_name] = schema
+
+    try:
+        _workbook_schemas[workbook] = schemas
+    except TypeError: # not weak-referenceable, just don't remember it
+        pass
+    return schemas
+
+def column_present(workbook: Any, column_name: str) -> bool:
+    """Whether any sheet after the first has a header containing column_name (case-insensitive)."""
+    return any(schema.has_column(column_name) for schema in sheet_schemas(workbook).values())
+
+def main() -> None:
+    """Run from command line."""
+    from src.SCC.scc_read import read_excel
+
+    parser = argparse.ArgumentParser(description='Show the detected column map for each sheet of an SCC.')
+    parser.add_argument('file_path', type=str, help='Path to the Excel file')
+    args = parser.parse_args()
+
+    workbook = read_excel(args.file_path, read_only=True)
+    if workbook is None:
+        return
+    try:
+        for sheet_name, schema in sheet_schemas(workbook).items():
+            print(f"{sheet_name}: " + ', '.join(f"{role}={col}" for role, col in zip(COLUMN_ROLES, schema.columns)))
+            for message in schema.issues():
+                print(f"    {message}")
+    finally:
+        workbook.close()
+
+if __name__ == "__main__":
+    main()
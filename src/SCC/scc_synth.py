@@ -0,0 +1,159 @@
+"""Synthetic SCC workbooks for benchmarking and testing the SCC readers without touching real (confidential) SCCs.
+
+The workbooks look like the real thing to scc_read and scc_check: a cover sheet with the SCM name, review date, guidance/policy sources and system scope, then check sheets with STIG ID, Exception, Deviation, TLA, Supporting Documentation and Compliance Method columns. How many BPERs, attestations and long free-text cells show up is configurable, and so are phantom rows (formatted but empty rows past the data, which make the sheet's dimension much bigger than its data).
+
+Output is deterministic for a given seed, so the same settings always give the same workbook.
+
+Classes:
+    SynthConfig: Shape of the generated workbooks
+
+Functions:
+    generate_scc: Write one synthetic SCC workbook
+    generate_scc_directory: Write a directory of them
+"""
+
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional
+
+import openpyxl
+from openpyxl.styles import PatternFill
+
+HEADERS = ('STIG ID', 'Rule Title', 'Check Content', 'Exception (BPER)', 'Deviation', 'TLA', 'Supporting Documentation', 'Compliance Method')
+METHODS = ('Automated', 'Manual-Screenshot', 'Manual-Document', 'Manual-Attestation', 'Inherited')
+DOC_NAMES = ('Configuration Standard', 'Hardening Guide', 'Patch Procedure', 'Access Control Policy', 'Backup Runbook', 'Network Diagram')
+WORDS = ("the system shall be configured per the applicable security technical implementation guide and all deviations "
+         "documented by the control owner within the review period verify that the setting is enabled audit log").split()
+
+class SynthConfig(NamedTuple):
+    """Shape of a synthetic SCC."""
+    sheets: int = 3 # check sheets after the cover sheet
+    rows: int = 500 # data rows per check sheet
+    bper_density: float = 0.2 # share of rows with a BPER in the Exception column (Deviation and TLA get a fraction of this)
+    attestation_density: float = 0.1 # share of rows whose documentation cell lists an attestation number
+    document_density: float = 0.3 # share of rows whose documentation cell lists supporting documents
+    long_text_density: float = 0.2 # share of rows with a long Check Content cell
+    long_text_length: int = 2000 # characters in a long cell
+    phantom_rows: int = 0 # formatted empty rows after the data on each check sheet
+    unique_bpers: int = 200 # BPER numbers are drawn from this many, so they repeat across rows like real SCCs
+    unique_attestations: int = 100
+    review_date: Optional[datetime] = None # defaults to 30 days ago
+
+def _free_text(rng: random.Random, length: int) -> str:
+    words = []
+    total = 0
+    while total < length:
+        word = rng.choice(WORDS)
+        words.append(word)
+        total += len(word) + 1
+    return ' '.join(words)[:length]
+
+def _bper(rng: random.Random, config: SynthConfig) -> str:
+    return f"BPER{rng.randrange(config.unique_bpers):07d}"
+
+def _documentation(rng: random.Random, config: SynthConfig) -> Optional[str]:
+    parts = []
+    if rng.random() < config.document_density:
+        parts.extend(rng.sample(DOC_NAMES, rng.randint(1, 2)))
+    if rng.random() < config.attestation_density:
+        parts.append(f"Attestation {100000 + rng.randrange(config.unique_attestations)}")
+    if not parts:
+        return rng.choice((None, 'N/A', 'None'))
+    return rng.choice(('  ', '\n')).join(parts) # scc_read splits on runs of spaces or newlines
+
+def _check_row(rng: random.Random, config: SynthConfig, sheet_index: int, row_index: int) -> list:
+    long_text = rng.random() < config.long_text_density
+    return [
+        f"V-{sheet_index + 1:02d}{row_index:05d}",
+        _free_text(rng, rng.randint(20, 80)),
+        _free_text(rng, config.long_text_length if long_text else rng.randint(40, 200)),
+        _bper(rng, config) if rng.random() < config.bper_density else None,
+        f"{_bper(rng, config)} and {_bper(rng, config)}" if rng.random() < config.bper_density / 2 else None,
+        _bper(rng, config) if rng.random() < config.bper_density / 4 else None,
+        _documentation(rng, config),
+        rng.choice(METHODS) if rng.random() < 0.95 else None,
+    ]
+
+def _write_cover(workbook: openpyxl.Workbook, rng: random.Random, config: SynthConfig) -> None:
+    sheet = workbook.create_sheet('Cover')
+    review_date = config.review_date or (datetime.now() - timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0)
+    rows = [
+        ['Security Configuration Checklist'],
+        [None, f"Owning SCM: SCM{rng.randint(1000, 9999)}"],
+        ['SCC Guidance Source: DISA STIG ' + _free_text(rng, 60)],
+        ['SCC Policy and Procedures Source: ' + _free_text(rng, 60)],
+        ['SCC System Scope: ' + _free_text(rng, 400)],
+        [None, None, 'Last reviewed', review_date],
+        [None, None, 'Created', review_date - timedelta(days=400)],
+    ]
+    for row in rows:
+        sheet.append(row)
+
+def generate_scc(file_path: str, config: SynthConfig = SynthConfig(), seed: Optional[int] = None) -> str:
+    """Write one synthetic SCC workbook.
+
+    Args:
+        file_path: Where to write the .xlsx
+        config: Shape of the workbook
+        seed: Random seed; defaults to one derived from the file name, so a path always gives the same workbook
+
+    Returns:
+        file_path
+    """
+    rng = random.Random(seed if seed is not None else os.path.basename(file_path))
+    workbook = openpyxl.Workbook() # not write_only, that leaves out the <dimension> the readers size sheets by
+    workbook.remove(workbook.active)
+    _write_cover(workbook, rng, config)
+
+    phantom_fill = PatternFill('solid', fgColor='FFFF99')
+    for sheet_index in range(config.sheets):
+        sheet = workbook.create_sheet(f"Checks {sheet_index + 1}")
+        sheet.append(HEADERS)
+        for row_index in range(config.rows):
+            sheet.append(_check_row(rng, config, sheet_index, row_index))
+        for row_index in range(config.rows + 2, config.rows + 2 + config.phantom_rows):
+            sheet.cell(row=row_index, column=1).fill = phantom_fill # empty, but formatted, so it still gets written out
+
+    workbook.save(file_path)
+    return file_path
+
+def generate_scc_directory(directory: str, count: int, config: SynthConfig = SynthConfig(), seed: int = 0) -> List[str]:
+    """Write count synthetic SCCs (Synthetic_SCC_NN_01.xlsx) into a directory.
+
+    Args:
+        directory: Output directory, created if needed
+        count: Number of workbooks
+        config: Shape of every workbook
+        seed: Base seed; workbook n uses seed + n
+
+    Returns:
+        Paths of the written workbooks
+    """
+    os.makedirs(directory, exist_ok=True)
+    return [generate_scc(os.path.join(directory, f"Synthetic_SCC_{index + 1:02d}_01.xlsx"), config, seed + index) for index in range(count)]
+
+def main() -> None:
+    """Run from command line."""
+    defaults = SynthConfig()
+    parser = argparse.ArgumentParser(description='Generate synthetic SCC workbooks.')
+    parser.add_argument('directory', type=str, help='Output directory')
+    parser.add_argument('--count', type=int, default=5, help='Number of workbooks')
+    parser.add_argument('--sheets', type=int, default=defaults.sheets, help='Check sheets per workbook')
+    parser.add_argument('--rows', type=int, default=defaults.rows, help='Data rows per check sheet')
+    parser.add_argument('--bper-density', type=float, default=defaults.bper_density, help='Share of rows with a BPER')
+    parser.add_argument('--attestation-density', type=float, default=defaults.attestation_density, help='Share of rows with an attestation')
+    parser.add_argument('--long-text-density', type=float, default=defaults.long_text_density, help='Share of rows with a long free-text cell')
+    parser.add_argument('--long-text-length', type=int, default=defaults.long_text_length, help='Characters in a long free-text cell')
+    parser.add_argument('--phantom-rows', type=int, default=defaults.phantom_rows, help='Formatted empty rows after the data on each check sheet')
+    parser.add_argument('--seed', type=int, default=0, help='Base random seed')
+    args = parser.parse_args()
+
+    config = defaults._replace(sheets=args.sheets, rows=args.rows, bper_density=args.bper_density, attestation_density=args.attestation_density,
+                               long_text_density=args.long_text_density, long_text_length=args.long_text_length, phantom_rows=args.phantom_rows)
+    for file_path in generate_scc_directory(args.directory, args.count, config, args.seed):
+        print(f"Wrote {file_path}")
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ Dependencies:
 - prettytable: Table formatting
 - datetime: Date handling
 - re: Regular expression operations
-- json: JSON file operations
+- progress_store: The project's shared progress data
 
 Example Usage:
     from scc_tables import generate_scc_info_docs
@@ -25,9 +25,10 @@ import os
 import prettytable
 from datetime import datetime
 import re
-import json
 from typing import Dict, List, Any, Optional
 
+from src.utils import progress_store
+
 def generate_scc_info_docs(progress_file: str) -> None:
     """
     Generate markdown-formatted checklists for each SCC in the progress file.
@@ -42,12 +43,12 @@ def generate_scc_info_docs(progress_file: str) -> None:
         progress_file: Path to the progress.json file 
         
     Raises:
-        FileNotFoundError: If progress_file doesn't exist
-        json.JSONDecodeError: If progress_file contains invalid JSON
+        ValueError: If the progress data isn't valid JSON (from the progress store loading it; a missing file loads as empty)
         IOError: If unable to write markdown files
     """
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file) # open progress.json
+    store = progress_store.get_store(progress_file) # progress.json, loaded once and shared
+    progress_data = store.data
+    checks = store.checks # checks keyed by (SCC, STIG ID)
 
     for scc_path, scc_info in progress_data['SCC'].items(): # for each SCC item in the SCC dictionary in progress.json
         if 'SCC' not in scc_info:
@@ -59,33 +60,12 @@ def generate_scc_info_docs(progress_file: str) -> None:
         scc_dir = os.path.join(os.path.dirname(progress_file), scc_name)
         doc_path = os.path.join(scc_dir, f"{scc_name}_info.md") # name for info doc
 
-        attestations = {} # create dictionaries for writing to info files
-        bpers = {}
-        documents = {}
-
-        for attestation_num, attestation_info in progress_data['Attestations'].items(): # grab all attestations that have the SCC we want
-            if isinstance(attestation_info, dict) and attestation_info.get('SCC') == scc_name and not attestation_info.get('false_positive', False): # omit those marked as false positives
-                attestations[attestation_num] = attestation_info
-            elif isinstance(attestation_info, list): # added handling for lists because it was throwing a fit
-                for attestation in attestation_info:
-                    if isinstance(attestation, dict) and attestation.get('SCC') == scc_name and not attestation.get('false_positive', False):
-                        attestations[attestation_num] = attestation
+        # grab the attestations, BPERs and supporting documents that have the SCC we want, omitting those marked as false positives
+        attestations, bpers, documents = ({item_name: entry for item_name, entry in store.by_scc.entries_for(category, scc_name) if not entry.false_positive} # progress_records, read by attribute
+                                          for category in ('Attestations', 'BPERs', 'Documents'))
 
         progress_data['SCC'][scc_path]['Info Doc Path'] = doc_path
 
-        for bper_name, bper_info in progress_data['BPERs'].items(): # grab all BPERs that have the SCC we want
-            if isinstance(bper_info, dict) and bper_info.get('SCC') == scc_name and not bper_info.get('false_positive', False):
-                bpers[bper_name] = bper_info
-            elif isinstance(bper_info, list): # list handling
-                for bper in bper_info:
-                    if isinstance(bper, dict) and bper.get('SCC') == scc_name and not bper.get('false_positive', False):
-                        bpers[bper_name] = bper
-
-        for doc_name, doc_info_list in progress_data['Documents'].items(): # grab all Supporting Dcouments that have the SCC we want
-            for doc_info in doc_info_list:
-                if isinstance(doc_info, dict) and doc_info.get('SCC') == scc_name and not doc_info.get('false_positive', False):
-                    documents[doc_name] = doc_info
-
         with open(doc_path, 'w') as doc_file: # Actual writing to the text file
             # top section
             doc_file.write(f"# {scc_name}\n\n")
@@ -106,9 +86,9 @@ def generate_scc_info_docs(progress_file: str) -> None:
             doc_file.write("| Gathered | Attestation Number | Approval Status | Valid To  |\n")
             doc_file.write("| -------- | ------------------ | --------------- | --------- |\n")
             for attestation_num, attestation in sorted(attestations.items()):
-                gathered = 'x' if attestation.get('Gathered', False) else ' '
-                approval_status = attestation.get('Approval Status', '').ljust(15)
-                valid_to = attestation.get('Valid to', '').ljust(9)
+                gathered = 'x' if attestation.gathered else ' '
+                approval_status = (attestation.approval_status or '').ljust(15)
+                valid_to = (attestation.valid_to or '').ljust(9)
                 doc_file.write(f"| [{gathered}]      | {attestation_num[:18].ljust(18)} | {approval_status[:15]} | {valid_to[:9]} |\n")
 
             # BPER section
@@ -116,10 +96,10 @@ def generate_scc_info_docs(progress_file: str) -> None:
             doc_file.write("| Gathered | BPER Name     | Approval Status | Valid To  | TLA |\n")
             doc_file.write("| -------- | ------------- | --------------- | --------- | --- |\n")
             for bper_name, bper in sorted(bpers.items()):
-                gathered = 'x' if bper.get('Gathered', False) else ' '
-                approval_status = bper.get('Approval Status', '').ljust(15)
-                valid_to = bper.get('Valid to', '').ljust(9)
-                tla = 'x' if bper.get('TLA', False) else ' '
+                gathered = 'x' if bper.gathered else ' '
+                approval_status = (bper.approval_status or '').ljust(15)
+                valid_to = (bper.valid_to or '').ljust(9)
+                tla = 'x' if bper.tla else ' '
                 doc_file.write(f"| [{gathered}]      | {bper_name[:13].ljust(13)} | {approval_status[:15]} | {valid_to[:9]} | [{tla}] |\n")
 
             # Doc Section
@@ -127,20 +107,19 @@ def generate_scc_info_docs(progress_file: str) -> None:
             doc_file.write("| Gathered | Document Name                                                               | Version | Last Update |\n")
             doc_file.write("| -------- | --------------------------------------------------------------------------- | ------- | ----------- |\n")
             for doc_name, doc in sorted(documents.items()):
-                gathered = 'x' if doc.get('Gathered', False) else ' '
-                version = doc.get('Version', '').ljust(7)
-                last_update = doc.get('Last update', '').ljust(11)
+                gathered = 'x' if doc.gathered else ' '
+                version = (doc.version or '').ljust(7)
+                last_update = (doc.last_update or '').ljust(11)
                 doc_file.write(f"| [{gathered}]      | {doc_name[:75].ljust(75)} | {version[:7]} | {last_update[:11]} |\n")
 
             # Check section
             doc_file.write("\n## Checks\n\n")
             check_methods = {} # dictionary for checks
-            for check_id, check_info in progress_data['Checks'].items():
-                if check_info.get('SCC') == scc_name:
-                    evidence_method = check_info.get('Evidence method', '')
-                    if evidence_method not in check_methods:
-                        check_methods[evidence_method] = []
-                    check_methods[evidence_method].append(check_id) # grab all checks with the SCC we want
+            for check_id, check_info in checks.checks_for(scc_name).items(): # only this SCC's checks
+                evidence_method = check_info.get('Evidence method', '')
+                if evidence_method not in check_methods:
+                    check_methods[evidence_method] = []
+                check_methods[evidence_method].append(check_id)
 
             if check_methods: # process all the checks for table formatting
                 header = "| " + " | ".join(method.ljust(20) for method in check_methods.keys()) + " |\n"
@@ -161,8 +140,7 @@ def generate_scc_info_docs(progress_file: str) -> None:
             else:
                 doc_file.write("No checks found.\n")
 
-    with open(progress_file, 'w') as file:
-        json.dump(progress_data, file, indent=4)
+    store.changed(progress_store.SCC) # Info Doc Path
 
 def format_document_name(name, length=75):
     return name[:length] # supports spacing building the tables; limits the length of doc names
@@ -282,8 +260,9 @@ def sync_progress_info(progress_file):
     """
     print("Syncing progress information...")
     
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file)
+    store = progress_store.get_store(progress_file)
+    progress_data = store.data
+    by_scc = store.by_scc # each SCC's entries, grouped once
 
     for scc_path, scc_info in progress_data['SCC'].items():
         scc_name = scc_info['SCC']
@@ -298,51 +277,37 @@ def sync_progress_info(progress_file):
                 doc_content = doc_file.read()
 
             print("  Updating Attestations...")
-            for attestation_num, attestation_info in progress_data['Attestations'].items():
-                if isinstance(attestation_info, dict) and attestation_info.get('SCC') == scc_name:
-                    if f"| [x]      | {attestation_num[:18]}" in doc_content:
-                        attestation_info['Gathered'] = True
-                        print(f"    Marked {attestation_num} as gathered for SCC: {scc_name}")
-                    else:
-                        attestation_info['Gathered'] = False
-                        print(f"    Marked {attestation_num} as not gathered for SCC: {scc_name}")
-                elif isinstance(attestation_info, list):
-                    for attestation in attestation_info:
-                        if isinstance(attestation, dict) and attestation.get('SCC') == scc_name:
-                            if f"| [x]      | {attestation_num[:18]}" in doc_content:
-                                attestation['Gathered'] = True
-                                print(f"    Marked {attestation_num} as gathered for SCC: {scc_name}")
-                            else:
-                                attestation['Gathered'] = False
-                                print(f"    Marked {attestation_num} as not gathered for SCC: {scc_name}")
+            for attestation_num, attestation in by_scc.entries_for('Attestations', scc_name):
+                if f"| [x]      | {attestation_num[:18]}" in doc_content:
+                    attestation['Gathered'] = True
+                    print(f"    Marked {attestation_num} as gathered for SCC: {scc_name}")
+                else:
+                    attestation['Gathered'] = False
+                    print(f"    Marked {attestation_num} as not gathered for SCC: {scc_name}")
 
             print("  Updating BPERs...")
-            for bper_name, bper_info_list in progress_data['BPERs'].items():
-                for bper_info in bper_info_list:
-                    if isinstance(bper_info, dict) and bper_info.get('SCC') == scc_name:
-                        if f"| [x]      | {bper_name[:13]}" in doc_content:
-                            bper_info['Gathered'] = True
-                            print(f"    Marked {bper_name} as gathered for SCC: {scc_name}")
-                        else:
-                            bper_info['Gathered'] = False
-                            print(f"    Marked {bper_name} as not gathered for SCC: {scc_name}")
+            for bper_name, bper_info in by_scc.entries_for('BPERs', scc_name):
+                if f"| [x]      | {bper_name[:13]}" in doc_content:
+                    bper_info['Gathered'] = True
+                    print(f"    Marked {bper_name} as gathered for SCC: {scc_name}")
+                else:
+                    bper_info['Gathered'] = False
+                    print(f"    Marked {bper_name} as not gathered for SCC: {scc_name}")
 
             print("  Updating Documents...")
-            for doc_name, doc_info_list in progress_data['Documents'].items():
-                for doc_info in doc_info_list:
-                    if isinstance(doc_info, dict) and doc_info.get('SCC') == scc_name:
-                        if f"| [x]      | {doc_name[:75]}" in doc_content:
-                            doc_info['Gathered'] = True
-                            print(f"    Marked {doc_name} as gathered for SCC: {scc_name}")
-                        else:
-                            doc_info['Gathered'] = False
-                            print(f"    Marked {doc_name} as not gathered for SCC: {scc_name}")
+            for doc_name, doc_info in by_scc.entries_for('Documents', scc_name):
+                if f"| [x]      | {doc_name[:75]}" in doc_content:
+                    doc_info['Gathered'] = True
+                    print(f"    Marked {doc_name} as gathered for SCC: {scc_name}")
+                else:
+                    doc_info['Gathered'] = False
+                    print(f"    Marked {doc_name} as not gathered for SCC: {scc_name}")
         else:
             print(f"  Info.md file not found for SCC: {scc_name}")
 
     print("Saving updated progress data...")
-    with open(progress_file, 'w') as file:
-        json.dump(progress_data, file, indent=4)
+    store.changed(*progress_store.ITEM_SECTIONS)
+    store.flush()
 
     print("Sync completed.")
 
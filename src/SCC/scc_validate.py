@@ -0,0 +1,119 @@
+"""Quick "is this SCC well-formed?" validation. Runs the scc_check checks against the region-limited load (scc_regions), so a whole directory of SCCs can be looked over in seconds before committing to a full pull.
+
+An SCC is well-formed when it opens, has at least one sheet after the cover sheet, names its SCM, has a review date, lists its guidance and policy sources and system scope, and has Method and Documentation columns. An old review date or ambiguous headers are reported as warnings only.
+
+Functions:
+    validate_scc_file: Check one SCC
+    validate_scc_directory: Check every SCC in a directory (serially or across worker processes)
+"""
+
+import argparse
+import os
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from src.SCC import scc_check, scc_regions, scc_schema
+from src.SCC.scc_ingest import ingest_scc_files, list_scc_files
+
+REQUIRED_CHECKS = { # scc_check result key -> problem reported when it's missing
+    'SCM Name': 'No SCM name on the first sheet',
+    'Last Review Date': 'No review date on the first sheet',
+    'SCC Guidance source presence': 'No SCC Guidance Source on the first sheet',
+    'SCC Policy and Procedure presence': 'No SCC Policy and Procedures Source on the first sheet',
+    'SCC System Scope Presence': 'No SCC System Scope on the first sheet',
+    'Compliance method column presence': 'No Method column on any check sheet',
+    'WPS config sup doc presence': 'No Documentation column on any check sheet',
+}
+
+def validate_scc_file(file_path: str, engine: str = 'xml') -> Dict[str, Any]:
+    """Check that one SCC has everything the pull relies on.
+
+    Args:
+        file_path: Path to the SCC
+        engine: 'xml' or 'streaming' (see scc_regions.load_regions)
+
+    Returns:
+        Dict with 'File', 'Well formed', 'Problems' and 'Warnings' (lists of messages) and 'SCC info' (the scc_check results, {} if it didn't open)
+    """
+    problems: List[str] = []
+    warnings: List[str] = []
+    scc_info: Dict[str, Any] = {}
+
+    try:
+        workbook = scc_regions.load_regions(file_path, engine)
+    except Exception as e: # corrupt or not really an xlsx
+        workbook = None
+        problems.append(f"Couldn't open: {e}")
+    else:
+        if workbook is None:
+            problems.append("Couldn't open (open in another program, or not a valid workbook)")
+
+    if workbook is not None:
+        if len(workbook.sheetnames) < 2:
+            problems.append('No check sheets after the first sheet')
+        scc_info = scc_check.build_scc_info(workbook, file_path)
+        problems.extend(message for key, message in REQUIRED_CHECKS.items() if not scc_info.get(key))
+        if not scc_info['Version']:
+            warnings.append('No _NN version suffix in the file name')
+        if scc_info['Last Review Date'] and not scc_info['Reviewed within 180 days']:
+            warnings.append(f"Last reviewed {scc_info['Last Review Date'][:10]}, more than 180 days ago")
+        for sheet_name, schema in scc_schema.sheet_schemas(workbook).items():
+            warnings.extend(f"Sheet '{sheet_name}': {message}" for message in schema.issues())
+
+    return {
+        'File': file_path,
+        'Well formed': not problems,
+        'Problems': problems,
+        'Warnings': warnings,
+        'SCC info': scc_info,
+    }
+
+def validate_scc_directory(directory: str, workers: Optional[int] = None, engine: str = 'xml') -> List[Dict[str, Any]]:
+    """Validate every SCC in a directory.
+
+    Args:
+        directory: Directory holding the SCCs
+        workers: Worker processes (see scc_ingest.resolve_workers); 1 runs serially
+        engine: 'xml' or 'streaming'
+
+    Returns:
+        validate_scc_file results, in directory order
+    """
+    results = []
+    for file_path, result, error in ingest_scc_files(list_scc_files(directory), workers, partial(validate_scc_file, engine=engine)):
+        if error is not None:
+            result = {'File': file_path, 'Well formed': False, 'Problems': [f"Validation failed: {error}"], 'Warnings': [], 'SCC info': {}}
+        results.append(result)
+    return results
+
+def print_validation(result: Dict[str, Any]) -> None:
+    """Readable summary of one validate_scc_file result."""
+    print(f"{os.path.basename(result['File'])}: {'OK' if result['Well formed'] else 'NOT WELL-FORMED'}")
+    for problem in result['Problems']:
+        print(f"    problem: {problem}")
+    for warning in result['Warnings']:
+        print(f"    warning: {warning}")
+
+def main() -> None:
+    """Run from command line."""
+    parser = argparse.ArgumentParser(description='Check SCC files are well-formed before pulling them.')
+    parser.add_argument('path', type=str, help='SCC file or directory of SCC files')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for a directory (0 = one per CPU)')
+    parser.add_argument('--engine', choices=['xml', 'streaming'], default='xml', help='Workbook reader to use')
+    args = parser.parse_args()
+
+    if os.path.isdir(args.path):
+        results = validate_scc_directory(args.path, args.workers, args.engine)
+    elif os.path.isfile(args.path):
+        results = [validate_scc_file(args.path, args.engine)]
+    else:
+        print(f"File not found: {args.path}")
+        return
+
+    for result in results:
+        print_validation(result)
+    well_formed = sum(1 for result in results if result['Well formed'])
+    print(f"\n{well_formed} of {len(results)} SCC files well-formed")
+
+if __name__ == "__main__":
+    main()
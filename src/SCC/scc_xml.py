@@ -0,0 +1,424 @@
+"""Direct-XML reader for .xlsx SCCs. Opens the workbook zip and stream-parses the sheet XML and sharedStrings with lxml's iterparse, building only the cell values the SCC code asks for, instead of going through openpyxl's object model.
+
+It copies the slice of openpyxl's read-only interface that scc_read and scc_check use (sheetnames, workbook[name], iter_rows(..., values_only=True), close()) and returns the same values openpyxl would with data_only=True: shared and inline strings, booleans, errors, numbers, and dates worked out from the cell's number format.
+Anything it doesn't understand (strict OOXML, chartsheets, odd cell types, broken zips) raises XmlWorkbookUnsupported so callers can fall back to openpyxl.
+
+Classes:
+    XmlWorkbook: Workbook opened straight from the zip
+    XmlSheet: One worksheet, rows parsed on demand
+    XmlWorkbookUnsupported: Raised for anything the fast path doesn't handle
+
+Functions:
+    sheet_content_hashes: Per-sheet content fingerprints, for reusing extraction results across SCC versions
+"""
+
+import hashlib
+import posixpath
+import warnings
+import zipfile
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from lxml import etree
+from openpyxl.styles.numbers import builtin_format_code, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import range_boundaries
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+OFFICE_DOCUMENT_REL = f'{REL_NS}/officeDocument'
+WORKSHEET_REL = f'{REL_NS}/worksheet'
+SHARED_STRINGS_REL = f'{REL_NS}/sharedStrings'
+STYLES_REL = f'{REL_NS}/styles'
+
+ROW_TAG = f'{{{MAIN_NS}}}row'
+VALUE_TAG = f'{{{MAIN_NS}}}v'
+TEXT_TAG = f'{{{MAIN_NS}}}t'
+RUN_TAG = f'{{{MAIN_NS}}}r'
+INLINE_STRING_TAG = f'{{{MAIN_NS}}}is'
+SHARED_STRING_TAG = f'{{{MAIN_NS}}}si'
+DIMENSION_TAG = f'{{{MAIN_NS}}}dimension'
+SHEET_DATA_TAG = f'{{{MAIN_NS}}}sheetData'
+CELL_TAG = f'{{{MAIN_NS}}}c'
+
+_DIGITS = '0123456789'
+
+class XmlWorkbookUnsupported(Exception):
+    """The file needs openpyxl (not an xlsx zip, strict OOXML, chartsheets, unexpected cell data...)."""
+
+def _column_index(letters: str, cache: Dict[str, int]) -> int:
+    """Column letters (e.g. 'AB') to a 1-based index, cached since the same few letters repeat on every row."""
+    index = cache.get(letters)
+    if index is None:
+        if not letters or not letters.isalpha():
+            raise XmlWorkbookUnsupported(f"Unexpected cell reference column {letters!r}")
+        index = 0
+        for letter in letters.upper():
+            index = index * 26 + ord(letter) - 64
+        cache[letters] = index
+    return index
+
+def _text_content(element: etree._Element) -> str:
+    """Plain text of a string item (<si> or <is>) the way openpyxl reads it: the <t> plus every run's <t>, no phonetic runs."""
+    if len(element) == 1 and element[0].tag == TEXT_TAG: # the usual case, a single plain <t>
+        return element[0].text or ''
+    snippets = []
+    plain = element.find(TEXT_TAG)
+    if plain is not None and plain.text:
+        snippets.append(plain.text)
+    for run in element.iterfind(RUN_TAG):
+        text = run.findtext(TEXT_TAG)
+        if text:
+            snippets.append(text)
+    return ''.join(snippets)
+
+class XmlWorkbook:
+    """An .xlsx SCC opened straight from the zip."""
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path: Path to the .xlsx file
+
+        Raises:
+            XmlWorkbookUnsupported: If the file isn't a plain transitional xlsx workbook
+        """
+        self.file_path = file_path
+        self._shared_strings: List[str] = []
+        self._shared_strings_source = None # open stream while the table is only partly read
+        self._shared_strings_items: Optional[Iterator[Tuple[str, etree._Element]]] = None
+        self._shared_strings_done = False
+        try:
+            self._archive = zipfile.ZipFile(file_path)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise XmlWorkbookUnsupported(f"Not an xlsx zip: {e}") from e
+
+        try:
+            self._read_workbook()
+        except XmlWorkbookUnsupported:
+            self.close()
+            raise
+        except (KeyError, ValueError, etree.XMLSyntaxError) as e:
+            self.close()
+            raise XmlWorkbookUnsupported(f"Couldn't read workbook structure: {e}") from e
+
+        self._date_formats: Optional[Set[int]] = None
+        self._timedelta_formats: Set[int] = set()
+
+    def _parse_part(self, path: str) -> etree._Element:
+        return etree.fromstring(self._archive.read(path))
+
+    def _relationships(self, part_path: str) -> Dict[str, Tuple[str, str]]:
+        """Relationship id -> (type, resolved zip path) for a part."""
+        directory, name = posixpath.split(part_path)
+        rels_path = posixpath.join(directory, '_rels', f'{name}.rels')
+        if rels_path not in self._archive.namelist():
+            return {}
+        relationships = {}
+        for rel in self._parse_part(rels_path).iterfind(f'{{{PKG_REL_NS}}}Relationship'):
+            if rel.get('TargetMode') == 'External':
+                continue
+            target = rel.get('Target', '')
+            path = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join(directory, target))
+            relationships[rel.get('Id')] = (rel.get('Type'), path)
+        return relationships
+
+    def _read_workbook(self) -> None:
+        """Sheet names and paths, the shared strings/styles parts and the date epoch, from workbook.xml and its rels."""
+        package_rels = self._relationships('')
+        workbook_paths = [path for rel_type, path in package_rels.values() if rel_type == OFFICE_DOCUMENT_REL]
+        if not workbook_paths:
+            raise XmlWorkbookUnsupported("No transitional officeDocument relationship (strict OOXML?)")
+        workbook_path = workbook_paths[0]
+
+        root = self._parse_part(workbook_path)
+        if root.tag != f'{{{MAIN_NS}}}workbook':
+            raise XmlWorkbookUnsupported(f"Unexpected workbook root {root.tag}")
+
+        workbook_pr = root.find(f'{{{MAIN_NS}}}workbookPr')
+        date1904 = workbook_pr is not None and workbook_pr.get('date1904', '').lower() in ('1', 'true')
+        self.epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        relationships = self._relationships(workbook_path)
+        self._sheet_paths: Dict[str, str] = {}
+        self.sheetnames: List[str] = []
+        for sheet in root.iterfind(f'{{{MAIN_NS}}}sheets/{{{MAIN_NS}}}sheet'):
+            rel_type, path = relationships.get(sheet.get(f'{{{REL_NS}}}id'), (None, None))
+            if rel_type != WORKSHEET_REL or path not in self._archive.namelist():
+                raise XmlWorkbookUnsupported(f"Sheet {sheet.get('name')!r} isn't a plain worksheet")
+            self.sheetnames.append(sheet.get('name'))
+            self._sheet_paths[sheet.get('name')] = path
+
+        self._shared_strings_path = next((path for rel_type, path in relationships.values() if rel_type == SHARED_STRINGS_REL), None)
+        self._styles_path = next((path for rel_type, path in relationships.values() if rel_type == STYLES_REL), None)
+
+    def shared_string(self, index: int) -> str:
+        """One entry of the shared string table. The table is only read as far as the highest index asked for,
+        so looking at the top of the first sheet and the header rows doesn't mean reading every string in the workbook."""
+        strings = self._shared_strings
+        if index < len(strings):
+            return strings[index]
+        if not self._shared_strings_done:
+            if self._shared_strings_items is None:
+                if not self._shared_strings_path or self._shared_strings_path not in self._archive.namelist():
+                    self._shared_strings_done = True
+                    raise IndexError(f"Shared string {index} missing")
+                self._shared_strings_source = self._archive.open(self._shared_strings_path)
+                self._shared_strings_items = etree.iterparse(self._shared_strings_source, events=('end',), tag=SHARED_STRING_TAG)
+            for _, element in self._shared_strings_items:
+                strings.append(_text_content(element).replace('x005F_', '')) # same unescape openpyxl does
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+                if index < len(strings):
+                    return strings[index]
+            self._finish_shared_strings()
+        raise IndexError(f"Shared string {index} missing")
+
+    def _finish_shared_strings(self) -> None:
+        self._shared_strings_done = True
+        self._shared_strings_items = None
+        if self._shared_strings_source is not None:
+            self._shared_strings_source.close()
+            self._shared_strings_source = None
+
+    @property
+    def shared_strings(self) -> List[str]:
+        """The whole shared string table."""
+        if not self._shared_strings_done:
+            try:
+                self.shared_string(2 ** 62) # reads to the end
+            except IndexError:
+                pass
+        return self._shared_strings
+
+    @property
+    def date_formats(self) -> Set[int]:
+        """Style indexes whose number format is a date (openpyxl turns those numbers into datetimes), read on first use."""
+        if self._date_formats is None:
+            date_formats, timedelta_formats = set(), set()
+            if self._styles_path and self._styles_path in self._archive.namelist():
+                root = self._parse_part(self._styles_path)
+                custom = {int(fmt.get('numFmtId')): fmt.get('formatCode')
+                          for fmt in root.iterfind(f'{{{MAIN_NS}}}numFmts/{{{MAIN_NS}}}numFmt')}
+                for index, xf in enumerate(root.iterfind(f'{{{MAIN_NS}}}cellXfs/{{{MAIN_NS}}}xf')):
+                    num_fmt_id = int(xf.get('numFmtId', 0))
+                    fmt = custom[num_fmt_id] if num_fmt_id in custom else builtin_format_code(num_fmt_id)
+                    if is_date_format(fmt):
+                        date_formats.add(index)
+                    if is_timedelta_format(fmt):
+                        timedelta_formats.add(index)
+            self._date_formats, self._timedelta_formats = date_formats, timedelta_formats
+        return self._date_formats
+
+    def __getitem__(self, name: str) -> 'XmlSheet':
+        if name not in self._sheet_paths:
+            raise KeyError(f"Worksheet {name} does not exist.")
+        return XmlSheet(self, name, self._sheet_paths[name])
+
+    def close(self) -> None:
+        """Close the zip (same as openpyxl's read-only workbooks, which hold the file open until closed)."""
+        self._finish_shared_strings()
+        self._archive.close()
+
+class XmlSheet:
+    """One worksheet of an XmlWorkbook. Rows are parsed from the zip each time iter_rows is called."""
+
+    def __init__(self, workbook: XmlWorkbook, title: str, path: str):
+        self.parent = workbook
+        self.title = title
+        self._path = path
+        self._dimensions: Optional[Tuple[Optional[int], ...]] = None
+
+    def _read_dimensions(self) -> Tuple[Optional[int], ...]:
+        """(min_col, min_row, max_col, max_row) from <dimension>, all None if the sheet doesn't say."""
+        if self._dimensions is None:
+            self._dimensions = (None, None, None, None)
+            with self.parent._archive.open(self._path) as source:
+                for _, element in etree.iterparse(source, events=('start',), tag=(DIMENSION_TAG, SHEET_DATA_TAG)):
+                    if element.tag == DIMENSION_TAG:
+                        try:
+                            self._dimensions = range_boundaries(element.get('ref', ''))
+                        except ValueError as e:
+                            raise XmlWorkbookUnsupported(f"Bad dimension on {self.title}: {e}") from e
+                    break
+        return self._dimensions
+
+    @property
+    def max_row(self) -> Optional[int]:
+        return self._read_dimensions()[3]
+
+    @property
+    def max_column(self) -> Optional[int]:
+        return self._read_dimensions()[2]
+
+    def iter_rows(self, min_row: Optional[int] = None, max_row: Optional[int] = None, min_col: Optional[int] = None,
+                  max_col: Optional[int] = None, values_only: bool = False) -> Iterator[Tuple[Any, ...]]:
+        """Rows of values, padded and bounded the same way as openpyxl's read-only iter_rows.
+
+        Only cells between min_col and max_col get their values resolved; everything else in the row is skipped.
+
+        Args:
+            min_row/max_row: Row range (1-based, inclusive); max_row defaults to the sheet's dimension
+            min_col/max_col: Column range (1-based, inclusive); max_col defaults to the sheet's dimension
+            values_only: Must be True; the fast path only hands out values
+
+        Returns:
+            Generator of value tuples
+        """
+        if not values_only:
+            raise XmlWorkbookUnsupported("XmlSheet only supports values_only=True")
+        min_col = min_col or 1
+        min_row = min_row or 1
+        max_col = max_col or self.max_column
+        max_row = max_row or self.max_row
+        return self._rows(min_col, min_row, max_col, max_row)
+
+    def _rows(self, min_col: int, min_row: int, max_col: Optional[int], max_row: Optional[int]) -> Iterator[Tuple[Any, ...]]:
+        empty_row = (None,) * (max_col + 1 - min_col) if max_col is not None else [] # openpyxl's is a list when the width is unknown
+        counter = min_row
+        row_index = 1
+        row_counter = 0
+        column_cache: Dict[str, int] = {}
+
+        with self.parent._archive.open(self._path) as source:
+            for _, row in etree.iterparse(source, events=('end',), tag=ROW_TAG):
+                row_number = row.get('r')
+                if row_number is not None:
+                    try:
+                        row_counter = int(row_number)
+                    except ValueError:
+                        row_counter = int(float(row_number))
+                else:
+                    row_counter += 1
+                row_index = row_counter
+
+                if max_row is not None and row_index > max_row:
+                    break
+
+                for _ in range(counter, row_index): # rows missing from the XML come back empty
+                    counter += 1
+                    yield empty_row
+
+                if counter <= row_index:
+                    counter += 1
+                    yield self._row_values(row, min_col, max_col, column_cache)
+
+                row.clear() # drop parsed rows as we go so memory stays flat
+                while row.getprevious() is not None:
+                    del row.getparent()[0]
+
+        if max_row is not None and max_row < row_index:
+            for _ in range(counter, max_row + 1):
+                yield empty_row
+
+    def _row_values(self, row: etree._Element, min_col: int, max_col: Optional[int], column_cache: Dict[str, int]) -> Tuple[Any, ...]:
+        """Values for one <row>, resolving only the cells in the column range."""
+        if max_col is None: # width comes from the row's last cell, like openpyxl
+            cells = list(self._cell_columns(row, column_cache))
+            if not cells:
+                return ()
+            max_col = cells[-1][0]
+        else:
+            cells = self._cell_columns(row, column_cache)
+
+        values = [None] * (max_col + 1 - min_col)
+        for column, cell in cells:
+            if min_col <= column <= max_col:
+                values[column - min_col] = self._cell_value(cell)
+        return tuple(values)
+
+    def _cell_columns(self, row: etree._Element, column_cache: Dict[str, int]) -> Iterator[Tuple[int, etree._Element]]:
+        """(column, <c>) for each cell in a row; cells without a reference follow on from the previous one."""
+        column = 0
+        for cell in row:
+            coordinate = cell.get('r')
+            if coordinate:
+                column = _column_index(coordinate.rstrip(_DIGITS), column_cache)
+            else:
+                column += 1
+            yield column, cell
+
+    def _cell_value(self, cell: etree._Element) -> Any:
+        """Value of one <c>, converted the way openpyxl does with data_only=True."""
+        data_type = cell.get('t', 'n')
+        if data_type == 'inlineStr':
+            inline = cell.find(INLINE_STRING_TAG)
+            return _text_content(inline) if inline is not None else None
+
+        value = cell.findtext(VALUE_TAG) or None
+        if value is None:
+            return None
+        if data_type == 'n':
+            number = float(value) if ('.' in value or 'E' in value or 'e' in value) else int(value)
+            style_id = int(cell.get('s') or 0)
+            if style_id in self.parent.date_formats:
+                try:
+                    return from_excel(number, self.parent.epoch, timedelta=style_id in self.parent._timedelta_formats)
+                except (OverflowError, ValueError):
+                    warnings.warn(f"Cell {cell.get('r')} is marked as a date but the serial value {number} is outside the limits for dates. The cell will be treated as an error.")
+                    return '#VALUE!'
+            return number
+        if data_type == 's':
+            return self.parent.shared_string(int(value))
+        if data_type in ('str', 'e'):
+            return value
+        if data_type == 'b':
+            return bool(int(value))
+        if data_type == 'd':
+            return from_ISO8601(value)
+        raise XmlWorkbookUnsupported(f"Unknown cell type {data_type!r} in {self.title}")
+
+def _shared_string_refs(archive: zipfile.ZipFile, sheet_path: str) -> Set[int]:
+    """Shared string indexes a sheet's cells use. Parsed rather than pattern-matched so namespace prefixes and attribute quoting don't matter."""
+    references = set()
+    with archive.open(sheet_path) as source:
+        for _, cell in etree.iterparse(source, events=('end',), tag=CELL_TAG):
+            if cell.get('t') == 's':
+                value = cell.findtext(VALUE_TAG)
+                if value is not None and value.strip():
+                    references.add(int(value))
+            cell.clear()
+    return references
+
+def sheet_content_hashes(file_path: str) -> Dict[str, str]:
+    """Fingerprint each sheet's content without working out its values.
+
+    A sheet's hash covers its XML, the text of the shared strings its cells refer to, the date styles and the date
+    epoch, so it only changes when something that could change its values changes. Excel appends new strings
+    to the shared string table rather than renumbering, so editing one sheet normally leaves the others'
+    hashes alone.
+
+    Args:
+        file_path: Path to the .xlsx file
+
+    Returns:
+        Dict of sheet name -> hex digest; empty if the file isn't something XmlWorkbook can read
+    """
+    try:
+        workbook = XmlWorkbook(file_path)
+    except XmlWorkbookUnsupported:
+        return {}
+
+    try:
+        archive = workbook._archive
+        workbook_digest = f"{workbook.epoch}|{sorted(workbook.date_formats)}|{sorted(workbook._timedelta_formats)}".encode()
+
+        hashes = {}
+        for sheet_name in workbook.sheetnames:
+            sheet_path = workbook._sheet_paths[sheet_name]
+            digest = hashlib.sha1(workbook_digest)
+            digest.update(archive.read(sheet_path))
+            try:
+                for index in sorted(_shared_string_refs(archive, sheet_path)):
+                    digest.update(b'%d:' % index)
+                    digest.update(workbook.shared_string(index).encode('utf-8'))
+            except IndexError: # refers past the end of the table, hash all of it so any change to it shows
+                if workbook._shared_strings_path and workbook._shared_strings_path in archive.namelist():
+                    digest.update(archive.read(workbook._shared_strings_path))
+            hashes[sheet_name] = digest.hexdigest()
+        return hashes
+    except (KeyError, ValueError, etree.XMLSyntaxError, zipfile.BadZipFile):
+        return {}
+    finally:
+        workbook.close()
@@ -10,8 +10,7 @@ that contains the current state of all tracked items.
 """
 
 import openpyxl
-import json
-from datetime import datetime
+from src.utils import progress_store
 
 def update_document_validation(progress_file, template_path):
     """
@@ -21,9 +20,8 @@ def update_document_validation(progress_file, template_path):
         progress_file (str): Path to the progress.json file containing current state
         template_path (str): Path to the Excel template to be updated
     """
-    # Load the progress data from JSON
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file)
+    # Progress data from the shared store (no reparse if it's already loaded)
+    progress_data = progress_store.get_store(progress_file).data
     
     # Load the Excel workbook for updating
     workbook = openpyxl.load_workbook(template_path)
@@ -55,13 +53,9 @@ def update_sccs_tab(workbook, progress_data):
         sheet.cell(row=row, column=3, value=scc_data.get('Version', ''))
         
         # Handle last review date formatting
-        last_review_date = scc_data.get('Last Review Date', '')
+        last_review_date = scc_data.get('Last Review Date', '') # ISO string; the store never holds datetimes
         if last_review_date:
-            if isinstance(last_review_date, str):
-                last_review_date = last_review_date.replace('T00:00:00', '')
-            elif isinstance(last_review_date, datetime):
-                last_review_date = last_review_date.strftime('%Y-%m-%d')
-            sheet.cell(row=row, column=4, value=last_review_date)
+            sheet.cell(row=row, column=4, value=last_review_date.replace('T00:00:00', ''))
         
         # Update SCM indicator
         sheet.cell(row=row, column=6, value='X' if scc_data.get('SCM Name') else '')
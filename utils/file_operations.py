@@ -10,7 +10,8 @@ from typing import Tuple, List
 from difflib import SequenceMatcher
 from datetime import datetime
 
-def update_dictionaries_and_copy_files(bper_dict, doc_dict, attestation_dict, base_directories, master_directory): # goes through lists, and sets up for copy_and_update
+def update_dictionaries_and_copy_files(bper_dict, doc_dict, attestation_dict, base_directories, master_directory, by_scc=None): # goes through lists, and sets up for copy_and_update; by_scc (the store's scc_index.SCCEntries) says which SCC folders get each file
+    source_files = None # supporting docs folder, listed once rather than once per document
     for key, value_list in bper_dict.items(): # BPER list
         value = value_list[0]  
         if value.get('false_positive', False):
@@ -24,7 +25,7 @@ def update_dictionaries_and_copy_files(bper_dict, doc_dict, attestation_dict, ba
             source_file_path = os.path.join(source_directory, f"{key}.pdf") # otherwise creates the path, expects only pdf, BPER names should match exactly
 
         if os.path.isfile(source_file_path):
-            bper_dict = copy_and_update(value, source_file_path, master_directory, bper_dict, use_margin_for_error=False) # if file is present, copy it over
+            bper_dict = copy_and_update(value, source_file_path, master_directory, bper_dict, use_margin_for_error=False, by_scc=by_scc) # if file is present, copy it over
         else:
             value['Gathered'] = False
             print(f"File not found for BPER: {key}") # not found, print outcome
@@ -41,7 +42,9 @@ def update_dictionaries_and_copy_files(bper_dict, doc_dict, attestation_dict, ba
             source_directory = base_directories['doc']
             doc_name = value['Doc name']
             # Needs to match because of doc names are all over the place
-            matching_files = [f for f in os.listdir(source_directory) if (f.lower().endswith('.docx') or f.lower().endswith('.doc') or f.lower().endswith('.xlsx') or f.lower().endswith('.xls') or f.lower().endswith('.pdf'))]
+            if source_files is None:
+                source_files = [f for f in os.listdir(source_directory) if (f.lower().endswith('.docx') or f.lower().endswith('.doc') or f.lower().endswith('.xlsx') or f.lower().endswith('.xls') or f.lower().endswith('.pdf'))]
+            matching_files = source_files
             if matching_files:
                 best_match = max(matching_files, key=lambda x: SequenceMatcher(None, doc_name.lower(), x.lower()).ratio())
                 match_ratio = SequenceMatcher(None, doc_name.lower(), best_match.lower()).ratio()
@@ -57,7 +60,7 @@ def update_dictionaries_and_copy_files(bper_dict, doc_dict, attestation_dict, ba
                 continue
 
         if os.path.isfile(source_file_path): # when appropriate match is found, copy it over, update the dictionary
-            doc_dict = copy_and_update(value, source_file_path, master_directory, doc_dict, use_margin_for_error=True)
+            doc_dict = copy_and_update(value, source_file_path, master_directory, doc_dict, use_margin_for_error=True, by_scc=by_scc)
         else:
             value['Gathered'] = False
             print(f"File not found for Document: {value['Doc name']}") # not found at all
@@ -75,22 +78,29 @@ def update_dictionaries_and_copy_files(bper_dict, doc_dict, attestation_dict, ba
             source_file_path = os.path.join(source_directory, f"{key}.pdf") # otherwise, use the path, only expects pdf
 
         if os.path.isfile(source_file_path):
-            attestation_dict = copy_and_update(value, source_file_path, master_directory, attestation_dict, use_margin_for_error=False) # if present, copy over and update dict
+            attestation_dict = copy_and_update(value, source_file_path, master_directory, attestation_dict, use_margin_for_error=False, by_scc=by_scc) # if present, copy over and update dict
         else:
             value['Gathered'] = False
             print(f"File not found for Attestation: {key}") # not found, print outcome
 
     return bper_dict, doc_dict, attestation_dict # output dicts for writing to progress.json
 
-def copy_and_update(entry, source_file_path, master_directory, doc_dict, use_margin_for_error=False):
-    scc_name = entry['SCC']
+def copy_and_update(entry, source_file_path, master_directory, doc_dict, use_margin_for_error=False, by_scc=None): # copies the file into every SCC folder that references the item
     source_file_name = os.path.basename(source_file_path)
     item_name = entry.get('Doc name') or entry.get('BPER name') or entry.get('Attestation num')
 
     dest_subdir = 'Attestations' if entry.get('Attestation num') else 'Exceptions and Deviations' if entry.get('BPER name') else 'Supporting Documents'
+    category = 'Attestations' if entry.get('Attestation num') else 'BPERs' if entry.get('BPER name') else 'Documents'
 
-    for value in doc_dict.get(item_name, []):
-        dest_directory = os.path.join(master_directory, value['SCC'], dest_subdir)
+    entries = doc_dict.get(item_name, [])
+    if by_scc is not None:
+        dest_sccs = by_scc.sccs_for(category, item_name) # from the store's live entries, so a re-added SCC's items are never missed
+    else:
+        dest_sccs = list(dict.fromkeys(value['SCC'] for value in entries))
+
+    copied = {} # SCC -> whether the copy worked; one copy per SCC folder even if the SCC lists the item twice
+    for scc_name in dest_sccs:
+        dest_directory = os.path.join(master_directory, scc_name, dest_subdir)
 
         if not os.path.exists(dest_directory):
             os.makedirs(dest_directory)
@@ -100,12 +110,19 @@ def copy_and_update(entry, source_file_path, master_directory, doc_dict, use_mar
         try:
             shutil.copy2(source_file_path, dest_file_path) # copy file
             print(f"Copied {source_file_name} to {dest_file_path}")
+            copied[scc_name] = True
+        except Exception as e:
+            print(f"Error copying {source_file_name}: {e}") # error handling
+            copied[scc_name] = False
 
+    for value in entries:
+        if value['SCC'] not in copied:
+            continue
+        if copied[value['SCC']]:
             value['Gathered'] = True
             value['Gathered file'] = source_file_name
             value['Gathered timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S') # update dictionary values
-        except Exception as e:
-            print(f"Error copying {source_file_name}: {e}") # error handling
+        else:
             value['Gathered'] = False
 
     return doc_dict
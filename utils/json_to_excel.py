@@ -1,5 +1,6 @@
 import json
 from openpyxl import Workbook
+from src.SCC import scc_checks
 
 # Load the JSON data from a file
 with open('progress.json', 'r') as file:
@@ -49,9 +50,9 @@ def create_sheet(wb, sheet_name, data_dict):
                 sheet.cell(row=row, column=col, value=value)
             row += 1
 
-# Create a sheet for each high-level dictionary
+# Create a sheet for each high-level dictionary (checks are nested per SCC, so they go out as one row per check)
 for key in data:
-    create_sheet(wb, key, data[key])
+    create_sheet(wb, key, scc_checks.ChecksTable.for_progress(data).as_entries() if key == 'Checks' else data[key])
 
 # Remove the default sheet created by openpyxl
 default_sheet = wb['Sheet']
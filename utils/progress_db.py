@@ -0,0 +1,261 @@
+"""
+progress_db.py
+
+SQLite copy of a project's progress data, so questions like "what hasn't been gathered for this SCC" are indexed queries
+instead of walks over every item list in progress.json.
+
+Tables:
+    sections: Program Settings (and any other top-level section without a table of its own), as JSON
+    sccs: One row per SCC file
+    items: One row per BPER, Attestation and Document entry, with SCC, item ID, Gathered, false_positive, Approval Status,
+           TLA and Last update pulled out into indexed columns, and the whole entry kept as JSON
+    checks: One row per (SCC, STIG ID)
+
+progress.json stays the file everything else reads and writes, and the database is optional. A project opts in by importing it once:
+
+    python -m src.utils.progress_db import progress.json
+
+which writes progress.db next to progress.json. From then on ProgressStore keeps that file up to date: a section edited as a
+whole is re-imported, and small edits (a journaled click, one upserted entry) only replace the rows of the items they touched.
+The store answers the dashboard queries from it, and can rebuild progress.json from it with export (or on its own, if
+progress.json goes missing). Projects without progress.db don't have a database at all; the store answers the same queries
+from the records in memory.
+Export gives back the JSON layout: item entries always come back as lists, in their original order.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.SCC.scc_checks import ChecksTable
+
+SCHEMA_VERSION = 1
+ITEM_SECTIONS = ('BPERs', 'Attestations', 'Documents')
+NAME_FIELDS = {'BPERs': 'BPER name', 'Attestations': 'Attestation num', 'Documents': 'Doc name'} # field holding each entry's display name
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS sections (name TEXT PRIMARY KEY, seq INTEGER, data TEXT);
+CREATE TABLE IF NOT EXISTS sccs (path TEXT PRIMARY KEY, seq INTEGER, scc TEXT, data TEXT);
+CREATE TABLE IF NOT EXISTS items (
+    section TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    scc TEXT,
+    name TEXT,
+    gathered INTEGER, -- 1/0, NULL when the entry has no Gathered field
+    false_positive INTEGER NOT NULL DEFAULT 0,
+    approval_status TEXT,
+    tla INTEGER NOT NULL DEFAULT 0,
+    last_update TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checks (scc TEXT NOT NULL, stig_id TEXT NOT NULL, seq INTEGER, method TEXT, data TEXT, PRIMARY KEY (scc, stig_id));
+CREATE INDEX IF NOT EXISTS sccs_scc ON sccs (scc);
+CREATE INDEX IF NOT EXISTS items_scc ON items (section, scc);
+CREATE INDEX IF NOT EXISTS items_item_id ON items (section, item_id);
+CREATE INDEX IF NOT EXISTS items_gathered ON items (section, gathered);
+CREATE INDEX IF NOT EXISTS items_false_positive ON items (section, false_positive);
+CREATE INDEX IF NOT EXISTS items_approval_status ON items (section, approval_status);
+CREATE INDEX IF NOT EXISTS checks_method ON checks (scc, method);
+"""
+
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Mapping): # progress_records
+        return dict(obj)
+    return str(obj)
+
+def _dumps(value):
+    return json.dumps(value, default=_json_default)
+
+def _flag(value) -> Optional[int]:
+    return None if value is None else int(bool(value))
+
+def db_path_for(progress_file) -> str:
+    """progress.db next to a progress.json."""
+    return os.path.join(os.path.dirname(os.path.abspath(progress_file)), 'progress.db')
+
+class ProgressDB:
+    """SQLite tables over the sections of progress data, with the queries the dashboard and checklists need."""
+
+    def __init__(self, db_path=':memory:'):
+        """
+        Args:
+            db_path (str): SQLite file, or ':memory:' for a database that only lives as long as this object
+        """
+        self.db_path = db_path
+        self.persistent = db_path != ':memory:'
+        self.conn = sqlite3.connect(db_path, check_same_thread=False) # the GUI's worker threads can ask the store for it too
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    ## Import / export ##
+    def import_progress(self, progress_data, sections: Optional[Iterable[str]] = None) -> None:
+        """
+        Replace sections of the database with what's in progress data, in one transaction.
+
+        Args:
+            progress_data (dict): Loaded progress.json
+            sections (iterable): Top-level section names to import; None imports every section in progress_data
+        """
+        sections = list(progress_data) if sections is None else list(sections)
+        with self.conn:
+            for name in sections:
+                if name in ITEM_SECTIONS:
+                    self._import_items(name, progress_data.get(name) or {})
+                elif name == 'SCC':
+                    self._import_sccs(progress_data.get(name) or {})
+                elif name == 'Checks':
+                    self._import_checks(ChecksTable.for_progress(progress_data) if name in progress_data else ChecksTable())
+                elif name in progress_data:
+                    order = list(progress_data).index(name)
+                    self.conn.execute("INSERT OR REPLACE INTO sections (name, seq, data) VALUES (?, ?, ?)", (name, order, _dumps(progress_data[name])))
+                else:
+                    self.conn.execute("DELETE FROM sections WHERE name = ?", (name,))
+
+    def _item_row(self, section, item_id, seq, entry) -> Tuple:
+        return (section, item_id, seq, entry.get('SCC'), entry.get(NAME_FIELDS[section]) or item_id, _flag(entry.get('Gathered')),
+                int(bool(entry.get('false_positive', False))), entry.get('Approval Status'), int(bool(entry.get('TLA', False))),
+                str(entry.get('Last update') or '')[:10], _dumps(entry))
+
+    def _insert_items(self, rows) -> None:
+        self.conn.executemany("INSERT INTO items (section, item_id, seq, scc, name, gathered, false_positive, approval_status, tla, last_update, data) "
+                              "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _import_items(self, section, item_dict) -> None:
+        rows = []
+        for item_id, entries in item_dict.items():
+            for entry in entries: # always a list once progress_schema has migrated the data
+                rows.append(self._item_row(section, item_id, len(rows), entry))
+        self.conn.execute("DELETE FROM items WHERE section = ?", (section,))
+        self._insert_items(rows)
+
+    def update_items(self, progress_data, item_ids) -> None:
+        """
+        Replace the rows of a few items with their current entries, in one transaction, instead of re-importing their sections.
+        An item keeps its place in the section; a new one goes at the end, and one that's gone is removed.
+
+        Args:
+            progress_data (dict): Loaded progress data
+            item_ids (dict): Section -> IDs of the items whose entries changed
+        """
+        with self.conn:
+            for section, ids in item_ids.items():
+                item_dict = progress_data.get(section) or {}
+                for item_id in ids:
+                    (seq,) = self.conn.execute("SELECT MIN(seq) FROM items WHERE section = ? AND item_id = ?", (section, item_id)).fetchone()
+                    self.conn.execute("DELETE FROM items WHERE section = ? AND item_id = ?", (section, item_id))
+                    if item_id not in item_dict:
+                        continue
+                    if seq is None:
+                        (last_seq,) = self.conn.execute("SELECT MAX(seq) FROM items WHERE section = ?", (section,)).fetchone()
+                        seq = 0 if last_seq is None else last_seq + 1 # after every item that's there
+                    self._insert_items([self._item_row(section, item_id, seq, entry) for entry in item_dict[item_id]]) # same seq, rowid keeps their order
+
+    def _import_sccs(self, scc_dict) -> None:
+        self.conn.execute("DELETE FROM sccs")
+        self.conn.executemany("INSERT INTO sccs (path, seq, scc, data) VALUES (?, ?, ?, ?)",
+                              [(path, seq, info.get('SCC'), _dumps(info)) for seq, (path, info) in enumerate(scc_dict.items())])
+
+    def _import_checks(self, checks: ChecksTable) -> None:
+        self.conn.execute("DELETE FROM checks")
+        self.conn.executemany("INSERT INTO checks (scc, stig_id, seq, method, data) VALUES (?, ?, ?, ?, ?)",
+                              [(scc_name, stig_id, seq, check.get('Evidence method', ''), _dumps(check)) for seq, (scc_name, stig_id, check) in enumerate(checks)])
+
+    def export_progress(self) -> Dict[str, Any]:
+        """
+        Progress data in the progress.json layout, rebuilt from the tables.
+
+        Returns:
+            dict: Program Settings, SCC, BPERs, Attestations, Documents and Checks (plus any other sections that were imported)
+        """
+        progress_data = {name: json.loads(data) for name, data in self.conn.execute("SELECT name, data FROM sections ORDER BY seq")}
+        progress_data['SCC'] = {path: json.loads(data) for path, data in self.conn.execute("SELECT path, data FROM sccs ORDER BY seq")}
+        for section in ITEM_SECTIONS:
+            item_dict = progress_data[section] = {}
+            for item_id, data in self.conn.execute("SELECT item_id, data FROM items WHERE section = ? ORDER BY seq, rowid", (section,)):
+                item_dict.setdefault(item_id, []).append(json.loads(data))
+        checks = progress_data['Checks'] = {}
+        for scc_name, stig_id, data in self.conn.execute("SELECT scc, stig_id, data FROM checks ORDER BY seq"):
+            checks.setdefault(scc_name, {})[stig_id] = json.loads(data)
+        return progress_data
+
+    def import_json(self, progress_file) -> None:
+        """Replace everything with a project's progress data, read through its store (so progress.d and the journal count too)."""
+        from src.utils import progress_store # imported here, progress_store imports this module
+
+        self.import_progress(progress_store.get_store(progress_file).data)
+
+    def export_json(self, progress_file) -> None:
+        """Write the database out as a progress.json."""
+        with open(progress_file, 'w') as file:
+            json.dump(self.export_progress(), file, indent=4)
+
+    ## Queries ##
+    def _entries(self, sql, params=()) -> List[Tuple[str, str, Dict[str, Any]]]:
+        return [(section, item_id, json.loads(data)) for section, item_id, data in self.conn.execute(sql, params)]
+
+    def not_gathered(self, sections: Iterable[str] = ITEM_SECTIONS) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Entries with Gathered false that aren't false positives (entries without a Gathered field don't count).
+
+        Args:
+            sections (iterable): Item sections to look in
+
+        Returns:
+            list: (section, item ID, entry) in progress.json order within each section
+        """
+        sections = list(sections)
+        sql = f"SELECT section, item_id, data FROM items WHERE section IN ({', '.join('?' * len(sections))}) AND gathered = 0 AND false_positive = 0"
+        return self._entries(sql + " ORDER BY section, seq, rowid", sections)
+
+    def blank_gathered_or_tla(self) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Entries whose Gathered is '' (blank, not False), plus BPERs flagged TLA: what the Not_gathered.txt report lists.
+        False positives are included and nothing is deduplicated, as the report always did.
+
+        Returns:
+            list: (section, item ID, entry) in progress.json order within each section
+        """
+        return self._entries("SELECT section, item_id, data FROM items WHERE json_extract(data, '$.Gathered') = '' "
+                             "OR (section = 'BPERs' AND json_extract(data, '$.TLA') = 1) ORDER BY section, seq, rowid")
+
+    def sccs_with_ungathered(self) -> set:
+        """SCC names with at least one entry that isn't marked gathered (missing Gathered counts as not gathered)."""
+        return {scc_name for (scc_name,) in self.conn.execute("SELECT DISTINCT scc FROM items WHERE gathered IS NULL OR gathered = 0")}
+
+    def gathered_counts(self, section) -> Tuple[int, int]:
+        """
+        (gathered, total) entries in an item section, false positives left out.
+        """
+        gathered, total = self.conn.execute("SELECT COALESCE(SUM(gathered = 1), 0), COUNT(*) FROM items WHERE section = ? AND false_positive = 0", (section,)).fetchone()
+        return gathered, total
+
+def main() -> None:
+    """Run from command line."""
+    parser = argparse.ArgumentParser(description='Import progress.json into a SQLite progress.db, or export one back to JSON.')
+    parser.add_argument('action', choices=['import', 'export'], help='import: progress.json -> progress.db, export: progress.db -> progress.json')
+    parser.add_argument('progress_file', type=str, help='Path to progress.json')
+    parser.add_argument('--db', type=str, default=None, help='Database path (defaults to progress.db next to progress.json)')
+    args = parser.parse_args()
+
+    db = ProgressDB(args.db or db_path_for(args.progress_file))
+    if args.action == 'import':
+        db.import_json(args.progress_file)
+        print(f"Imported {args.progress_file} into {db.db_path}")
+    else:
+        db.export_json(args.progress_file)
+        print(f"Exported {db.db_path} to {args.progress_file}")
+    db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+progress_journal.py
+
+Append-only change journal for progress.json. Small edits (a false positive, a manually linked file, a program setting) are
+written as one JSON line each instead of rewriting the whole progress.json, so an edit costs the same however big the
+project is. Each line says who made the change and when. ProgressStore replays the journal over progress.json when it loads
+(over each section as it's read, for the progress.d layout), and compacts it (writes progress.json and empties the journal) every JOURNAL_COMPACT_EVERY edits and when the GUI closes.
+Compacted lines are moved to progress.history.jsonl, which keeps the audit trail for the cycle.
+
+Records:
+    {"op": "setting", "name": <setting>, "value": ...}
+    {"op": "entry", "section": <BPERs/Attestations/Documents>, "item": <item ID>, "scc": <SCC or null for every entry>, "field": ..., "value": ...}
+"""
+
+import getpass
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List
+
+JOURNAL_NAME = 'progress.journal.jsonl'
+HISTORY_NAME = 'progress.history.jsonl'
+JOURNAL_COMPACT_EVERY = 200 # journaled edits before progress.json is rewritten
+
+def journal_path_for(progress_file) -> str:
+    """progress.journal.jsonl next to a progress.json."""
+    return os.path.join(os.path.dirname(os.path.abspath(progress_file)), JOURNAL_NAME)
+
+def _current_user():
+    try:
+        return getpass.getuser()
+    except Exception: # no login name in some service/container environments
+        return ''
+
+def matching_entries(progress_data, section, item_id, scc_name=None) -> List[Dict[str, Any]]:
+    """An item's entries in a section, just the one for scc_name if it's given."""
+    entries = progress_data.get(section, {}).get(item_id, [])
+    return [entry for entry in entries if scc_name is None or entry.get('SCC') == scc_name]
+
+def record_section(record) -> str:
+    """Top-level section a record edits."""
+    return 'Program Settings' if record.get('op') == 'setting' else record.get('section')
+
+def apply_record(progress_data, record) -> int:
+    """
+    Apply one journal record to progress data.
+
+    Args:
+        progress_data (dict): Loaded progress.json, updated in place
+        record (dict): Journal record
+
+    Returns:
+        int: How many values were set (0 if the record doesn't match anything, e.g. the item has since been removed)
+    """
+    if record.get('op') == 'setting':
+        progress_data.setdefault('Program Settings', {})[record['name']] = record['value']
+        return 1
+    if record.get('op') == 'entry':
+        entries = matching_entries(progress_data, record['section'], record['item'], record.get('scc'))
+        for entry in entries:
+            entry[record['field']] = record['value']
+        return len(entries)
+    print(f"Warning: skipping unknown journal record: {record}")
+    return 0
+
+class ProgressJournal:
+    """JSON Lines file of edits made since progress.json was last written."""
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Journal file (created on the first append)
+        """
+        self.path = path
+        self.history_path = os.path.join(os.path.dirname(path), HISTORY_NAME)
+
+    def append(self, record) -> Dict[str, Any]:
+        """
+        Add a record, stamped with the time and user, and sync it to disk before returning.
+
+        Args:
+            record (dict): Edit to record (see the module docstring for the shapes)
+
+        Returns:
+            dict: The record as written
+        """
+        record = {'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'user': _current_user(), **record}
+        with open(self.path, 'a') as file:
+            file.write(json.dumps(record) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        return record
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Records in the order they were written. A line cut short by a crash is skipped."""
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, 'r') as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"Warning: skipping unreadable line in {self.path}")
+        return records
+
+    def replay(self, progress_data) -> int:
+        """Apply every record to progress data. Returns how many records there were."""
+        records = self.records()
+        for record in records:
+            apply_record(progress_data, record)
+        return len(records)
+
+    def archive(self) -> None:
+        """Move the records to the history file and empty the journal (once progress.json holds them)."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as journal_file:
+            lines = journal_file.read()
+        if lines:
+            with open(self.history_path, 'a') as history_file:
+                history_file.write(lines if lines.endswith('\n') else lines + '\n')
+        os.remove(self.path)
@@ -0,0 +1,101 @@
+"""
+progress_json.py
+
+JSON writing for progress.json and the files built from it. Saves used to deep-copy the whole progress tree first
+(convert_datetime_to_string) just to turn datetimes into strings, so a save briefly held the project twice. The encoder here
+handles datetimes and progress_records itself, and dump writes the encoded chunks to the file as they're produced instead
+of building the whole text first.
+
+Records going through the encoder's default() hook cost a lot more than plain dicts (every one is checked against each JSON
+type first, then encoded from the dict to_json builds), so dump writes a mapping one member (section) at a time and swaps
+that member's records for their dicts just before it's encoded. Only one section is ever held twice. Compact members are
+encoded in one go, which lets json use its C encoder.
+
+Compact mode leaves out the indentation (and the spaces after separators), which makes big files noticeably smaller and
+quicker to write; the store uses it when the 'Compact Progress File' program setting is on.
+
+Classes:
+    ProgressEncoder: json.JSONEncoder that knows about datetimes and progress records
+
+Functions:
+    dump: Stream progress data to an open file
+    dumps: Progress data as a string
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, TextIO
+
+from src.utils import progress_records
+
+WRITE_CHUNK_SIZE = 1 << 16 # characters gathered up before each write
+INDENT = 4
+RECORD_DEPTH = 2 # records sit this deep in a section: item -> [entry], or SCC -> STIG ID -> check
+
+class ProgressEncoder(json.JSONEncoder):
+    """Records go out as their progress.json dicts, datetimes (e.g. left in a dict by a parser) as ISO strings."""
+
+    def default(self, obj):
+        if isinstance(obj, progress_records.ProgressRecord):
+            return obj.to_json()
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        return super().default(obj)
+
+def _encoder(compact) -> ProgressEncoder:
+    return ProgressEncoder(indent=None, separators=(',', ':')) if compact else ProgressEncoder(indent=INDENT)
+
+def _plain(value, depth=RECORD_DEPTH):
+    """value with the records in its top levels swapped for their progress.json dicts; containers are copied, nothing else is."""
+    if isinstance(value, progress_records.ProgressRecord):
+        return value.to_json()
+    if depth and isinstance(value, dict):
+        return {key: _plain(inner, depth - 1) for key, inner in value.items()}
+    if depth and isinstance(value, list):
+        return [_plain(inner, depth - 1) for inner in value]
+    return value
+
+def _write_chunks(chunks, file: TextIO, newline='\n') -> None:
+    """Write encoded chunks in WRITE_CHUNK_SIZE blocks, with each line break replaced by newline (to indent a nested member)."""
+    pending = []
+    pending_size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= WRITE_CHUNK_SIZE:
+            text = ''.join(pending)
+            file.write(text if newline == '\n' else text.replace('\n', newline)) # JSON strings can't hold a raw line break
+            pending.clear()
+            pending_size = 0
+    text = ''.join(pending)
+    file.write(text if newline == '\n' else text.replace('\n', newline))
+
+def dump(data, file: TextIO, compact=False) -> None:
+    """
+    Write data as JSON to an open file, chunk by chunk, without a converted copy of it. A mapping is written one member at
+    a time, with that member's records turned into plain dicts first (see the module docstring); the output is the same.
+
+    Args:
+        data: Progress data (or any part of it)
+        file: Text file open for writing
+        compact (bool): No indentation or spaces; otherwise indented by 4 like json.dump(..., indent=4)
+    """
+    encoder = _encoder(compact)
+    if not isinstance(data, dict) or not data or not all(type(key) is str for key in data):
+        _write_chunks(encoder.iterencode(_plain(data)), file)
+        return
+    newline = '' if compact else '\n' + ' ' * INDENT
+    file.write('{' + newline)
+    for position, (key, value) in enumerate(data.items()):
+        if position:
+            file.write(encoder.item_separator + newline)
+        file.write(encoder.encode(key) + encoder.key_separator)
+        if compact:
+            file.write(encoder.encode(_plain(value))) # without indentation json's C encoder does it, at the cost of one section's text
+        else:
+            _write_chunks(encoder.iterencode(_plain(value)), file, newline)
+    file.write(('' if compact else '\n') + '}')
+
+def dumps(data, compact=False) -> str:
+    """Data as a JSON string (see dump)."""
+    return _encoder(compact).encode(data)
@@ -0,0 +1,184 @@
+"""
+progress_records.py
+
+Compact record types for the BPER, Attestation, Document and Check entries the progress store holds in memory.
+
+Every entry used to be a free-form dict repeating the same keys ('SCC', 'Gathered', 'Valid to', ...) tens of thousands of times.
+The records keep the known fields in __slots__ attributes. SCC names and other low-variety strings are interned, and anything
+else an entry picks up (e.g. 'Gathered timestamp') goes in a small overflow dict. Records are mutable mappings keyed by the
+progress.json names, so code written against dict entries (entry.get('Gathered'), entry['SCC'] = ..., 'manually_linked' in entry)
+keeps working. Hot passes read the typed attributes (record.gathered, record.false_positive) directly, which is several times
+quicker than get(). A field that isn't set behaves like a missing dict key, so entry.get('Gathered', True) means the same
+thing as before; as an attribute it's MISSING, which is falsy. Datetimes are stored as ISO strings when they're set, as
+progress.json holds them. to_json gives back the dict that goes in progress.json (progress_json.dump converts a section's
+records with it just before writing the section).
+
+Slots are written out by hand instead of using dataclass(slots=True), which needs Python 3.10.
+
+Classes:
+    BPERRecord, AttestationRecord, DocumentRecord, CheckRecord: One entry each
+
+Functions:
+    to_records: Convert the dict entries in progress data to records, in place
+"""
+
+import sys
+from collections.abc import Mapping, MutableMapping
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'MISSING'
+
+    def __bool__(self):
+        return False
+
+MISSING = _Missing() # value of a field the entry doesn't have
+
+INTERNED_FIELDS = frozenset({'SCC', 'Approval Status', 'Valid to', 'Evidence method', 'Version'}) # few distinct values across many entries
+
+class ProgressRecord(MutableMapping):
+    """Base for the record types: slotted fields (FIELDS maps progress.json key -> attribute) plus an overflow dict."""
+    __slots__ = ('_extra',)
+    FIELDS: Dict[str, str] = {}
+
+    def __init__(self, data: Optional[Mapping] = None):
+        """
+        Args:
+            data: Entry to copy in, keyed by the progress.json names
+        """
+        self._extra = None
+        for attr in self.FIELDS.values():
+            setattr(self, attr, MISSING)
+        if data:
+            for key, value in data.items():
+                self[key] = value
+
+    def __getitem__(self, key):
+        attr = self.FIELDS.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            if value is not MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        attr = self.FIELDS.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            return default if value is MISSING else value
+        return self._extra.get(key, default) if self._extra is not None else default
+
+    def __setitem__(self, key, value):
+        if isinstance(value, date): # datetimes too, e.g. a date pulled out of a document, held the way progress.json holds it
+            value = value.isoformat()
+        if key in INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        attr = self.FIELDS.get(key)
+        if attr is not None:
+            setattr(self, attr, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        attr = self.FIELDS.get(key)
+        if attr is not None and getattr(self, attr) is not MISSING:
+            setattr(self, attr, MISSING)
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        attr = self.FIELDS.get(key)
+        if attr is not None:
+            return getattr(self, attr) is not MISSING
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key, attr in self.FIELDS.items():
+            if getattr(self, attr) is not MISSING:
+                yield key
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self) -> int:
+        return sum(1 for attr in self.FIELDS.values() if getattr(self, attr) is not MISSING) + len(self._extra or ())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_json()!r})"
+
+    def to_json(self) -> Dict[str, Any]:
+        """The entry as it's written to progress.json."""
+        data = {}
+        for key, attr in self.FIELDS.items():
+            value = getattr(self, attr)
+            if value is not MISSING:
+                data[key] = value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+class ItemRecord(ProgressRecord):
+    """Fields every BPER, Attestation and Document entry can have."""
+    __slots__ = ('scc', 'name', 'gathered', 'false_positive', 'manually_linked')
+
+class BPERRecord(ItemRecord):
+    __slots__ = ('approval_status', 'valid_to', 'tla', 'roles')
+    FIELDS = {'SCC': 'scc', 'BPER name': 'name', 'Approval Status': 'approval_status', 'Valid to': 'valid_to', 'Gathered': 'gathered',
+              'TLA': 'tla', 'Roles': 'roles', 'false_positive': 'false_positive', 'manually_linked': 'manually_linked'}
+
+class AttestationRecord(ItemRecord):
+    __slots__ = ('approval_status', 'valid_to')
+    FIELDS = {'SCC': 'scc', 'Attestation num': 'name', 'Gathered': 'gathered', 'Approval Status': 'approval_status', 'Valid to': 'valid_to',
+              'false_positive': 'false_positive', 'manually_linked': 'manually_linked'}
+
+class DocumentRecord(ItemRecord):
+    __slots__ = ('version', 'last_update', 'updated_from_filename', 'updated_from_timestamp')
+    FIELDS = {'SCC': 'scc', 'Doc name': 'name', 'Version': 'version', 'Last update': 'last_update', 'Gathered': 'gathered',
+              'Updated from filename': 'updated_from_filename', 'Updated from timestamp': 'updated_from_timestamp',
+              'false_positive': 'false_positive', 'manually_linked': 'manually_linked'}
+
+class CheckRecord(ProgressRecord):
+    __slots__ = ('evidence_method',)
+    FIELDS = {'Evidence method': 'evidence_method'}
+
+RECORD_TYPES = {'BPERs': BPERRecord, 'Attestations': AttestationRecord, 'Documents': DocumentRecord}
+
+def to_records(progress_data, sections: Iterable[str] = ('BPERs', 'Attestations', 'Documents', 'Checks')) -> int:
+    """
+    Replace dict entries with records, in place. Entries that are already records are left alone, so it's cheap to run again
+    after new dict entries have been merged in.
+
+    Args:
+        progress_data (dict): Progress data in the current schema (progress_schema)
+        sections (iterable): Sections to convert
+
+    Returns:
+        int: How many entries were converted
+    """
+    converted = 0
+    for section in sections:
+        if section == 'Checks':
+            for scc_checks in progress_data.get('Checks', {}).values():
+                for stig_id, check in scc_checks.items():
+                    if not isinstance(check, CheckRecord):
+                        scc_checks[stig_id] = CheckRecord(check)
+                        converted += 1
+            continue
+        record_type = RECORD_TYPES.get(section)
+        if record_type is None:
+            continue
+        for entries in progress_data.get(section, {}).values():
+            for position, entry in enumerate(entries):
+                if not isinstance(entry, record_type):
+                    entries[position] = record_type(entry)
+                    converted += 1
+    return converted
@@ -0,0 +1,177 @@
+"""
+progress_schema.py
+
+Versioned layout of progress.json, the migrations that bring older files up to it, and a validator.
+
+The current layout (SCHEMA_VERSION, recorded as 'Schema Version' in Program Settings):
+    Program Settings: dict
+    SCC: SCC file path -> dict with at least 'SCC'
+    BPERs, Attestations, Documents: item -> list of entry dicts, one per SCC, each with 'SCC' (at most one entry per (item, SCC))
+    Checks: SCC -> STIG ID -> {'Evidence method': ...} (see scc_checks)
+
+Older files have single entries stored as a dict instead of a one-entry list, checks keyed by STIG ID, missing sections and
+the odd non-dict value. Files written before the store enforced one entry per (item, SCC) can have the same SCC's entry
+repeated under an item (every pull appended another). ProgressStore runs migrate() once when it loads a file, so everything reading the store can assume
+the layout above instead of checking types on every pass. Anything a migration has to drop is reported, not dropped silently.
+"""
+
+import argparse
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.SCC.scc_checks import is_legacy_checks, migrate_checks, unmigratable_checks
+
+SCHEMA_VERSION = 2
+VERSION_SETTING = 'Schema Version'
+ITEM_SECTIONS = ('BPERs', 'Attestations', 'Documents')
+DICT_SECTIONS = ('Program Settings', 'SCC', 'BPERs', 'Attestations', 'Documents', 'Checks')
+
+def schema_version(progress_data) -> int:
+    """Schema version a progress dict says it's in (0 for files from before versions were recorded)."""
+    settings = progress_data.get('Program Settings')
+    return settings.get(VERSION_SETTING, 0) if isinstance(settings, dict) else 0
+
+def _migrate_to_1(progress_data, notes) -> None:
+    """Sections present and dicts, item entries always lists of dicts, checks keyed by SCC."""
+    for section in DICT_SECTIONS:
+        value = progress_data.get(section)
+        if not isinstance(value, dict):
+            if value is not None:
+                notes.append(f"{section}: replaced a {type(value).__name__} with an empty section")
+            progress_data[section] = {}
+
+    for section in ITEM_SECTIONS:
+        item_dict = progress_data[section]
+        wrapped = 0
+        for item_id in list(item_dict):
+            entries = item_dict[item_id]
+            if isinstance(entries, dict): # single entry stored without a list
+                entries = [entries]
+                wrapped += 1
+            elif not isinstance(entries, list):
+                entries = []
+            kept = [entry for entry in entries if isinstance(entry, Mapping)] # dicts, or progress_records once loaded
+            if len(kept) < len(entries):
+                notes.append(f"{section} '{item_id}': dropped {len(entries) - len(kept)} entries that weren't dicts")
+            if kept:
+                item_dict[item_id] = kept
+            else:
+                notes.append(f"{section} '{item_id}': dropped, no entries left")
+                del item_dict[item_id]
+        if wrapped:
+            notes.append(f"{section}: {wrapped} single entries stored as lists")
+
+    checks = progress_data['Checks']
+    if is_legacy_checks(checks):
+        no_scc = unmigratable_checks(checks)
+        if no_scc:
+            notes.append(f"Checks: dropped {len(no_scc)} checks with no SCC ({', '.join(no_scc[:5])}{', ...' if len(no_scc) > 5 else ''})")
+        progress_data['Checks'] = migrate_checks(checks)
+        notes.append("Checks: re-keyed by SCC")
+
+def _migrate_to_2(progress_data, notes) -> None:
+    """One entry per (item, SCC); the first one wins, as the old clean-up after every pull kept."""
+    for section in ITEM_SECTIONS:
+        dropped = 0
+        for item_id, entries in progress_data[section].items():
+            seen_sccs = set()
+            unique_entries = []
+            for entry in entries:
+                if entry.get('SCC') not in seen_sccs:
+                    seen_sccs.add(entry.get('SCC'))
+                    unique_entries.append(entry)
+            if len(unique_entries) < len(entries):
+                dropped += len(entries) - len(unique_entries)
+                progress_data[section][item_id] = unique_entries
+        if dropped:
+            notes.append(f"{section}: dropped {dropped} duplicate (item, SCC) entries")
+
+MIGRATIONS: List[Tuple[int, Callable[[Dict[str, Any], List[str]], None]]] = [
+    (1, _migrate_to_1),
+    (2, _migrate_to_2),
+]
+
+def migrate(progress_data) -> List[str]:
+    """
+    Bring progress data up to SCHEMA_VERSION in place, running each migration newer than the version the data records.
+
+    Args:
+        progress_data (dict): Loaded progress.json
+
+    Returns:
+        list: Notes on what was changed or dropped (empty if the data was already current)
+    """
+    version = schema_version(progress_data)
+    notes = []
+    for target, migration in MIGRATIONS:
+        if version < target:
+            migration(progress_data, notes)
+            version = target
+            progress_data['Program Settings'][VERSION_SETTING] = version
+            notes.append(f"Migrated to schema version {version}")
+    return notes
+
+def validate(progress_data) -> List[str]:
+    """
+    Check progress data against the current layout.
+
+    Args:
+        progress_data (dict): Progress data (normally already migrated)
+
+    Returns:
+        list: Problems found; empty if it's valid
+    """
+    problems = []
+    if schema_version(progress_data) != SCHEMA_VERSION:
+        problems.append(f"Schema version is {schema_version(progress_data)}, expected {SCHEMA_VERSION}")
+    bad_sections = [section for section in DICT_SECTIONS if not isinstance(progress_data.get(section), dict)]
+    if bad_sections:
+        return problems + [f"{section}: missing or not a dict" for section in bad_sections] # the rest assumes the sections are dicts
+
+    for scc_path, scc_info in progress_data['SCC'].items():
+        if not isinstance(scc_info, dict) or not scc_info.get('SCC'):
+            problems.append(f"SCC '{scc_path}': no SCC name")
+    for section in ITEM_SECTIONS:
+        for item_id, entries in progress_data[section].items():
+            if not isinstance(entries, list) or not entries:
+                problems.append(f"{section} '{item_id}': entries should be a non-empty list")
+                continue
+            seen_sccs = set()
+            for entry in entries:
+                if not isinstance(entry, Mapping):
+                    problems.append(f"{section} '{item_id}': entry isn't a dict")
+                elif not entry.get('SCC'):
+                    problems.append(f"{section} '{item_id}': entry has no SCC")
+                elif entry['SCC'] in seen_sccs:
+                    problems.append(f"{section} '{item_id}': more than one entry for SCC '{entry['SCC']}'")
+                else:
+                    seen_sccs.add(entry['SCC'])
+    checks = progress_data['Checks']
+    if is_legacy_checks(checks):
+        problems.append("Checks: still keyed by STIG ID")
+    else:
+        for scc_name, scc_checks in checks.items():
+            if not isinstance(scc_checks, dict) or not all(isinstance(check, Mapping) for check in scc_checks.values()):
+                problems.append(f"Checks '{scc_name}': should be STIG ID -> check dict")
+    return problems
+
+def main() -> None:
+    """Run from command line."""
+    from src.utils import progress_store # imported here, progress_store imports this module
+
+    parser = argparse.ArgumentParser(description='Validate a project\'s progress data against the current schema, optionally saving it migrated.')
+    parser.add_argument('progress_file', type=str, help='Path to progress.json (a progress.d folder beside it is used instead)')
+    parser.add_argument('--migrate', action='store_true', help='Save the data in the current layout before validating')
+    args = parser.parse_args()
+
+    store = progress_store.get_store(args.progress_file)
+    progress_data = store.data # migrated as it's read, printing what was changed
+    if args.migrate:
+        store.save(force=True)
+    problems = validate(progress_data)
+    for problem in problems:
+        print(problem)
+    print("Valid" if not problems else f"{len(problems)} problems")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+progress_sections.py
+
+Sectioned layout for a project's progress data: one file per top-level section in a progress.d folder next to where
+progress.json would be, instead of one progress.json holding everything.
+
+    progress.d/settings.json       Program Settings
+    progress.d/SCC.json
+    progress.d/BPERs.json
+    progress.d/Attestations.json
+    progress.d/Documents.json
+    progress.d/Checks.json
+
+ProgressStore reads a section file the first time that section is used and writes back only the sections that were edited,
+so a screen that shows the SCC list doesn't parse the Documents section, and ticking a setting doesn't rewrite the
+BPERs. When progress.d exists it's the project's progress data and a progress.json beside it is ignored; the single file
+stays available as an import/export format (see main).
+
+Functions:
+    sections_dir_for: progress.d next to a progress.json
+    progress_file_for: The progress.json path a project is opened by, given that path or a file inside progress.d
+    project_exists: Whether a project has progress data in either layout
+    section_path, section_names: Section <-> file in progress.d
+    read_section, write_section: Load one section file, write one atomically
+"""
+
+import argparse
+import json
+import os
+from typing import Any, List
+
+from src.utils import progress_json
+
+SECTIONS_DIR_NAME = 'progress.d'
+SECTION_FILES = {'Program Settings': 'settings.json'} # other sections are stored as "<section>.json"
+
+def sections_dir_for(progress_file) -> str:
+    """progress.d next to a progress.json."""
+    return os.path.join(os.path.dirname(os.path.abspath(progress_file)), SECTIONS_DIR_NAME)
+
+def progress_file_for(path) -> str:
+    """The progress.json path a project goes by (what ProgressStore is keyed on). A file picked inside progress.d maps to the progress.json beside the folder."""
+    folder = os.path.dirname(os.path.abspath(path))
+    if os.path.basename(folder) == SECTIONS_DIR_NAME:
+        return os.path.join(os.path.dirname(folder), 'progress.json')
+    return path
+
+def project_exists(progress_file) -> bool:
+    """True if there's a progress.json or a progress.d for it."""
+    return os.path.exists(progress_file) or os.path.isdir(sections_dir_for(progress_file))
+
+def section_path(sections_dir, section) -> str:
+    return os.path.join(sections_dir, SECTION_FILES.get(section, f"{section}.json"))
+
+def section_names(sections_dir) -> List[str]:
+    """Sections that have a file in progress.d."""
+    file_sections = {file_name: section for section, file_name in SECTION_FILES.items()}
+    return [file_sections.get(file_name, file_name[:-len('.json')]) for file_name in sorted(os.listdir(sections_dir)) if file_name.endswith('.json')]
+
+def read_section(sections_dir, section) -> Any:
+    """One section's data; an empty section if it has no file yet."""
+    try:
+        with open(section_path(sections_dir, section), 'r') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+def write_section(sections_dir, section, value, compact=False) -> None:
+    """Write one section file via a temp file renamed over it, so a crash mid-write can't leave half a file."""
+    path = section_path(sections_dir, section)
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'w') as file:
+        progress_json.dump(value, file, compact=compact)
+    os.replace(temp_file, path)
+
+def main() -> None:
+    """Run from command line."""
+    from src.utils import progress_store # imported here, progress_store imports this module
+
+    parser = argparse.ArgumentParser(description='Convert a project between progress.json and the sectioned progress.d layout.')
+    parser.add_argument('command', choices=['import', 'export'], help='import: progress.json -> progress.d; export: progress.d -> one JSON file')
+    parser.add_argument('progress_file', type=str, help='Path to the project\'s progress.json')
+    parser.add_argument('--output', type=str, help='File to export to (default: progress.json next to progress.d)')
+    parser.add_argument('--compact', action='store_true', help='Export without indentation')
+    args = parser.parse_args()
+
+    store = progress_store.get_store(args.progress_file)
+    if args.command == 'import':
+        if store.sectioned:
+            print(f"{sections_dir_for(args.progress_file)} already exists")
+            return
+        store.use_sections()
+        store.flush()
+        print(f"Imported {args.progress_file} into {store.sections_dir}")
+    else:
+        output = args.output or args.progress_file
+        store.export(output, compact=args.compact)
+        print(f"Exported {store.sections_dir if store.sectioned else args.progress_file} to {output}")
+
+if __name__ == "__main__":
+    main()
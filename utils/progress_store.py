@@ -0,0 +1,570 @@
+"""
+progress_store.py
+
+One in-memory copy of a project's progress.json, shared by the GUI, KAIZEN, update_info, scc_tables and doc_validation.
+progress.json is loaded once, migrated to the current layout (progress_schema), and handed out through typed section accessors. Edits mark their section dirty, and
+saves are streamed (progress_json) to a temp file that is renamed over progress.json, so a crash mid-write can't leave half a file.
+Several edits in a row (a batch, or GUI clicks inside the save delay) end up as one write.
+Small edits (set_setting, set_entry_field) are appended to a journal (progress_journal) instead of rewriting the file,
+and folded into progress.json when it's next written.
+Per-SCC passes read their entries from a group-by-SCC index (by_scc), regrouped section by section as sections change.
+Entries are added through upsert_entry/set_scc_items, which look the (item, SCC) pair up in by_scc first, so an item never
+gets a second entry for the same SCC.
+The dashboard queries (not_gathered, sccs_with_ungathered, ...) read the records in memory, or progress.db if the project
+has opted in to keeping one (progress_db). That copy gets whole sections re-imported when they're replaced, and only the
+touched items' rows rewritten after journaled edits and upserts.
+Projects can also keep their data sectioned in progress.d (progress_sections), one file per section. Then a section is only
+read when something first uses it, and a save writes only the sections that were edited.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.SCC.scc_checks import ChecksTable
+from src.SCC.scc_index import SCCEntries
+from src.utils import progress_db
+from src.utils import progress_journal
+from src.utils import progress_json
+from src.utils import progress_records
+from src.utils import progress_sections
+from src.utils import progress_schema
+
+SETTINGS = 'Program Settings'
+SCC = 'SCC'
+BPERS = 'BPERs'
+ATTESTATIONS = 'Attestations'
+DOCUMENTS = 'Documents'
+CHECKS = 'Checks'
+SECTIONS = (SETTINGS, SCC, BPERS, ATTESTATIONS, DOCUMENTS, CHECKS)
+ITEM_SECTIONS = (BPERS, ATTESTATIONS, DOCUMENTS)
+DB_SECTIONS = (SCC,) + ITEM_SECTIONS # what the database queries read
+
+SAVE_DELAY_MS = 500 # how long a scheduled save waits for more edits
+COMPACT_SETTING = 'Compact Progress File' # program setting: write progress.json without indentation
+
+_stores: Dict[str, 'ProgressStore'] = {}
+
+class ProgressStore:
+    """progress.json (or progress.d, section by section) loaded once, with dirty-section tracking and atomic, coalesced saves."""
+
+    def __init__(self, progress_file):
+        """
+        Args:
+            progress_file (str): Path to progress.json (it doesn't have to exist yet)
+        """
+        self.progress_file = progress_file
+        self.sections_dir = progress_sections.sections_dir_for(progress_file)
+        self.sectioned = os.path.isdir(self.sections_dir) # progress.d layout; otherwise the single progress.json
+        self.scheduler: Optional[Callable[[int, Callable[[], None]], Any]] = None # e.g. Tk's root.after; None saves straight away
+        self.save_delay_ms = SAVE_DELAY_MS
+        self.dirty = set()
+        self._data: Optional[Dict[str, Any]] = None
+        self._loaded = set() # sections in memory (with progress.json, every section once it's loaded)
+        self._checks: Optional[ChecksTable] = None
+        self._file_state = None # (mtime_ns, size) of progress.json when last loaded or saved; per section file with progress.d
+        self._batch_depth = 0
+        self._save_pending = False
+        self._db: Optional[progress_db.ProgressDB] = None
+        self._db_stale = set(SECTIONS) # sections to re-import into progress.db
+        self._db_stale_items: Dict[str, set] = {} # section -> items whose rows need rewriting in progress.db
+        self._by_scc: Optional[SCCEntries] = None
+        self._by_scc_stale = set() # item sections edited since they were last grouped
+        self.journal = progress_journal.ProgressJournal(progress_journal.journal_path_for(progress_file))
+        self._journal_count = 0 # journaled edits not in progress.json yet
+        self._journal_records = [] # journaled edits to sections that haven't been read yet (progress.d)
+        self._journal_sections = set() # sections with journaled edits
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """The whole progress dict, loaded on first use. With progress.d this reads every section; use the section accessors for just one."""
+        self._ensure_loaded(self._all_sections())
+        return self._data
+
+    def _all_sections(self) -> List[str]:
+        names = list(SECTIONS)
+        if self.sectioned and os.path.isdir(self.sections_dir):
+            names += progress_sections.section_names(self.sections_dir)
+        return list(dict.fromkeys(names + list(self._data or ())))
+
+    def load(self) -> None:
+        """(Re)read the progress data, dropping anything unsaved. With progress.d nothing is read until a section is used. A missing file loads as empty sections."""
+        self.sectioned = os.path.isdir(self.sections_dir)
+        self._checks = None
+        self._by_scc = None
+        self.dirty.clear()
+        self._db_stale.update(SECTIONS)
+        if self.sectioned:
+            self._data = {}
+            self._loaded = set()
+            self._file_state = {}
+            self._journal_records = self.journal.records() # replayed section by section as they're read
+            self._journal_count = len(self._journal_records)
+            self._journal_sections = {progress_journal.record_section(record) for record in self._journal_records}
+            return
+        try:
+            with open(self.progress_file, 'r') as file:
+                self._data = json.load(file)
+        except FileNotFoundError:
+            db_path = progress_db.db_path_for(self.progress_file)
+            self._data = progress_db.ProgressDB(db_path).export_progress() if os.path.exists(db_path) else {} # rebuilt from progress.db if the project keeps one
+        migration_notes = progress_schema.migrate(self._data) # one shape from here on, so readers don't have to check
+        for note in migration_notes:
+            print(f"{self.progress_file}: {note}")
+        progress_records.to_records(self._data) # slotted records instead of one dict per entry
+        self._journal_count = self.journal.replay(self._data) # edits made since the file was last written
+        self._journal_records = []
+        self._journal_sections = set()
+        self._loaded = set(SECTIONS) | set(self._data)
+        self._file_state = self._stat(self.progress_file)
+        if migration_notes:
+            self.mark_dirty() # written in the new layout on the next save
+        self._db_stale.update(self._data)
+
+    def _ensure_loaded(self, sections) -> None:
+        """Read the sections that aren't in memory yet (progress.d), migrated and with their journaled edits replayed, as load does for progress.json."""
+        if self._data is None:
+            self.load()
+        if not self.sectioned:
+            return
+        missing = [name for name in dict.fromkeys(sections) if name not in self._loaded]
+        if not missing:
+            return
+        if SETTINGS not in self._loaded and SETTINGS not in missing:
+            missing.insert(0, SETTINGS) # holds the schema version
+        for name in missing:
+            self._read_section(name)
+        migration_notes = []
+        if SETTINGS in missing and progress_schema.schema_version(self._data) < progress_schema.SCHEMA_VERSION:
+            rest = [name for name in self._all_sections() if name not in self._loaded and name not in missing]
+            for name in rest: # written by an older version: every section is migrated together, once
+                self._read_section(name)
+            missing += rest
+            migration_notes = progress_schema.migrate(self._data)
+            for note in migration_notes:
+                print(f"{self.sections_dir}: {note}")
+        progress_records.to_records(self._data, missing)
+        pending = []
+        for record in self._journal_records:
+            if progress_journal.record_section(record) in missing:
+                progress_journal.apply_record(self._data, record)
+            else:
+                pending.append(record)
+        self._journal_records = pending
+        self._loaded.update(missing)
+        if migration_notes:
+            self.mark_dirty(*missing)
+
+    def _read_section(self, name) -> None:
+        self._data[name] = progress_sections.read_section(self.sections_dir, name)
+        self._file_state[name] = self._stat(progress_sections.section_path(self.sections_dir, name))
+
+    def _changed_on_disk(self) -> bool:
+        if self.sectioned != os.path.isdir(self.sections_dir): # converted to or from progress.d
+            return True
+        if self.sectioned:
+            return any(state != self._stat(progress_sections.section_path(self.sections_dir, name)) for name, state in self._file_state.items())
+        return self._file_state != self._stat(self.progress_file)
+
+    def refresh(self) -> bool:
+        """Reload if progress.json (or a section file that's been read) changed on disk since it was loaded (another process or script wrote it). Unsaved edits win.
+
+        Returns:
+            bool: True if it was reloaded
+        """
+        if self._data is None or not self._changed_on_disk():
+            return False
+        if self.dirty:
+            print(f"Warning: {self.progress_file} changed on disk while there are unsaved edits; keeping the edits")
+            return False
+        self.load()
+        return True
+
+    def section(self, name) -> Any:
+        """A top-level section, read on first use and created empty if the file doesn't have it."""
+        self._ensure_loaded([name])
+        return self._data.setdefault(name, {})
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """'Program Settings'"""
+        return self.section(SETTINGS)
+
+    @property
+    def sccs(self) -> Dict[str, Dict[str, Any]]:
+        """SCC file path -> SCC info"""
+        return self.section(SCC)
+
+    @property
+    def bpers(self) -> Dict[str, List[Dict[str, Any]]]:
+        """BPER name -> one entry per SCC"""
+        return self.section(BPERS)
+
+    @property
+    def attestations(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Attestation number -> one entry per SCC"""
+        return self.section(ATTESTATIONS)
+
+    @property
+    def documents(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Document name -> one entry per SCC"""
+        return self.section(DOCUMENTS)
+
+    @property
+    def checks(self) -> ChecksTable:
+        """Checks as a ChecksTable (migrated from the STIG ID keyed layout if needed)."""
+        checks = self.section(CHECKS)
+        if self._checks is None or self._checks.checks is not checks:
+            self._checks = ChecksTable.for_progress(self._data)
+            if self._checks.checks is not checks:
+                self.dirty.add(CHECKS)
+        return self._checks
+
+    @property
+    def by_scc(self) -> SCCEntries:
+        """BPER, Attestation and Document entries grouped by SCC (live entries), regrouped for any sections edited since the last use."""
+        self._ensure_loaded(ITEM_SECTIONS)
+        if self._by_scc is None or self._by_scc.progress_data is not self._data:
+            self._by_scc = SCCEntries(self._data)
+        else:
+            stale = self._by_scc_stale & set(ITEM_SECTIONS)
+            progress_records.to_records(self._data, stale) # entries merged in as dicts since the last use
+            self._by_scc.regroup(*stale)
+        self._by_scc_stale.clear()
+        return self._by_scc
+
+    @property
+    def has_db(self) -> bool:
+        """True if the project keeps progress.db next to progress.json (see progress_db)."""
+        return self._db is not None or os.path.exists(progress_db.db_path_for(self.progress_file))
+
+    @property
+    def db(self) -> Optional[progress_db.ProgressDB]:
+        """The project's progress.db, brought up to date with any edits since the last query, or None if the project doesn't
+        keep one. Reads the SCC and item sections (what the queries use); other sections are imported once they've been read."""
+        if not self.has_db:
+            return None
+        self._open_db()
+        self._ensure_loaded(DB_SECTIONS)
+        self._sync_db()
+        return self._db
+
+    def _open_db(self) -> None:
+        if self._db is None:
+            self._db = progress_db.ProgressDB(progress_db.db_path_for(self.progress_file))
+
+    def _sync_db(self) -> None:
+        """Import the stale sections that are in memory, and rewrite the rows of items edited since the last sync."""
+        stale = self._db_stale & self._loaded
+        if stale:
+            if CHECKS in stale:
+                self.checks # migrates legacy checks before they're imported
+            self._db.import_progress(self._data, stale)
+            self._db_stale -= stale
+        items = {section: item_ids for section, item_ids in self._db_stale_items.items() if section not in self._db_stale}
+        if items:
+            self._db.update_items(self._data, items)
+        self._db_stale_items = {section: item_ids for section, item_ids in self._db_stale_items.items() if section in self._db_stale}
+
+    def _item_rows_changed(self, section, item_id) -> None:
+        if section not in self._db_stale:
+            self._db_stale_items.setdefault(section, set()).add(item_id)
+
+    ## Queries ##
+    def not_gathered(self, sections=ITEM_SECTIONS) -> List[Tuple[str, str, Any]]:
+        """
+        Entries with Gathered false that aren't false positives (entries without a Gathered field don't count).
+
+        Args:
+            sections (iterable): Item sections to look in
+
+        Returns:
+            list: (section, item ID, entry) in progress.json order within each section (sections by name)
+        """
+        if self.has_db:
+            return self.db.not_gathered(sections)
+        self.by_scc # entries merged in as dicts are records again
+        return [(section, item_id, entry) for section in sorted(sections) for item_id, entries in self._data[section].items() for entry in entries
+                if entry.gathered is not progress_records.MISSING and not entry.gathered and not entry.false_positive]
+
+    def blank_gathered_or_tla(self) -> List[Tuple[str, str, Any]]:
+        """
+        Entries whose Gathered is '' (blank, not False), plus BPERs flagged TLA: what the Not_gathered.txt report lists.
+        False positives are included and nothing is deduplicated, as the report always did.
+
+        Returns:
+            list: (section, item ID, entry) in progress.json order within each section
+        """
+        if self.has_db:
+            return self.db.blank_gathered_or_tla()
+        self.by_scc
+        return [(section, item_id, entry) for section in sorted(ITEM_SECTIONS) for item_id, entries in self._data[section].items() for entry in entries
+                if entry.gathered == '' or (section == BPERS and entry.tla == True)]
+
+    def sccs_with_ungathered(self) -> set:
+        """SCC names with at least one entry that isn't marked gathered (missing Gathered counts as not gathered)."""
+        if self.has_db:
+            return self.db.sccs_with_ungathered()
+        groups = self.by_scc.groups
+        return {scc_name for section in ITEM_SECTIONS for scc_name, items in groups[section].items() if any(not entry.gathered for entry in items.values())}
+
+    def gathered_counts(self, section) -> Tuple[int, int]:
+        """(gathered, total) entries in an item section, false positives left out."""
+        if self.has_db:
+            return self.db.gathered_counts(section)
+        self.by_scc
+        gathered = total = 0
+        for entries in self._data[section].values():
+            for entry in entries:
+                if not entry.false_positive:
+                    total += 1
+                    gathered += bool(entry.gathered)
+        return gathered, total
+
+    def get_setting(self, name, default=None) -> Any:
+        return self.settings.get(name, default)
+
+    def set_setting(self, name, value) -> None:
+        """Set one program setting, recorded in the journal."""
+        self._journaled({'op': 'setting', 'name': name, 'value': value}, SETTINGS)
+
+    def set_entry_field(self, section, item_id, scc_name, field, value) -> int:
+        """
+        Set a field on an item's entries, recorded in the journal rather than by rewriting progress.json.
+
+        Args:
+            section (str): 'BPERs', 'Attestations' or 'Documents'
+            item_id (str): Item key in the section
+            scc_name (str): Only the entry for this SCC; None sets it on every SCC's entry for the item
+            field (str): Entry field, e.g. 'false_positive' or 'manually_linked'
+            value: New value (JSON-serialisable)
+
+        Returns:
+            int: How many entries were changed (nothing is journaled if none matched)
+        """
+        record = {'op': 'entry', 'section': section, 'item': item_id, 'scc': scc_name, 'field': field, 'value': value}
+        self._ensure_loaded([section])
+        if not progress_journal.matching_entries(self._data, section, item_id, scc_name):
+            return 0
+        return self._journaled(record, section)
+
+    def _journaled(self, record, section) -> int:
+        self._ensure_loaded([section])
+        self.journal.append(record) # on disk before it's applied
+        changed = progress_journal.apply_record(self._data, record)
+        self._journal_count += 1
+        self._journal_sections.add(section)
+        if record['op'] == 'entry':
+            self._item_rows_changed(section, record['item'])
+        else:
+            self._db_stale.add(section)
+        if self._journal_count >= progress_journal.JOURNAL_COMPACT_EVERY:
+            self.request_save()
+        return changed
+
+    def upsert_entry(self, section, item_id, entry, fields=None) -> bool:
+        """
+        Add an item's entry for entry['SCC'], or if the item already has one for that SCC, merge into it instead of appending a
+        second. The (item, SCC) lookup goes through by_scc, so it doesn't scan the section.
+
+        Args:
+            section (str): 'BPERs', 'Attestations' or 'Documents'
+            item_id (str): Item key in the section
+            entry (dict): Entry with at least 'SCC', e.g. from scc_read
+            fields (iterable, optional): Fields to copy onto an existing entry; None copies all of entry's
+
+        Returns:
+            bool: True if a new entry was added
+        """
+        by_scc = self.by_scc
+        existing = by_scc.get(section, item_id, entry.get('SCC'))
+        if existing is None:
+            record = progress_records.RECORD_TYPES[section](entry)
+            self.section(section).setdefault(item_id, []).append(record)
+            by_scc.add(section, item_id, record)
+        else:
+            for field in (entry if fields is None else fields):
+                existing[field] = entry[field]
+        self._entries_changed(section, item_id)
+        return existing is None
+
+    def remove_entry(self, section, item_id, scc_name) -> bool:
+        """Remove an item's entry for one SCC, and the item if that was its last. Returns True if there was one."""
+        entry = self.by_scc.get(section, item_id, scc_name)
+        if entry is None:
+            return False
+        item_dict = self.section(section)
+        entries = [other for other in item_dict[item_id] if other is not entry]
+        if entries:
+            item_dict[item_id] = entries
+        else:
+            del item_dict[item_id]
+        self._by_scc.remove(section, item_id, scc_name)
+        self._entries_changed(section, item_id)
+        return True
+
+    def set_scc_items(self, section, scc_name, items, refresh_fields=()) -> Tuple[int, int]:
+        """
+        Make an SCC's entries in a section match a fresh read of the SCC, as a delta: items the SCC already had keep their entry
+        (and gathered/approval state), new items are upserted, and the SCC's entries for items it no longer lists are removed.
+        Costs the SCC's own items, not the section, so pulling the same SCC again changes nothing.
+
+        Args:
+            section (str): 'BPERs', 'Attestations' or 'Documents'
+            scc_name (str): SCC the items came from
+            items (dict): Item -> entry from scc_read for this SCC
+            refresh_fields (tuple): Fields that come from the SCC itself and should be updated on existing entries
+
+        Returns:
+            tuple: (added, removed) entry counts
+        """
+        removed = sum(self.remove_entry(section, item_id, scc_name) for item_id in self.by_scc.items_for(section, scc_name) if item_id not in items)
+        added = sum(self.upsert_entry(section, item_id, entry, refresh_fields) for item_id, entry in items.items())
+        return added, removed
+
+    def remove_scc_entries(self, scc_name) -> int:
+        """Remove every BPER, Attestation and Document entry an SCC has. Returns how many were removed."""
+        return sum(self.remove_entry(section, item_id, scc_name) for section in ITEM_SECTIONS for item_id in self.by_scc.items_for(section, scc_name))
+
+    def _entries_changed(self, section, item_id) -> None:
+        """Like mark_dirty, for edits to one item's entries that kept by_scc up to date themselves."""
+        self.dirty.add(section)
+        self._item_rows_changed(section, item_id)
+
+    def replace(self, data) -> None:
+        """Swap in a whole new progress dict (new project, full rebuild); every section is dirty."""
+        progress_schema.migrate(data) # stamps the schema version (and fixes up anything built in an older shape)
+        progress_records.to_records(data)
+        self._data = data
+        self._loaded = set(SECTIONS) | set(data)
+        if self._file_state is None:
+            self._file_state = {} if self.sectioned else None
+        self._journal_records = [] # edits to the data being replaced
+        self._checks = None
+        self._by_scc = None
+        self.dirty.update(data.keys())
+        self._db_stale.update(SECTIONS, data.keys())
+
+    def mark_dirty(self, *sections) -> None:
+        """Record that sections were edited in place, without asking for a save."""
+        self.dirty.update(sections or SECTIONS)
+        self._db_stale.update(sections or SECTIONS)
+        self._by_scc_stale.update(sections or SECTIONS)
+
+    def changed(self, *sections) -> None:
+        """Record edits to sections (all of them if none are named) and ask for a save."""
+        self.mark_dirty(*sections)
+        self.request_save()
+
+    @contextmanager
+    def batch(self):
+        """Group edits so they're written once, when the outermost batch ends."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self.dirty:
+                self.request_save()
+
+    def request_save(self) -> None:
+        """Save now, or once the save delay has passed if a scheduler is set; requests in between share the one write."""
+        if self._batch_depth or not (self.dirty or self._journal_count >= progress_journal.JOURNAL_COMPACT_EVERY):
+            return
+        if self.scheduler is None:
+            self.save()
+        elif not self._save_pending:
+            self._save_pending = True
+            self.scheduler(self.save_delay_ms, self._scheduled_save)
+
+    def _scheduled_save(self) -> None:
+        self._save_pending = False
+        self.save()
+
+    def save(self, force=False) -> bool:
+        """Write progress.json if anything is dirty or journaled (or force), via a temp file renamed over the original. With progress.d
+        only the dirty and journaled section files are written (every section that's been read, with force). The journal is emptied
+        once the files hold its edits.
+
+        Returns:
+            bool: True if anything was written
+        """
+        if self._data is None or not (self.dirty or self._journal_count or force):
+            return False
+        compact = self.get_setting(COMPACT_SETTING, False)
+        if self.sectioned:
+            self._ensure_loaded(self._journal_sections) # journaled edits have to be in the files before the journal goes
+            for name in [name for name in self._data if force or name in self.dirty or name in self._journal_sections]:
+                progress_sections.write_section(self.sections_dir, name, self._data[name], compact)
+                self._file_state[name] = self._stat(progress_sections.section_path(self.sections_dir, name))
+        else:
+            temp_file = f"{self.progress_file}.tmp"
+            with open(temp_file, 'w') as file:
+                progress_json.dump(self._data, file, compact=compact) # streamed, no converted copy of the data
+            os.replace(temp_file, self.progress_file)
+            self._file_state = self._stat(self.progress_file)
+        self.journal.archive()
+        self._journal_count = 0
+        self._journal_sections.clear()
+        self.dirty.clear()
+        if self.has_db:
+            self._open_db()
+            self._sync_db() # keep progress.db in step with the files
+        return True
+
+    def use_sections(self) -> None:
+        """Move the project to the progress.d layout (importing progress.json): everything is read from the current layout and
+        every section is written to progress.d on the next save. progress.json is left where it is, but isn't read any more."""
+        if self.sectioned:
+            return
+        data = self.data
+        os.makedirs(self.sections_dir, exist_ok=True)
+        self.sectioned = True
+        self._file_state = {}
+        self.mark_dirty(*data)
+
+    def export(self, path, compact=False) -> None:
+        """Write all the progress data to one progress.json-style file (the import/export format for progress.d), via a temp file."""
+        data = self.data
+        temp_file = f"{path}.tmp"
+        with open(temp_file, 'w') as file:
+            progress_json.dump({name: data[name] for name in self._all_sections() if name in data}, file, compact=compact)
+        os.replace(temp_file, path)
+
+    def flush(self) -> None:
+        """Write any pending edits straight away (before exit, or before another tool reads the file)."""
+        self._save_pending = False
+        self.save()
+
+def get_store(progress_file) -> ProgressStore:
+    """
+    The shared store for a progress.json, one per path. It's refreshed from disk if the file (or, for a sectioned project,
+    a section file) was changed behind its back.
+
+    Args:
+        progress_file (str): Path to progress.json; for a sectioned project the progress.d folder beside it is used instead
+
+    Returns:
+        ProgressStore
+    """
+    key = os.path.normcase(os.path.abspath(progress_file))
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = ProgressStore(progress_file)
+    else:
+        store.refresh()
+    return store
+
+def flush_all() -> None:
+    """Write pending edits in every open store."""
+    for store in _stores.values():
+        store.flush()
@@ -6,12 +6,16 @@ and Supporting Documents to the progress.json file.
 """
 
 import os
-import json
 import re
 import fitz
+from functools import partial
+from src.SCC import scc_analyze
 from src.SCC import scc_check
-from src.SCC import scc_read
+from src.SCC import scc_ingest
+from src.SCC import scc_probe
+from src.SCC.scc_cache import SCCParseCache
 from src.utils import file_operations
+from src.utils import progress_store
 from datetime import datetime
 from difflib import SequenceMatcher
 
@@ -26,6 +30,7 @@ def update_bper_info(bper_dict, base_directories):
     Returns:
         None: Updates the bper_dict in place
     """
+    parsed = {} # file path -> extracted info, so a BPER shared by several SCCs is only read once
     for key, value_list in bper_dict.items(): # goes through every item in every bper entry
         for value in value_list:
             if value.get('false_positive', False):
@@ -39,7 +44,9 @@ def update_bper_info(bper_dict, base_directories):
                 file_path = os.path.join(source_directory, f"{key}.pdf")
 
             if os.path.isfile(file_path):
-                valid_to_date, approval_status, tla_present = file_operations.extract_BPER_info(file_path) # TODO: FIX Counterintuitively, the actual pulling of information comes from the file_operations file; just where it started, hasn't been fixed yet. 
+                if file_path not in parsed:
+                    parsed[file_path] = file_operations.extract_BPER_info(file_path)
+                valid_to_date, approval_status, tla_present = parsed[file_path] # TODO: FIX Counterintuitively, the actual pulling of information comes from the file_operations file; just where it started, hasn't been fixed yet. 
                 value['Valid to'] = valid_to_date # write these values to the dictionaries
                 value['Approval Status'] = approval_status
                 value['TLA'] = tla_present
@@ -49,24 +56,6 @@ def update_bper_info(bper_dict, base_directories):
             else:
                 print(f"File not found for BPER: {key}") # if BPER with that name isn't present
 
-def convert_datetime_to_string(obj):
-    """
-    File starts throwing errors unless the datetime objects it gets are converted to strings.    
-   
-     Args:
-        obj: Object potentially containing datetime values (dict, list, datetime, or other)
-        
-    Returns:
-        Object with all datetime values converted to strings
-    """
-    if isinstance(obj, dict):
-        return {key: convert_datetime_to_string(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_datetime_to_string(item) for item in obj]
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
-    return obj
-
 def update_attestation_info(attestation_dict, base_directories):
     """
     Updates attestation information 
@@ -78,6 +67,7 @@ def update_attestation_info(attestation_dict, base_directories):
     Returns:
         dict: Updated attestation dictionary
     """
+    parsed = {} # file path -> extracted info, so an attestation shared by several SCCs is only read once
     for key, value_list in attestation_dict.items():
         for value in value_list:
             if value.get('false_positive', False):
@@ -92,14 +82,16 @@ def update_attestation_info(attestation_dict, base_directories):
 
             if os.path.isfile(file_path):
                 try:
-                    # Extract text content from PDF
-                    with fitz.open(file_path) as doc:
-                        text = ""
-                        for page in doc:
-                            text += page.get_text()
-                    
-                    # Process extracted text for attestation information
-                    approval_status, valid_to_date, review_date, assessment_date, overall_status = file_operations.extract_attest_info(text)
+                    if file_path not in parsed:
+                        # Extract text content from PDF
+                        with fitz.open(file_path) as doc:
+                            text = ""
+                            for page in doc:
+                                text += page.get_text()
+
+                        # Process extracted text for attestation information
+                        parsed[file_path] = file_operations.extract_attest_info(text)
+                    approval_status, valid_to_date, review_date, assessment_date, overall_status = parsed[file_path]
                     
                     if approval_status != "Status: Error":
                         # Update attestation data
@@ -135,6 +127,9 @@ def update_doc_info(doc_dict, base_directories):
     Returns:
         None: Updates the doc_dict in place
     """
+    source_files = None # listed once, not once per entry
+    best_matches = {} # doc name -> (closest file, ratio)
+    parsed = {} # file path -> most recent date, so a document shared by several SCCs is only read once
     for doc_name, value_list in doc_dict.items(): # goes through every item in every document entry
         for value in value_list:
             if value.get('false_positive', False):
@@ -146,11 +141,15 @@ def update_doc_info(doc_dict, base_directories):
             else:
                 # Find best matching document in directory
                 source_directory = base_directories['doc']
-                matching_files = [f for f in os.listdir(source_directory) if (f.endswith('.docx') or f.endswith('.doc') or f.endswith('.xlsx') or f.endswith('.xls') or f.endswith('.pdf'))] # has to handle additional file types
+                if source_files is None:
+                    source_files = [f for f in os.listdir(source_directory) if (f.endswith('.docx') or f.endswith('.doc') or f.endswith('.xlsx') or f.endswith('.xls') or f.endswith('.pdf'))] # has to handle additional file types
+                matching_files = source_files
                 if matching_files:
-                    # Use sequence matcher to find closest filename match
-                    best_match = max(matching_files, key=lambda x: SequenceMatcher(None, doc_name, x).ratio())
-                    match_ratio = SequenceMatcher(None, doc_name, best_match).ratio()
+                    # Use sequence matcher to find closest filename match (once per document, not once per SCC entry)
+                    if doc_name not in best_matches:
+                        best_match = max(matching_files, key=lambda x: SequenceMatcher(None, doc_name, x).ratio())
+                        best_matches[doc_name] = (best_match, SequenceMatcher(None, doc_name, best_match).ratio())
+                    best_match, match_ratio = best_matches[doc_name]
                     if match_ratio >= 0.8:
                         file_path = os.path.join(source_directory, best_match) # matching for document names
                     else:
@@ -161,7 +160,9 @@ def update_doc_info(doc_dict, base_directories):
                     continue
 
             if os.path.isfile(file_path):
-                most_recent_date = file_operations.extract_Doc_info(file_path) # TODO:fix Counterintuitively, the actual pulling of information comes from the file_operations file; just where it started, hasn't been fixed yet.
+                if file_path not in parsed:
+                    parsed[file_path] = file_operations.extract_Doc_info(file_path)
+                most_recent_date = parsed[file_path] # TODO:fix Counterintuitively, the actual pulling of information comes from the file_operations file; just where it started, hasn't been fixed yet.
                 if most_recent_date:
                     for entry in value_list: # write these values to dictionaries
                         entry['Last update'] = most_recent_date
@@ -185,14 +186,18 @@ def extract_version(filename):
     version_match = re.search(r'_(\d{2})(?=\.docx$|\.doc$)', filename)
     return version_match.group(1) if version_match else ''
 
-def update_scc_info(scc_dict, scc_dir, progress_data):
+def update_scc_info(scc_dict, scc_dir, store, workers=None, cache=None, engine='streaming'):
     """
-    Updates SCC information in the master dict.
+    Updates SCC information in the master dict. SCCs whose latest version is the file they were last merged from
+    (same zip fingerprint, see scc_probe) are skipped without being opened; only their date-relative checks are redone.
     
     Args:
         scc_dict (dict): Dictionary containing SCC information
         scc_dir (str): Directory containing SCC files
-        progress_data (dict): Full progress tracking dictionary
+        store (ProgressStore): Progress store for the project; entries are merged in through its (item, SCC) upserts
+        workers (int, optional): Worker processes for parsing the SCCs; None = one per CPU, 1 = serial
+        cache (SCCParseCache, optional): Parse cache; unchanged SCCs are taken from it instead of being reparsed
+        engine (str, optional): Workbook reader, 'streaming' (openpyxl) or 'xml' (direct XML, falls back to openpyxl)
         
     Returns:
         dict: Updated SCC dictionary
@@ -200,53 +205,66 @@ def update_scc_info(scc_dict, scc_dir, progress_data):
     print("Entering update_scc_info function")
     print(f"Number of SCCs to process: {len(scc_dict)}")
 
+    # Work out the most recent version of every SCC first, so the files can all be parsed in one batch
+    # Versions are told apart by the zip metadata Excel writes on save (scc_probe), not filesystem mtime, which changes on every copy
+    scc_files = [f for f in os.listdir(scc_dir) if f.endswith('.xlsx')]
+    probes = {}
+    latest_files = {}
+    unchanged = set()
     for file_path, scc_info in scc_dict.items():
-        print(f"Processing SCC: {scc_info['SCC']}")
         # Extract the SCC name from the file path
         scc_name = os.path.splitext(os.path.basename(file_path))[0]
         scc_name = re.sub(r'_\d+$', '', scc_name)  # Remove the version number from the SCC name
 
         # Search for files with a similar name pattern in the specified directory
-        matching_files = [f for f in os.listdir(scc_dir) if f.startswith(scc_name) and f.endswith('.xlsx')]
+        matching_files = [os.path.join(scc_dir, f) for f in scc_files if f.startswith(scc_name)]
 
         if matching_files:
+            for matching_file in matching_files:
+                if matching_file not in probes:
+                    probes[matching_file] = scc_probe.probe_scc_file(matching_file)
             # Process most recent version of SCC file
-            latest_file = max(matching_files, key=lambda x: os.path.getmtime(os.path.join(scc_dir, x)))
-            latest_file_path = os.path.join(scc_dir, latest_file)
-
-            # Process the SCC file using scc_read
-            bper_dict, doc_dict, attestation_dict, method_dict = scc_read.process_excel_file(latest_file_path)
+            latest_files[file_path] = scc_probe.latest_version(matching_files, probes)
+            stamp = scc_probe.parse_stamp(probes[latest_files[file_path]])
+            if stamp and scc_info.get('Parse stamp') == stamp:
+                unchanged.add(file_path) # already merged from this exact file, nothing to do
 
-            # Update SCC info using scc_check
-            updated_scc_info = scc_check.process_scc_file(latest_file_path)
-            scc_info.update(updated_scc_info)
+    # Extract the dictionaries and run the SCC checks, one workbook load per file, across worker processes if configured
+    analyses = {latest_file_path: (analysis, error) for latest_file_path, analysis, error in scc_ingest.ingest_scc_files(list(dict.fromkeys(latest_file for file_path, latest_file in latest_files.items() if file_path not in unchanged)), workers, partial(scc_analyze.analyze_scc_file, engine=engine), cache)}
 
-            # Update checks information
-            for stig_id, details in method_dict.items():
-                progress_data["Checks"][stig_id] = {
-                    'SCC': scc_info['SCC'],
-                    'Evidence method': details['Evidence Method']
-                }
+    checks = store.checks # (SCC, STIG ID) keyed, with each SCC's evidence methods indexed
+    for file_path, scc_info in scc_dict.items(): # merge in the original order so the output matches a serial run
+        print(f"Processing SCC: {scc_info['SCC']}")
+        scc_name = re.sub(r'_\d+$', '', os.path.splitext(os.path.basename(file_path))[0])
 
-            # Collect evidence methods for this SCC
-            scc_methods = set(details['Evidence Method'].lower() for details in method_dict.values())
-            scc_info['Evidence Methods'] = list(scc_methods)
+        if file_path in unchanged:
+            print(f"SCC {scc_name} unchanged since the last pull ({os.path.basename(latest_files[file_path])}), skipping")
+            scc_check.refresh_review_status(scc_info) # not reparsed, but the review-age check is relative to today
+        elif file_path in latest_files:
+            analysis, error = analyses[latest_files[file_path]]
+            if error:
+                print(f"Error processing {latest_files[file_path]}: {error}")
+                continue
+            bper_dict, doc_dict, attestation_dict, method_dict, updated_scc_info = analysis
+            scc_info.update(updated_scc_info)
 
-            # Update other dictionaries in progress_data
-            for key, value in bper_dict.items():
-                if key not in progress_data['BPERs']:
-                    progress_data['BPERs'][key] = []
-                progress_data['BPERs'][key].append(value)
+            # Merge into progress data as a delta: existing entries keep their gathered state, new ones are added, dropped ones removed
+            # One entry per (item, SCC), so pulling an SCC again doesn't stack up duplicates
+            # Only Roles is refreshed on existing BPERs: their TLA comes from the BPER PDF (update_bper_info) and mustn't be overwritten by the SCC column
+            scc = scc_info['SCC']
+            added_checks, removed_checks = checks.set_scc(scc, method_dict)
 
-            for key, value in doc_dict.items():
-                if key not in progress_data['Documents']:
-                    progress_data['Documents'][key] = []
-                progress_data['Documents'][key].append(value)
+            # Evidence methods for this SCC, from the checks table's method index
+            scc_methods = checks.methods_for(scc)
+            scc_info['Evidence Methods'] = scc_methods
 
-            for key, value in attestation_dict.items():
-                if key not in progress_data['Attestations']:
-                    progress_data['Attestations'][key] = []
-                progress_data['Attestations'][key].append(value)
+            for category, items, refresh_fields in (('BPERs', bper_dict, ('Roles',)), ('Documents', doc_dict, ()), ('Attestations', attestation_dict, ())):
+                added, removed = store.set_scc_items(category, scc, items, refresh_fields)
+                if added or removed:
+                    print(f"{category} for {scc}: {added} added, {removed} removed")
+            if added_checks or removed_checks:
+                print(f"Checks for {scc}: {added_checks} added, {removed_checks} removed")
+            scc_info['Parse stamp'] = scc_probe.parse_stamp(probes[latest_files[file_path]]) # lets the next pull skip this file if it hasn't changed
 
             print(f"Updated SCC {scc_name} with {len(scc_methods)} evidence methods: {scc_info['Evidence Methods']}")
             print(f"Number of checks for this SCC: {len(method_dict)}")
@@ -269,9 +287,9 @@ def update_progress_info(progress_file, base_directories=None, scc_dir=None):
         None: Updates progress.json file directly
     """
     print("Entering update_progress_info function")
-    # Load current progress data
-    with open(progress_file, 'r') as file:
-        progress_data = json.load(file)
+    # Current progress data, from the shared store (loaded once per project)
+    store = progress_store.get_store(progress_file)
+    progress_data = store.data
     
     # Extract component dictionaries
     scc_dict = progress_data.get('SCC', {})
@@ -287,7 +305,13 @@ def update_progress_info(progress_file, base_directories=None, scc_dir=None):
     
     # Update SCC information if directory provided
     if scc_dir:
-        updated_scc_dict = update_scc_info(scc_dict, scc_dir, progress_data)
+        workers = progress_data.get('Program Settings', {}).get('SCC Workers') # None = one worker per CPU
+        engine = progress_data.get('Program Settings', {}).get('SCC Read Engine', 'streaming')
+        project_dir = os.path.dirname(os.path.abspath(progress_file))
+        cache = SCCParseCache.for_project(project_dir) # scc_cache.json next to progress.json
+        updated_scc_dict = update_scc_info(scc_dict, scc_dir, store, workers, cache, engine)
+        cache.evict_missing(scc_ingest.list_scc_files(scc_dir))
+        cache.save()
         progress_data['SCC'] = updated_scc_dict  # Ensure we're saving the updated SCC dictionary
     
     # Update main progress data
@@ -304,8 +328,8 @@ def update_progress_info(progress_file, base_directories=None, scc_dir=None):
     progress_data['Program Settings'] = program_settings
     
     print("Saving updated progress data")
-    # Save updated progress data
-    with open(progress_file, 'w') as file:
-        json.dump(convert_datetime_to_string(progress_data), file, indent=4) # datetime objects > strings
+    # Save updated progress data in place (records keep dates as ISO strings, so what's in memory matches the file without a converted copy)
+    store.changed()
+    store.flush()
     
     print("Progress information updated successfully.")